@@ -6,12 +6,14 @@ and ensures data quality through deduplication and validation.
 """
 
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 from collections import defaultdict
 import logging
 import hashlib
 import json
+import time
 
 from src.ingestion.base import (
     DataIngester,
@@ -27,6 +29,27 @@ from src.ingestion.financial import FinancialDataIngester
 logger = logging.getLogger(__name__)
 
 
+# Bound ingest_latest/ingest_historical of an ingester
+IngestionJob = Callable[..., Awaitable[IngestionResult]]
+
+
+def _ingestion_job(ingester: DataIngester, mode: str) -> IngestionJob:
+    """Bound job method of ``ingester`` for ``mode`` ("latest" or "historical")."""
+    return ingester.ingest_latest if mode == "latest" else ingester.ingest_historical
+
+
+@dataclass(slots=True)
+class ScheduleEntry:
+    """A periodic ingestion job registered with the orchestrator."""
+
+    interval: timedelta
+    mode: str
+    kwargs: Dict[str, Any]
+    next_run: float  # time.monotonic() deadline
+    # Job of the source's current ingester; None while none is registered
+    coro_fn: Optional[IngestionJob]
+
+
 class IngestionOrchestrator:
     """
     Orchestrates all data ingestion processes.
@@ -70,7 +93,7 @@ class IngestionOrchestrator:
         self.max_history_size = 1000
 
         # Scheduling
-        self.schedules: Dict[str, Dict[str, Any]] = {}
+        self.schedules: Dict[str, ScheduleEntry] = {}
         self.is_running = False
         self._scheduler_task: Optional[asyncio.Task] = None
 
@@ -119,6 +142,9 @@ class IngestionOrchestrator:
             ingester: DataIngester instance
         """
         self.ingesters[name] = ingester
+        schedule = self.schedules.get(name)
+        if schedule is not None:
+            schedule.coro_fn = _ingestion_job(ingester, schedule.mode)
         logger.info(f"Added custom ingester: {name}")
 
     def remove_ingester(self, name: str):
@@ -130,6 +156,9 @@ class IngestionOrchestrator:
         """
         if name in self.ingesters:
             del self.ingesters[name]
+            schedule = self.schedules.get(name)
+            if schedule is not None:
+                schedule.coro_fn = None
             logger.info(f"Removed ingester: {name}")
 
     def _generate_event_hash(self, event: Dict[str, Any]) -> str:
@@ -241,7 +270,7 @@ class IngestionOrchestrator:
                 continue
 
             ingester = self.ingesters[source]
-            task = self._run_ingestion(ingester, source, "latest", **kwargs)
+            task = self._run_ingestion(source, ingester.ingest_latest, **kwargs)
             tasks.append((source, task))
 
         # Wait for all tasks
@@ -320,28 +349,24 @@ class IngestionOrchestrator:
 
     async def _run_ingestion(
         self,
-        ingester: DataIngester,
         source: str,
-        mode: str,
+        coro_fn: IngestionJob,
         **kwargs
     ) -> IngestionResult:
         """
         Run ingestion for a single source.
 
         Args:
-            ingester: DataIngester instance
             source: Source name
-            mode: "latest" or "historical"
+            coro_fn: Bound ingest_latest or ingest_historical of the
+                source's ingester
             **kwargs: Additional parameters
 
         Returns:
             Ingestion result
         """
         try:
-            if mode == "latest":
-                result = await ingester.ingest_latest(**kwargs)
-            else:
-                result = await ingester.ingest_historical(**kwargs)
+            result = await coro_fn(**kwargs)
 
             logger.info(
                 f"Ingestion completed for {source}: "
@@ -372,12 +397,14 @@ class IngestionOrchestrator:
             mode: "latest" or "historical"
             **kwargs: Additional parameters for ingester
         """
-        self.schedules[source] = {
-            "interval": interval,
-            "mode": mode,
-            "kwargs": kwargs,
-            "next_run": datetime.utcnow() + interval,
-        }
+        ingester = self.ingesters.get(source)
+        self.schedules[source] = ScheduleEntry(
+            interval=interval,
+            mode=mode,
+            kwargs=kwargs,
+            next_run=time.monotonic() + interval.total_seconds(),
+            coro_fn=None if ingester is None else _ingestion_job(ingester, mode),
+        )
 
         logger.info(f"Scheduled {mode} ingestion for {source} every {interval}")
 
@@ -398,26 +425,23 @@ class IngestionOrchestrator:
 
         while self.is_running:
             try:
-                now = datetime.utcnow()
+                now = time.monotonic()
 
                 # Check each scheduled ingestion
                 for source, schedule in list(self.schedules.items()):
-                    if now >= schedule["next_run"]:
+                    if now >= schedule.next_run:
                         # Run ingestion
                         logger.info(f"Running scheduled ingestion for {source}")
 
-                        if source not in self.ingesters:
+                        if schedule.coro_fn is None:
                             logger.warning(f"Unknown ingester: {source}")
                             continue
 
-                        ingester = self.ingesters[source]
-
                         try:
                             result = await self._run_ingestion(
-                                ingester,
                                 source,
-                                schedule["mode"],
-                                **schedule["kwargs"]
+                                schedule.coro_fn,
+                                **schedule.kwargs
                             )
                             self._add_to_history(result)
 
@@ -425,7 +449,7 @@ class IngestionOrchestrator:
                             logger.error(f"Scheduled ingestion failed for {source}: {e}")
 
                         # Update next run time
-                        schedule["next_run"] = now + schedule["interval"]
+                        schedule.next_run = now + schedule.interval.total_seconds()
 
                 # Sleep for a short interval
                 await asyncio.sleep(10)  # Check every 10 seconds
@@ -447,19 +471,23 @@ class IngestionOrchestrator:
         logger.info("Orchestrator started")
 
     async def stop(self):
-        """Stop the orchestrator and scheduler."""
-        if not self.is_running:
-            return
+        """
+        Stop the orchestrator and scheduler.
 
+        Ingesters are closed even if the scheduler was never started, since
+        they may have been driven directly and hold open HTTP clients.
+        """
         logger.info("Stopping orchestrator...")
-        self.is_running = False
 
-        if self._scheduler_task:
-            self._scheduler_task.cancel()
-            try:
-                await self._scheduler_task
-            except asyncio.CancelledError:
-                pass
+        if self.is_running:
+            self.is_running = False
+
+            if self._scheduler_task:
+                self._scheduler_task.cancel()
+                try:
+                    await self._scheduler_task
+                except asyncio.CancelledError:
+                    pass
 
         # Close all ingesters
         for name, ingester in self.ingesters.items():
@@ -554,13 +582,16 @@ class IngestionOrchestrator:
             List of scheduled job information
         """
         jobs = []
+        now_wall = datetime.utcnow()
+        now_mono = time.monotonic()
 
         for source, schedule in self.schedules.items():
+            next_run = now_wall + timedelta(seconds=schedule.next_run - now_mono)
             jobs.append({
                 "source": source,
-                "mode": schedule["mode"],
-                "interval_seconds": schedule["interval"].total_seconds(),
-                "next_run": schedule["next_run"].isoformat(),
+                "mode": schedule.mode,
+                "interval_seconds": schedule.interval.total_seconds(),
+                "next_run": next_run.isoformat(),
             })
 
         return jobs
@@ -8,14 +8,163 @@ Fetches and processes SEC filings for biotech companies including:
 """
 
 import asyncio
+import io
 import re
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from xml.etree import ElementTree as ET
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import httpx
+import orjson
+from lxml import etree as ET
 
 from src.ingestion.base import DataIngester, IngestionError, RateLimitConfig, RetryConfig
+from src.utils.rate_limiter import RateLimiter
+
+
+# Pre-qualified Atom tags (Clark notation) so lookups skip prefix resolution
+ATOM = "http://www.w3.org/2005/Atom"
+ATOM_ENTRY_TAG = f"{{{ATOM}}}entry"
+_ATOM_TITLE = f"{{{ATOM}}}title"
+_ATOM_CIK = f"{{{ATOM}}}content/{{{ATOM}}}cik"
+
+# 13F information table tag -> position field, for both namespaced and bare tags
+_13F_NS = "http://www.sec.gov/edgar/document/thirteenf/informationtable"
+_INFOTABLE_FIELDS = {
+    tag: field
+    for local_name, field in (
+        ("nameOfIssuer", "issuer_name"),
+        ("sshPrnamt", "shares"),
+        ("value", "value"),
+    )
+    for tag in (local_name, f"{{{_13F_NS}}}{local_name}")
+}
+
+# 10-K/10-Q metrics (simplified - production would use XBRL parsing). Each
+# metric takes the first match of its own pattern, in this order.
+_10K_METRIC_PATTERNS = (
+    ("cash", re.compile(r"Cash[,\s]+[Cc]ash [Ee]quivalents.*?[\$\s]+([\d,]+)")),
+    ("total_assets", re.compile(r"Total [Aa]ssets.*?[\$\s]+([\d,]+)")),
+    ("revenue", re.compile(r"(?:Revenue|Net [Ss]ales).*?[\$\s]+([\d,]+)")),
+    ("rd_expenses", re.compile(r"Research and [Dd]evelopment.*?[\$\s]+([\d,]+)")),
+)
+
+# Gap a match can run across a line break with: the [,\s]+ and [\$\s]+
+# runs are the only parts of the patterns that span newlines
+_10K_GAP_RE = re.compile(r"[\s$,]*")
+
+
+def _iter_elements(content: bytes, tag: Union[str, Sequence[str]]) -> Iterator[Any]:
+    """
+    Stream matching elements from an XML document in constant memory.
+
+    Each element is cleared (along with its already-processed siblings)
+    once the caller has consumed it, so the tree never grows beyond a
+    single record.
+
+    Args:
+        content: Raw XML bytes
+        tag: Clark-notation tag (or tags) to yield; ``{*}`` wildcards allowed
+
+    Yields:
+        Fully parsed elements matching ``tag``
+    """
+    for _, elem in ET.iterparse(
+        io.BytesIO(content), events=("end",), tag=tag, recover=True
+    ):
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _10k_carry_start(text: str) -> int:
+    """
+    Find where a match still open at the end of ``text`` could start.
+
+    Matches are confined to one line except across a run of gap characters,
+    which may be followed by the number or by the rest of the cash label.
+    The partial last line is always carried, plus every preceding line a
+    match could continue from.
+
+    Args:
+        text: Current window of filing text
+
+    Returns:
+        Offset of the first line that has to be kept for the next chunk
+    """
+    start = text.rfind("\n") + 1
+    while start:
+        end = _10K_GAP_RE.match(text, start).end()
+        if end < len(text) and not text[end].isdigit() and text[end] not in "Cc":
+            break
+        start = text.rfind("\n", 0, start - 1) + 1
+    return start
+
+
+def _scan_10k_metrics(text: str, found: Dict[str, float], final: bool) -> int:
+    """
+    Record the first match of each missing 10-K metric found in ``text``.
+
+    Args:
+        text: Current window of filing text
+        found: Metrics found so far; updated in place
+        final: True when ``text`` runs to the end of the document. Otherwise
+            matches touching the end of the window are ignored, since the
+            number may continue in the next chunk.
+
+    Returns:
+        Offset of the tail of ``text`` to carry into the next chunk
+    """
+    for key, pattern in _10K_METRIC_PATTERNS:
+        if key not in found:
+            match = pattern.search(text)
+            if match and (final or match.end() < len(text)):
+                found[key] = float(match.group(1).replace(",", ""))
+    return len(text) if final else _10k_carry_start(text)
+
+
+def _slice_xml_payload(content: bytes) -> bytes:
+    """
+    Cut the ``<XML>`` document out of an EDGAR full-submission text file.
+
+    Form 4 submissions wrap a single ownership document in an SGML envelope.
+    Slicing it out with ``bytes.find`` means the XML parser never has to
+    recover through the SGML header. Plain XML documents are returned
+    unchanged.
+
+    Args:
+        content: Raw filing bytes
+
+    Returns:
+        The embedded XML document, or ``content`` if there is no envelope
+    """
+    start = content.find(b"<XML>")
+    if start < 0:
+        return content
+    end = content.find(b"</XML>", start)
+    if end < 0:
+        return content
+    return content[start + len(b"<XML>"):end].strip()
+
+
+def _form4_value(elem: Any, name: str) -> Optional[str]:
+    """
+    Read a Form 4 field, unwrapping the ``<value>`` child when present.
+
+    Args:
+        elem: Element to search beneath
+        name: Field tag name (e.g. ``transactionShares``)
+
+    Returns:
+        Stripped field text, or None if absent/empty
+    """
+    text = elem.findtext(f".//{name}/value")
+    if text is None:
+        text = elem.findtext(f".//{name}")
+    text = text.strip() if text else None
+    return text or None
 
 
 class SECEdgarIngester(DataIngester):
@@ -28,6 +177,8 @@ class SECEdgarIngester(DataIngester):
     BASE_URL = "https://www.sec.gov"
     COMPANY_SEARCH_URL = f"{BASE_URL}/cgi-bin/browse-edgar"
     FILING_URL = f"{BASE_URL}/cgi-bin/current"
+    ARCHIVES_URL = f"{BASE_URL}/Archives/edgar/data"
+    SUBMISSIONS_URL = "https://data.sec.gov/submissions"
 
     # SIC codes for biotech/pharma companies
     BIOTECH_SIC_CODES = [
@@ -38,6 +189,29 @@ class SECEdgarIngester(DataIngester):
         "8734",  # Testing Laboratories
     ]
 
+    # Companies fetched concurrently in fetch_historical
+    MAX_CONCURRENT_COMPANIES = 8
+
+    # Responses worth retrying; any other error status fails immediately
+    RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Timeouts (connect/read/write/pool), connection-level network errors
+    # and dropped connections
+    RETRYABLE_ERRORS = (
+        httpx.TimeoutException,
+        httpx.NetworkError,
+        httpx.RemoteProtocolError,
+    )
+
+    # Characters per read when streaming 10-K filings
+    STREAM_CHUNK_SIZE = 65536
+
+    # The biotech company universe changes slowly; refresh it daily
+    COMPANIES_CACHE_TTL = 86400.0  # seconds
+
+    # Per-CIK recent filings cache
+    FILING_CACHE_TTL = 3600.0  # seconds
+    FILING_CACHE_MAX_ENTRIES = 1024
+
     def __init__(
         self,
         event_bus: Any = None,
@@ -54,29 +228,71 @@ class SECEdgarIngester(DataIngester):
         super().__init__(
             source_name="sec_edgar",
             event_bus=event_bus,
-            rate_limit=RateLimitConfig(requests_per_second=8.0),  # Stay under 10/s limit
+            # 8/s sustained plus a burst of 2 never exceeds SEC's 10/s limit
+            rate_limit=RateLimitConfig(requests_per_second=8.0, burst_size=2),
             retry_config=RetryConfig(max_retries=3),
             **kwargs
         )
 
         self.user_agent = user_agent
-        self.client: Optional[httpx.AsyncClient] = None
-        self._rate_limiter = asyncio.Semaphore(8)
-        self._last_request_time = datetime.utcnow()
+        self.client: Optional[httpx.AsyncClient] = self._create_client()
+        self._companies_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._filing_cache: Dict[str, Tuple[float, List[Tuple[str, str, str, str]]]] = {}
+        self._request_limiter = RateLimiter()
+        self._request_limiter.configure(
+            self.source_name,
+            requests_per_second=self.rate_limit.requests_per_second,
+            burst_size=self.rate_limit.burst_size,
+        )
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client used for all SEC requests."""
+        # Every request goes to sec.gov, so keep a small pool of long-lived
+        # HTTP/2 connections and multiplex over them. The transport also
+        # retries failed connection attempts once.
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=1,
+            limits=httpx.Limits(
+                max_keepalive_connections=16,
+                max_connections=16,
+                keepalive_expiry=60.0,
+            ),
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            # httpx advertises br itself when brotli is installed
+            headers={"User-Agent": self.user_agent},
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            follow_redirects=True,
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, recreating it if close() has released it."""
         if self.client is None:
-            self.client = httpx.AsyncClient(
-                headers={
-                    "User-Agent": self.user_agent,
-                    "Accept-Encoding": "gzip, deflate",
-                },
-                timeout=30.0,
-                follow_redirects=True,
-            )
+            self.client = self._create_client()
         return self.client
 
+    async def __aenter__(self) -> "SECEdgarIngester":
+        """Async context manager entry; reopens the client after close()."""
+        self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def _acquire_request_slot(self):
+        """
+        Wait until the next request may be sent.
+
+        Uses a token bucket, so idle time lets up to ``burst_size`` requests
+        go out back to back while the sustained rate stays at
+        ``requests_per_second``. The request itself is sent by the caller
+        after the token is taken.
+        """
+        await self._request_limiter.acquire(self.source_name)
+
     async def _rate_limited_request(
         self,
         method: str,
@@ -94,51 +310,92 @@ class SECEdgarIngester(DataIngester):
         Returns:
             HTTP response
         """
-        async with self._rate_limiter:
-            # Ensure minimum delay between requests
-            now = datetime.utcnow()
-            elapsed = (now - self._last_request_time).total_seconds()
-            min_delay = 1.0 / self.rate_limit.requests_per_second
-
-            if elapsed < min_delay:
-                await asyncio.sleep(min_delay - elapsed)
-
-            client = await self._get_client()
-
-            # Retry logic
-            for attempt in range(self.retry_config.max_retries):
-                try:
-                    response = await client.request(method, url, **kwargs)
-                    response.raise_for_status()
-                    self._last_request_time = datetime.utcnow()
-                    return response
-
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 429:  # Too Many Requests
-                        delay = self.retry_config.get_delay(attempt)
-                        self.logger.warning(f"Rate limited, retrying in {delay}s")
-                        await asyncio.sleep(delay)
-                        continue
+        # Retry logic
+        for attempt in range(self.retry_config.max_retries):
+            await self._acquire_request_slot()
+
+            try:
+                response = await self._get_client().request(method, url, **kwargs)
+                response.raise_for_status()
+                return response
+
+            except httpx.HTTPStatusError as e:
+                # Permanent failures (e.g. 404 on a missing filing) raise at once
+                if e.response.status_code not in self.RETRYABLE_STATUSES:
                     raise IngestionError(f"HTTP error: {e}")
+                # No point backing off after the last attempt
+                if attempt == self.retry_config.max_retries - 1:
+                    break
+                delay = self.retry_config.get_delay(attempt)
+                self.logger.warning(
+                    f"HTTP {e.response.status_code}, retrying in {delay}s"
+                )
+                await asyncio.sleep(delay)
+
+            except httpx.RequestError as e:
+                # Only transient network errors are worth backing off for
+                if (
+                    isinstance(e, self.RETRYABLE_ERRORS)
+                    and attempt < self.retry_config.max_retries - 1
+                ):
+                    delay = self.retry_config.get_delay(attempt)
+                    self.logger.warning(f"Request failed, retrying in {delay}s: {e}")
+                    await asyncio.sleep(delay)
+                    continue
+                raise IngestionError(f"Request failed: {e}")
 
-                except httpx.RequestError as e:
-                    if attempt < self.retry_config.max_retries - 1:
-                        delay = self.retry_config.get_delay(attempt)
-                        self.logger.warning(f"Request failed, retrying in {delay}s: {e}")
-                        await asyncio.sleep(delay)
-                        continue
-                    raise IngestionError(f"Request failed: {e}")
+        raise IngestionError("Max retries exceeded")
 
-            raise IngestionError("Max retries exceeded")
+    @asynccontextmanager
+    async def _rate_limited_stream(
+        self,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Open a rate-limited streaming HTTP request.
+
+        Unlike _rate_limited_request the body is not read up front, and the
+        request is not retried once streaming has started.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional request parameters
+
+        Yields:
+            HTTP response with an unread body
+        """
+        await self._acquire_request_slot()
+
+        try:
+            async with self._get_client().stream(method, url, **kwargs) as response:
+                response.raise_for_status()
+                yield response
+        except httpx.HTTPStatusError as e:
+            raise IngestionError(f"HTTP error: {e}")
+        except httpx.RequestError as e:
+            raise IngestionError(f"Request failed: {e}")
 
     async def fetch_biotech_companies(self) -> List[Dict[str, Any]]:
         """
         Fetch list of biotech companies from SEC.
 
+        Results are cached in memory for ``COMPANIES_CACHE_TTL`` seconds,
+        but only when every SIC code was fetched successfully, so a
+        transient error never pins a partial company list.
+
         Returns:
             List of company information
         """
+        if self._companies_cache is not None:
+            cached_at, cached_companies = self._companies_cache
+            if time.monotonic() - cached_at < self.COMPANIES_CACHE_TTL:
+                return cached_companies
+
         companies = []
+        complete = True
 
         for sic_code in self.BIOTECH_SIC_CODES:
             try:
@@ -156,23 +413,24 @@ class SECEdgarIngester(DataIngester):
                     params=params
                 )
 
-                # Parse XML response
-                root = ET.fromstring(response.content)
-                ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-                for entry in root.findall("atom:entry", ns):
+                # Stream-parse XML response
+                for entry in _iter_elements(response.content, ATOM_ENTRY_TAG):
                     company_info = {
-                        "cik": entry.find("atom:content/atom:cik", ns).text if entry.find("atom:content/atom:cik", ns) is not None else None,
-                        "name": entry.find("atom:title", ns).text if entry.find("atom:title", ns) is not None else None,
+                        "cik": entry.findtext(_ATOM_CIK) or None,
+                        "name": entry.findtext(_ATOM_TITLE) or None,
                         "sic": sic_code,
                     }
                     companies.append(company_info)
 
             except Exception as e:
                 self.logger.error(f"Error fetching companies for SIC {sic_code}: {e}")
+                complete = False
                 continue
 
         self.logger.info(f"Found {len(companies)} biotech companies")
+
+        if complete and companies:
+            self._companies_cache = (time.monotonic(), companies)
         return companies
 
     async def fetch_company_filings(
@@ -198,56 +456,108 @@ class SECEdgarIngester(DataIngester):
         """
         filings = []
 
-        # Normalize CIK (10 digits, zero-padded)
-        cik_normalized = cik.zfill(10)
+        # Normalize CIK (10 digits, zero-padded); fetch_historical pre-pads
+        cik_normalized = cik if len(cik) == 10 else cik.zfill(10)
 
-        for filing_type in filing_types:
-            try:
-                params = {
-                    "action": "getcompany",
-                    "CIK": cik_normalized,
-                    "type": filing_type,
-                    "dateb": end_date.strftime("%Y%m%d") if end_date else "",
-                    "count": count,
-                    "output": "atom",
-                }
+        try:
+            recent_filings = await self._get_recent_filings(cik_normalized)
+        except Exception as e:
+            self.logger.error(f"Error fetching submissions for CIK {cik}: {e}")
+            return filings
 
-                response = await self._rate_limited_request(
-                    "GET",
-                    self.COMPANY_SEARCH_URL,
-                    params=params
-                )
+        # One submissions document covers every filing type
+        wanted = set(filing_types)
+        per_type_counts: Dict[str, int] = {}
+        cik_int = int(cik_normalized)
 
-                # Parse XML response
-                root = ET.fromstring(response.content)
-                ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-                for entry in root.findall("atom:entry", ns):
-                    filing_date_str = entry.find("atom:content/atom:filing-date", ns)
-                    if filing_date_str is not None:
-                        filing_date = datetime.strptime(filing_date_str.text, "%Y-%m-%d")
-
-                        # Filter by date range
-                        if start_date and filing_date < start_date:
-                            continue
-                        if end_date and filing_date > end_date:
-                            continue
-
-                    filing_info = {
-                        "cik": cik_normalized,
-                        "filing_type": filing_type,
-                        "filing_date": filing_date_str.text if filing_date_str is not None else None,
-                        "accession_number": entry.find("atom:content/atom:accession-number", ns).text if entry.find("atom:content/atom:accession-number", ns) is not None else None,
-                        "filing_url": entry.find("atom:content/atom:filing-href", ns).text if entry.find("atom:content/atom:filing-href", ns) is not None else None,
-                    }
-                    filings.append(filing_info)
+        for form, filing_date_str, accession, primary_doc in recent_filings:
+            if form not in wanted:
+                continue
 
-            except Exception as e:
-                self.logger.error(f"Error fetching {filing_type} filings for CIK {cik}: {e}")
+            if filing_date_str:
+                filing_date = datetime.strptime(filing_date_str, "%Y-%m-%d")
+
+                # Filter by date range
+                if start_date and filing_date < start_date:
+                    continue
+                if end_date and filing_date > end_date:
+                    continue
+
+            if per_type_counts.get(form, 0) >= count:
                 continue
+            per_type_counts[form] = per_type_counts.get(form, 0) + 1
+
+            # XSL-rendered primary documents live alongside the raw XML
+            if primary_doc.startswith("xsl"):
+                primary_doc = primary_doc.split("/", 1)[-1]
+
+            filing_info = {
+                "cik": cik_normalized,
+                "filing_type": form,
+                "filing_date": filing_date_str or None,
+                "accession_number": accession or None,
+                "filing_url": (
+                    f"{self.ARCHIVES_URL}/{cik_int}/{accession.replace('-', '')}/{primary_doc}"
+                    if accession and primary_doc else None
+                ),
+            }
+            filings.append(filing_info)
 
         return filings
 
+    async def _get_recent_filings(self, cik: str) -> List[Tuple[str, str, str, str]]:
+        """
+        Get a company's recent filings, using the in-memory cache when fresh.
+
+        Overlapping backfills and scheduled runs re-request the same CIKs, so
+        parsed rows are kept for ``FILING_CACHE_TTL`` seconds. The cache holds
+        at most ``FILING_CACHE_MAX_ENTRIES`` CIKs, evicting the oldest first.
+
+        Args:
+            cik: Zero-padded 10-digit CIK
+
+        Returns:
+            (form, filing date, accession number, primary document) rows,
+            newest first
+        """
+        cached = self._filing_cache.get(cik)
+        if cached is not None and time.monotonic() - cached[0] < self.FILING_CACHE_TTL:
+            return cached[1]
+
+        submissions = await self._fetch_submissions_json(cik)
+        recent = submissions.get("filings", {}).get("recent", {})
+        rows = list(zip(
+            recent.get("form", []),
+            recent.get("filingDate", []),
+            recent.get("accessionNumber", []),
+            recent.get("primaryDocument", []),
+        ))
+
+        # Re-insert so dict order tracks age, then evict the oldest entries
+        self._filing_cache.pop(cik, None)
+        self._filing_cache[cik] = (time.monotonic(), rows)
+        while len(self._filing_cache) > self.FILING_CACHE_MAX_ENTRIES:
+            del self._filing_cache[next(iter(self._filing_cache))]
+
+        return rows
+
+    async def _fetch_submissions_json(self, cik: str) -> Dict[str, Any]:
+        """
+        Fetch the SEC submissions document for a company.
+
+        Args:
+            cik: Zero-padded 10-digit CIK
+
+        Returns:
+            Parsed submissions JSON
+        """
+        response = await self._rate_limited_request(
+            "GET",
+            f"{self.SUBMISSIONS_URL}/CIK{cik}.json",
+        )
+        # Submissions documents run to several MB for active filers
+        return orjson.loads(response.content)
+
     async def parse_form4(self, filing_url: str) -> Dict[str, Any]:
         """
         Parse Form 4 (insider transaction) filing.
@@ -260,43 +570,32 @@ class SECEdgarIngester(DataIngester):
         """
         try:
             response = await self._rate_limited_request("GET", filing_url)
-            content = response.text
 
-            # Extract key information using regex
-            # This is a simplified parser - production would use proper XML parsing
             transactions = {
                 "filing_url": filing_url,
                 "transactions": [],
             }
 
-            # Extract reporter information
-            reporter_match = re.search(r"<reportingOwner>(.*?)</reportingOwner>", content, re.DOTALL)
-            if reporter_match:
-                reporter_section = reporter_match.group(1)
-                name_match = re.search(r"<rptOwnerName>(.*?)</rptOwnerName>", reporter_section)
-                transactions["reporter_name"] = name_match.group(1) if name_match else None
-
-            # Extract transaction information
-            tx_matches = re.finditer(r"<nonDerivativeTransaction>(.*?)</nonDerivativeTransaction>", content, re.DOTALL)
-
-            for tx_match in tx_matches:
-                tx_section = tx_match.group(1)
+            for elem in _iter_elements(
+                _slice_xml_payload(response.content),
+                ("reportingOwner", "nonDerivativeTransaction"),
+            ):
+                if elem.tag == "reportingOwner":
+                    # Only the first reporting owner is recorded
+                    if "reporter_name" not in transactions:
+                        transactions["reporter_name"] = _form4_value(elem, "rptOwnerName")
+                    continue
 
-                # Parse transaction details
-                security_title = re.search(r"<securityTitle>(.*?)</securityTitle>", tx_section)
-                tx_date = re.search(r"<transactionDate>(.*?)</transactionDate>", tx_section)
-                tx_code = re.search(r"<transactionCode>(.*?)</transactionCode>", tx_section)
-                shares = re.search(r"<transactionShares>(.*?)</transactionShares>", tx_section)
-                price = re.search(r"<transactionPricePerShare>(.*?)</transactionPricePerShare>", tx_section)
-                acquired_disposed = re.search(r"<transactionAcquiredDisposedCode>(.*?)</transactionAcquiredDisposedCode>", tx_section)
+                shares = _form4_value(elem, "transactionShares")
+                price = _form4_value(elem, "transactionPricePerShare")
 
                 transaction = {
-                    "security_title": security_title.group(1) if security_title else None,
-                    "transaction_date": tx_date.group(1) if tx_date else None,
-                    "transaction_code": tx_code.group(1) if tx_code else None,
-                    "shares": float(shares.group(1)) if shares else None,
-                    "price_per_share": float(price.group(1)) if price else None,
-                    "acquired_disposed": acquired_disposed.group(1) if acquired_disposed else None,
+                    "security_title": _form4_value(elem, "securityTitle"),
+                    "transaction_date": _form4_value(elem, "transactionDate"),
+                    "transaction_code": _form4_value(elem, "transactionCode"),
+                    "shares": float(shares) if shares else None,
+                    "price_per_share": float(price) if price else None,
+                    "acquired_disposed": _form4_value(elem, "transactionAcquiredDisposedCode"),
                 }
 
                 transactions["transactions"].append(transaction)
@@ -319,39 +618,29 @@ class SECEdgarIngester(DataIngester):
         """
         try:
             response = await self._rate_limited_request("GET", filing_url)
-            content = response.text
 
             holdings = {
                 "filing_url": filing_url,
                 "positions": [],
             }
 
-            # Extract holdings information
-            # Simplified parser - production would use proper XML/SGML parsing
-            position_matches = re.finditer(
-                r"<infoTable>(.*?)</infoTable>",
-                content,
-                re.DOTALL
-            )
-
-            for pos_match in position_matches:
-                pos_section = pos_match.group(1)
+            # Stream <infoTable> positions so large 13Fs never build a full DOM
+            for info_table in _iter_elements(response.content, "{*}infoTable"):
+                # One pass over the subtree instead of a find() per field
+                fields: Dict[str, Optional[str]] = {}
+                for child in info_table.iter():
+                    field = _INFOTABLE_FIELDS.get(child.tag)
+                    if field is not None and field not in fields:
+                        fields[field] = child.text
 
-                name_match = re.search(r"<nameOfIssuer>(.*?)</nameOfIssuer>", pos_section)
-                shares_match = re.search(r"<shrsOrPrnAmt>(.*?)</shrsOrPrnAmt>", pos_section, re.DOTALL)
-                value_match = re.search(r"<value>(.*?)</value>", pos_section)
-
-                shares = None
-                if shares_match:
-                    shares_section = shares_match.group(1)
-                    shares_number = re.search(r"<sshPrnamt>(.*?)</sshPrnamt>", shares_section)
-                    if shares_number:
-                        shares = float(shares_number.group(1))
+                issuer_name = fields.get("issuer_name")
+                shares = fields.get("shares")
+                value = fields.get("value")
 
                 position = {
-                    "issuer_name": name_match.group(1).strip() if name_match else None,
-                    "shares": shares,
-                    "value": float(value_match.group(1)) if value_match else None,
+                    "issuer_name": issuer_name.strip() if issuer_name else None,
+                    "shares": float(shares) if shares else None,
+                    "value": float(value) if value else None,
                 }
 
                 holdings["positions"].append(position)
@@ -373,49 +662,29 @@ class SECEdgarIngester(DataIngester):
             Extracted financial metrics
         """
         try:
-            response = await self._rate_limited_request("GET", filing_url)
-            content = response.text
-
             metrics = {
                 "filing_url": filing_url,
                 "metrics": {},
             }
 
-            # Extract key financial metrics
-            # This is simplified - production would use XBRL parsing
-
-            # Cash and cash equivalents
-            cash_match = re.search(
-                r"Cash[,\s]+[Cc]ash [Ee]quivalents.*?[\$\s]+([\d,]+)",
-                content
-            )
-            if cash_match:
-                metrics["metrics"]["cash"] = float(cash_match.group(1).replace(",", ""))
-
-            # Total assets
-            assets_match = re.search(
-                r"Total [Aa]ssets.*?[\$\s]+([\d,]+)",
-                content
-            )
-            if assets_match:
-                metrics["metrics"]["total_assets"] = float(assets_match.group(1).replace(",", ""))
-
-            # Revenue
-            revenue_match = re.search(
-                r"(?:Revenue|Net [Ss]ales).*?[\$\s]+([\d,]+)",
-                content
-            )
-            if revenue_match:
-                metrics["metrics"]["revenue"] = float(revenue_match.group(1).replace(",", ""))
-
-            # R&D expenses
-            rd_match = re.search(
-                r"Research and [Dd]evelopment.*?[\$\s]+([\d,]+)",
-                content
-            )
-            if rd_match:
-                metrics["metrics"]["rd_expenses"] = float(rd_match.group(1).replace(",", ""))
-
+            # Scan the text chunk by chunk, carrying the partial last line
+            # (and any line a match could continue from) into the next one
+            found: Dict[str, float] = {}
+            window = ""
+
+            async with self._rate_limited_stream("GET", filing_url) as response:
+                async for chunk in response.aiter_text(self.STREAM_CHUNK_SIZE):
+                    window += chunk
+                    carry = _scan_10k_metrics(window, found, final=False)
+                    if len(found) == len(_10K_METRIC_PATTERNS):
+                        break
+                    window = window[carry:]
+                else:
+                    _scan_10k_metrics(window, found, final=True)
+
+            metrics["metrics"] = {
+                key: found[key] for key, _ in _10K_METRIC_PATTERNS if key in found
+            }
             return metrics
 
         except Exception as e:
@@ -461,13 +730,11 @@ class SECEdgarIngester(DataIngester):
 
         self.logger.info(f"Fetching filings for {len(companies)} companies")
 
-        # Fetch filings for each company
-        for company in companies[:50]:  # Limit for demo purposes
-            try:
-                cik = company.get("cik")
-                if not cik:
-                    continue
+        # Bound in-flight companies; request spacing is enforced by the limiter
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_COMPANIES)
 
+        async def _fetch_one(cik: str, company: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
                 filings = await self.fetch_company_filings(
                     cik=cik,
                     filing_types=filing_types,
@@ -475,16 +742,32 @@ class SECEdgarIngester(DataIngester):
                     end_date=end_date,
                 )
 
-                for filing in filings:
-                    filing["company_name"] = company.get("name")
-                    all_filings.append(filing)
+            for filing in filings:
+                filing["company_name"] = company.get("name")
+            return filings
 
-                # Small delay between companies
-                await asyncio.sleep(0.1)
+        # Normalize each CIK once up front; companies listed under several
+        # SIC codes are only fetched once
+        selected: Dict[str, Dict[str, Any]] = {}
+        for company in companies:
+            cik = company.get("cik")
+            if not cik:
+                continue
+            selected.setdefault(str(cik).zfill(10), company)
+            if len(selected) >= 50:  # Limit for demo purposes
+                break
 
-            except Exception as e:
-                self.logger.error(f"Error processing company {company}: {e}")
+        results = await asyncio.gather(
+            *[_fetch_one(cik, company) for cik, company in selected.items()],
+            return_exceptions=True,
+        )
+
+        # Collect filings in company order
+        for company, result in zip(selected.values(), results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"Error processing company {company}: {result}")
                 continue
+            all_filings.extend(result)
 
         self.logger.info(f"Fetched {len(all_filings)} total filings")
         return all_filings
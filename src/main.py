@@ -12,7 +12,7 @@ This module orchestrates all components:
 import asyncio
 import logging
 import signal
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from typing import Optional
 
 from src.config import Settings
@@ -31,6 +31,9 @@ from src.scheduler import Scheduler
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on graceful shutdown before giving up on stop()
+SHUTDOWN_TIMEOUT_SECONDS = 10.0
+
 
 class BiotechMAPredictor:
     """Main application orchestrator."""
@@ -43,6 +46,7 @@ class BiotechMAPredictor:
         self.report_generator: Optional[ReportGenerator] = None
         self.scheduler: Optional[Scheduler] = None
         self._shutdown_event = asyncio.Event()
+        self._exit_stack = AsyncExitStack()
 
     async def initialize(self):
         """Initialize all components."""
@@ -82,6 +86,11 @@ class BiotechMAPredictor:
             event_bus=self.event_bus,
         )
 
+        # Hold context-managed ingesters so shutdown always closes them
+        for ingester in self.ingestion_orchestrator.ingesters.values():
+            if hasattr(ingester, "__aenter__"):
+                await self._exit_stack.enter_async_context(ingester)
+
         # Set up event handlers
         await self._setup_event_handlers()
 
@@ -137,6 +146,11 @@ class BiotechMAPredictor:
         if self.scheduler:
             self.scheduler.stop()
 
+        # Stop ingestion and close ingester HTTP clients
+        if self.ingestion_orchestrator:
+            await self.ingestion_orchestrator.stop()
+        await self._exit_stack.aclose()
+
         # Stop event bus
         if self.event_bus:
             await self.event_bus.stop()
@@ -148,10 +162,22 @@ class BiotechMAPredictor:
         await self.initialize()
         await self.start()
 
-        # Wait for shutdown signal
-        await self._shutdown_event.wait()
-
-        await self.stop()
+        try:
+            # Wait for shutdown signal
+            await self._shutdown_event.wait()
+        finally:
+            # Shield stop() so a second cancellation (e.g. repeated SIGINT)
+            # cannot abandon it half-way and leak open connections
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(self.stop()),
+                    timeout=SHUTDOWN_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Forced shutdown: services did not stop within "
+                    f"{SHUTDOWN_TIMEOUT_SECONDS}s"
+                )
 
     def request_shutdown(self):
         """Signal the system to shut down."""
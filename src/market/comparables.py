@@ -5,12 +5,25 @@ This module tracks historical M&A deals and provides valuation benchmarks
 based on comparable transactions.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Dict, Optional
+from datetime import date, datetime, time
+from functools import lru_cache
+from itertools import compress
+from typing import Any, Callable, Iterable, List, Dict, NamedTuple, Optional, Tuple
 from enum import Enum
+from pathlib import Path
+import calendar
+import json
 import statistics
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; small deal sets use NumPy masks
+    njit = None
+
 
 class TherapeuticArea(Enum):
     """Major therapeutic areas in biotech."""
@@ -42,9 +55,141 @@ class DealStructure(Enum):
     WITH_CVR = "with_cvr"  # Contingent Value Rights
 
 
-@dataclass
+# Intern a small integer ``_code`` on every enum member. The int8 columns of
+# the deal snapshot hold these codes, and filters compare against the plain
+# int, which NumPy handles far faster than an enum operand.
+for _enum in (TherapeuticArea, DevelopmentStage, DealStructure):
+    for _code, _member in enumerate(_enum):
+        _member._code = _code
+del _enum, _code, _member
+
+# Code -> string value lookups for decoding aggregated columns
+_AREA_NAMES = tuple(area.value for area in TherapeuticArea)
+_STRUCTURE_NAMES = tuple(structure.value for structure in DealStructure)
+
+
+# Benchmark transactions shipped with the package
+BENCHMARK_DEALS_PATH = Path(__file__).parent.parent.parent / "data" / "benchmark_deals.json"
+
+# Deal count above which find_comparables uses the compiled filter kernel
+# (below it, JIT dispatch costs more than the NumPy masks it replaces)
+_KERNEL_MIN_DEALS = 100
+
+# Deal count above which aggregations use NumPy columns; below it, a plain
+# loop over the Deal objects is faster than building the masks
+_VECTOR_MIN_DEALS = 100
+
+# Same for calculate_implied_valuation, whose three broadening masks and
+# medians only pay off on much larger deal sets
+_VALUATION_VECTOR_MIN_DEALS = 500
+
+# Maximum memoized query results per ComparableDeals instance
+_MEMO_MAX_ENTRIES = 128
+
+
+@lru_cache(maxsize=1)
+def _load_benchmark_records() -> Tuple[Dict[str, Any], ...]:
+    """
+    Read the benchmark deal records once per process.
+
+    Each ComparableDeals instance builds its own Deal objects from these
+    records, so the parsed file is shared but the deal lists are not.
+    """
+    with open(BENCHMARK_DEALS_PATH) as f:
+        return tuple(json.load(f)["deals"])
+
+
+def _median(values: np.ndarray) -> float:
+    """
+    Exact median of a non-empty array via O(n) partial selection.
+
+    Matches statistics.median: even-sized inputs average the two middle values.
+    """
+    n = values.size
+    k = n // 2
+    if n & 1:
+        return float(np.partition(values, k)[k])
+    part = np.partition(values, (k - 1, k))
+    return float((part[k - 1] + part[k]) * 0.5)
+
+
+@lru_cache(maxsize=32)
+def _lookback_cutoff(today: date, lookback_years: int) -> float:
+    """
+    Timestamp of midnight ``lookback_years`` before ``today``.
+
+    Cached per (day, lookback) so repeated queries skip the date math. The
+    window is whole days: it opens at the start of the boundary day rather
+    than at the current time of day, so results stay fixed (and memoizable)
+    until the date changes. February 29 falls back to February 28 in
+    non-leap target years.
+    """
+    try:
+        cutoff = today.replace(year=today.year - lookback_years)
+    except ValueError:
+        cutoff = today.replace(year=today.year - lookback_years, day=28)
+    return datetime.combine(cutoff, time.min).timestamp()
+
+
+@lru_cache(maxsize=32)
+def _lookback_months_cutoff(today: date, lookback_months: int) -> float:
+    """
+    Timestamp of midnight ``lookback_months`` calendar months before ``today``.
+
+    Whole days, like _lookback_cutoff. Rolls back across year boundaries; days past the end of the target
+    month clamp to its last day (e.g. May 31 minus 3 months is Feb 28).
+    """
+    year, month_index = divmod(today.year * 12 + today.month - 1 - lookback_months, 12)
+    month = month_index + 1
+    day = min(today.day, calendar.monthrange(year, month)[1])
+    return datetime.combine(date(year, month, day), time.min).timestamp()
+
+
+def _filter_kernel(
+    dates: np.ndarray,
+    values: np.ndarray,
+    areas: np.ndarray,
+    stages: np.ndarray,
+    cutoff_ts: float,
+    area_code: int,
+    stage_code: int,
+    min_value: float,
+    max_value: float,
+) -> np.ndarray:
+    """
+    Indices of deals passing every filter, in one scan over the columns.
+
+    A negative area or stage code disables that filter. Compiled with
+    numba when it is installed; see _KERNEL_MIN_DEALS.
+    """
+    n = dates.shape[0]
+    matches = np.empty(n, dtype=np.int64)
+    count = 0
+    for i in range(n):
+        if (
+            dates[i] >= cutoff_ts
+            and (area_code < 0 or areas[i] == area_code)
+            and (stage_code < 0 or stages[i] == stage_code)
+            and values[i] >= min_value
+            and values[i] <= max_value
+        ):
+            matches[count] = i
+            count += 1
+    return matches[:count]
+
+
+if njit is not None:
+    _filter_kernel = njit(cache=True, nogil=True)(_filter_kernel)
+
+
+@dataclass(slots=True, frozen=True)
 class Deal:
-    """Represents a completed M&A transaction."""
+    """
+    Represents a completed M&A transaction.
+
+    Deals are frozen so the columnar snapshot and memoized results built
+    from them cannot go stale; use dataclasses.replace for a modified copy.
+    """
     acquirer: str
     target: str
     announcement_date: datetime
@@ -72,7 +217,7 @@ class Deal:
         return (self.upfront_value_bn / self.total_value_bn) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class ValuationRange:
     """Valuation range based on comparable analysis."""
     low: float  # In billions
@@ -86,7 +231,7 @@ class ValuationRange:
         return f"${self.low:.1f}B - ${self.median:.1f}B - ${self.high:.1f}B ({self.confidence_level} confidence)"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PremiumStats:
     """Premium statistics by sector."""
     sector: str
@@ -101,6 +246,24 @@ class PremiumStats:
         return f"{self.sector}: {self.median_premium:.1f}% median premium (n={self.sample_size})"
 
 
+class _DealArrays(NamedTuple):
+    """
+    Read-only columnar snapshot of the deal database.
+
+    Row ``i`` of every array describes ``deals[i]``. Snapshots are never
+    mutated after being built, so they can be shared between threads.
+    """
+    deals: Tuple[Deal, ...]
+    date: np.ndarray  # int64 announcement timestamps
+    value: np.ndarray  # float64 total value in billions
+    upfront_ratio: np.ndarray  # float64 percentage
+    premium: np.ndarray  # float64 percentage, NaN if missing (None or 0)
+    ev_peak: np.ndarray  # float64 EV/peak-sales multiple, NaN if missing (None or 0)
+    area: np.ndarray  # int8 TherapeuticArea codes
+    stage: np.ndarray  # int8 DevelopmentStage codes
+    structure: np.ndarray  # int8 DealStructure codes
+
+
 class ComparableDeals:
     """
     Track and analyze comparable M&A transactions.
@@ -109,168 +272,129 @@ class ComparableDeals:
     and provides valuation benchmarks based on comparable analysis.
     """
 
-    def __init__(self):
-        """Initialize with recent biotech M&A benchmark data (2023-2025)."""
-        self.deals: List[Deal] = self._initialize_benchmark_deals()
+    def __init__(self, deals: Optional[Iterable[Deal]] = None):
+        """
+        Initialize the deal database.
+
+        Args:
+            deals: Deals to analyze (default: recent biotech M&A benchmark
+                data, 2023-2025)
+        """
+        # Only add_deal replaces this tuple, so the snapshot and memoized
+        # results below are invalidated on every change to the database
+        self._deals: Tuple[Deal, ...] = tuple(
+            self._initialize_benchmark_deals() if deals is None else deals
+        )
+        # Columnar (structure-of-arrays) snapshot of self._deals, built lazily
+        self._snapshot: Optional[_DealArrays] = None
+        # Memoized analysis results, keyed by (method, *query), least
+        # recently used first
+        self._memo: "OrderedDict[Tuple, Any]" = OrderedDict()
+
+    @property
+    def deals(self) -> Tuple[Deal, ...]:
+        """Deals in the database, in insertion order (read-only; see add_deal)."""
+        return self._deals
+
+    def _snap(self) -> _DealArrays:
+        """
+        Get the columnar snapshot of the deal database, rebuilding it if stale.
+
+        Filters run as vectorized boolean masks over these parallel arrays
+        instead of repeated Python passes over the Deal objects.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            deals = self._deals
+            n = len(deals)
+            value = np.fromiter((d.total_value_bn for d in deals), dtype=np.float64, count=n)
+            upfront = np.fromiter((d.upfront_value_bn for d in deals), dtype=np.float64, count=n)
+            # Same as Deal.upfront_ratio: zero-value deals count as 0%
+            upfront_ratio = np.divide(
+                upfront, value, out=np.zeros(n), where=value != 0
+            ) * 100
+            snapshot = _DealArrays(
+                deals=deals,
+                date=np.fromiter(
+                    (d.announcement_date.timestamp() for d in deals), dtype=np.int64, count=n
+                ),
+                value=value,
+                upfront_ratio=upfront_ratio,
+                premium=np.fromiter(
+                    (d.premium_to_undisturbed or np.nan for d in deals),
+                    dtype=np.float64,
+                    count=n,
+                ),
+                ev_peak=np.fromiter(
+                    (d.ev_to_peak_sales or np.nan for d in deals),
+                    dtype=np.float64,
+                    count=n,
+                ),
+                area=np.fromiter(
+                    (d.therapeutic_area._code for d in deals), dtype=np.int8, count=n
+                ),
+                stage=np.fromiter(
+                    (d.development_stage._code for d in deals), dtype=np.int8, count=n
+                ),
+                structure=np.fromiter(
+                    (d.deal_structure._code for d in deals), dtype=np.int8, count=n
+                ),
+            )
+            for column in snapshot[1:]:
+                column.flags.writeable = False
+            self._snapshot = snapshot
+        return snapshot
 
     def _initialize_benchmark_deals(self) -> List[Deal]:
         """Initialize database with recent major biotech M&A transactions."""
         return [
             Deal(
-                acquirer="Pfizer",
-                target="Seagen",
-                announcement_date=datetime(2023, 3, 13),
-                total_value_bn=43.0,
-                upfront_value_bn=43.0,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.ONCOLOGY,
-                development_stage=DevelopmentStage.MARKETED,
-                deal_structure=DealStructure.ALL_CASH,
-                key_assets=["Adcetris", "Padcev", "Tukysa", "Tivdak"],
-                premium_to_undisturbed=32.8,
-                ev_to_peak_sales=2.1,
-                strategic_rationale="ADC platform and marketed oncology portfolio"
-            ),
-            Deal(
-                acquirer="Pfizer",
-                target="Metsera",
-                announcement_date=datetime(2025, 1, 15),
-                total_value_bn=10.0,
-                upfront_value_bn=1.0,
-                milestone_value_bn=9.0,
-                therapeutic_area=TherapeuticArea.METABOLIC,
-                development_stage=DevelopmentStage.PHASE_3,
-                deal_structure=DealStructure.WITH_CVR,
-                key_assets=["MET-097 (obesity)"],
-                premium_to_undisturbed=85.0,
-                ev_to_peak_sales=0.8,
-                strategic_rationale="Entry into obesity market"
-            ),
-            Deal(
-                acquirer="Merck",
-                target="Prometheus Biosciences",
-                announcement_date=datetime(2023, 4, 16),
-                total_value_bn=10.8,
-                upfront_value_bn=10.8,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.IMMUNOLOGY,
-                development_stage=DevelopmentStage.PHASE_2,
-                deal_structure=DealStructure.ALL_CASH,
-                key_assets=["PRA023 (IBD)"],
-                premium_to_undisturbed=75.0,
-                ev_to_peak_sales=1.2,
-                strategic_rationale="Immunology pipeline expansion"
-            ),
-            Deal(
-                acquirer="Bristol Myers Squibb",
-                target="Karuna Therapeutics",
-                announcement_date=datetime(2023, 12, 22),
-                total_value_bn=14.0,
-                upfront_value_bn=14.0,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.CNS,
-                development_stage=DevelopmentStage.PHASE_3,
-                deal_structure=DealStructure.ALL_CASH,
-                key_assets=["KarXT (schizophrenia)"],
-                premium_to_undisturbed=53.0,
-                ev_to_peak_sales=2.8,
-                strategic_rationale="CNS portfolio expansion"
-            ),
-            Deal(
-                acquirer="AbbVie",
-                target="ImmunoGen",
-                announcement_date=datetime(2023, 11, 30),
-                total_value_bn=10.1,
-                upfront_value_bn=10.1,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.ONCOLOGY,
-                development_stage=DevelopmentStage.APPROVED,
-                key_assets=["Elahere (ovarian cancer)", "ADC platform"],
-                deal_structure=DealStructure.ALL_CASH,
-                premium_to_undisturbed=94.5,
-                ev_to_peak_sales=3.2,
-                strategic_rationale="ADC technology and oncology expansion"
-            ),
-            Deal(
-                acquirer="Roche",
-                target="Telavant",
-                announcement_date=datetime(2023, 10, 23),
-                total_value_bn=7.1,
-                upfront_value_bn=7.1,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.IMMUNOLOGY,
-                development_stage=DevelopmentStage.PHASE_2,
-                deal_structure=DealStructure.ALL_CASH,
-                key_assets=["TL1A inhibitor (IBD)"],
-                premium_to_undisturbed=None,  # Private company
-                ev_to_peak_sales=1.5,
-                strategic_rationale="IBD pipeline strengthening"
-            ),
-            Deal(
-                acquirer="Johnson & Johnson",
-                target="Ambrx",
-                announcement_date=datetime(2024, 1, 8),
-                total_value_bn=2.0,
-                upfront_value_bn=2.0,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.ONCOLOGY,
-                development_stage=DevelopmentStage.PHASE_2,
-                deal_structure=DealStructure.ALL_CASH,
-                key_assets=["ARX517 (prostate cancer)", "ADC platform"],
-                premium_to_undisturbed=102.0,
-                ev_to_peak_sales=0.9,
-                strategic_rationale="ADC platform expansion"
-            ),
-            Deal(
-                acquirer="Novartis",
-                target="Chinook Therapeutics",
-                announcement_date=datetime(2023, 4, 3),
-                total_value_bn=3.5,
-                upfront_value_bn=3.5,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.RARE_DISEASE,
-                development_stage=DevelopmentStage.PHASE_3,
-                deal_structure=DealStructure.ALL_CASH,
-                key_assets=["Atrasentan (kidney disease)"],
-                premium_to_undisturbed=68.0,
-                ev_to_peak_sales=2.3,
-                strategic_rationale="Rare disease portfolio expansion"
-            ),
-            Deal(
-                acquirer="Eli Lilly",
-                target="Dice Therapeutics",
-                announcement_date=datetime(2023, 2, 1),
-                total_value_bn=2.4,
-                upfront_value_bn=2.4,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.IMMUNOLOGY,
-                development_stage=DevelopmentStage.PHASE_2,
-                deal_structure=DealStructure.ALL_CASH,
-                key_assets=["S1P receptor modulator"],
-                premium_to_undisturbed=56.0,
-                ev_to_peak_sales=1.1,
-                strategic_rationale="Immunology pipeline strengthening"
-            ),
-            Deal(
-                acquirer="Sanofi",
-                target="Provention Bio",
-                announcement_date=datetime(2023, 4, 27),
-                total_value_bn=2.9,
-                upfront_value_bn=2.9,
-                milestone_value_bn=0.0,
-                therapeutic_area=TherapeuticArea.METABOLIC,
-                development_stage=DevelopmentStage.APPROVED,
-                deal_structure=DealStructure.ALL_CASH,
-                key_assets=["Tzield (Type 1 diabetes)"],
-                premium_to_undisturbed=102.8,
-                ev_to_peak_sales=3.5,
-                strategic_rationale="Immunology and diabetes expansion"
-            ),
+                acquirer=record["acquirer"],
+                target=record["target"],
+                announcement_date=datetime.fromisoformat(record["announcement_date"]),
+                total_value_bn=record["total_value_bn"],
+                upfront_value_bn=record["upfront_value_bn"],
+                milestone_value_bn=record["milestone_value_bn"],
+                therapeutic_area=TherapeuticArea(record["therapeutic_area"]),
+                development_stage=DevelopmentStage(record["development_stage"]),
+                deal_structure=DealStructure(record["deal_structure"]),
+                key_assets=list(record["key_assets"]),
+                premium_to_undisturbed=record.get("premium_to_undisturbed"),
+                ev_to_peak_sales=record.get("ev_to_peak_sales"),
+                strategic_rationale=record.get("strategic_rationale"),
+            )
+            for record in _load_benchmark_records()
         ]
 
     def add_deal(self, deal: Deal) -> None:
         """Add a new deal to the database."""
-        self.deals.append(deal)
+        self._deals += (deal,)
+        self._snapshot = None
+        self._memo.clear()
+
+    def _memoized(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for ``key``, computing it on a miss.
+
+        Results are pure functions of the query and the deals, which are
+        frozen and only change through add_deal, so the cache is cleared
+        there. The least recently used entry is evicted beyond
+        ``_MEMO_MAX_ENTRIES``.
+        """
+        memo = self._memo
+        try:
+            result = memo[key]
+        except KeyError:
+            pass
+        else:
+            memo.move_to_end(key)
+            return result
+
+        if len(memo) >= _MEMO_MAX_ENTRIES:
+            memo.popitem(last=False)
+
+        result = memo[key] = compute()
+        return result
 
     def find_comparables(
         self,
@@ -288,28 +412,87 @@ class ComparableDeals:
             development_stage: Filter by development stage
             min_value_bn: Minimum deal value in billions
             max_value_bn: Maximum deal value in billions
-            lookback_years: Only include deals from last N years
+            lookback_years: Only include deals announced on or after the
+                same date N years ago (from midnight)
 
         Returns:
             List of comparable deals
         """
-        cutoff_date = datetime.now().replace(year=datetime.now().year - lookback_years)
+        today = date.today()
+        key = (
+            "find_comparables", today, therapeutic_area, development_stage,
+            min_value_bn, max_value_bn, lookback_years,
+        )
+        comparables = self._memoized(key, lambda: self._filter_deals(
+            _lookback_cutoff(today, lookback_years),
+            therapeutic_area=therapeutic_area,
+            development_stage=development_stage,
+            min_value_bn=min_value_bn,
+            max_value_bn=max_value_bn,
+        ))
+        return list(comparables)
+
+    def _filter_deals(
+        self,
+        cutoff_ts: float,
+        therapeutic_area: Optional[TherapeuticArea] = None,
+        development_stage: Optional[DevelopmentStage] = None,
+        min_value_bn: Optional[float] = None,
+        max_value_bn: Optional[float] = None,
+    ) -> List[Deal]:
+        """Filter deals announced at or after ``cutoff_ts``, newest first."""
+        snap = self._snap()
+
+        if njit is not None and len(snap.deals) > _KERNEL_MIN_DEALS:
+            indices = _filter_kernel(
+                snap.date,
+                snap.value,
+                snap.area,
+                snap.stage,
+                cutoff_ts,
+                -1 if therapeutic_area is None else therapeutic_area._code,
+                -1 if development_stage is None else development_stage._code,
+                -np.inf if min_value_bn is None else min_value_bn,
+                np.inf if max_value_bn is None else max_value_bn,
+            )
+        else:
+            indices = self._filter_mask_indices(
+                snap, cutoff_ts, therapeutic_area, development_stage,
+                min_value_bn, max_value_bn
+            )
+
+        # Newest first; negating keeps equal dates in insertion order
+        # like a stable reverse sort
+        order = np.argsort(-snap.date[indices], kind="stable")
 
-        comparables = [d for d in self.deals if d.announcement_date >= cutoff_date]
+        return list(map(snap.deals.__getitem__, indices[order].tolist()))
 
-        if therapeutic_area:
-            comparables = [d for d in comparables if d.therapeutic_area == therapeutic_area]
+    @staticmethod
+    def _filter_mask_indices(
+        snap: _DealArrays,
+        cutoff_ts: float,
+        therapeutic_area: Optional[TherapeuticArea],
+        development_stage: Optional[DevelopmentStage],
+        min_value_bn: Optional[float],
+        max_value_bn: Optional[float],
+    ) -> np.ndarray:
+        """Indices of matching deals via fused NumPy boolean masks."""
+        # Fuse all filters into a single boolean mask over the columns
+        mask = snap.date >= cutoff_ts
 
-        if development_stage:
-            comparables = [d for d in comparables if d.development_stage == development_stage]
+        if therapeutic_area is not None:
+            mask &= snap.area == therapeutic_area._code
+
+        if development_stage is not None:
+            mask &= snap.stage == development_stage._code
 
         if min_value_bn is not None:
-            comparables = [d for d in comparables if d.total_value_bn >= min_value_bn]
+            mask &= snap.value >= min_value_bn
 
         if max_value_bn is not None:
-            comparables = [d for d in comparables if d.total_value_bn <= max_value_bn]
+            mask &= snap.value <= max_value_bn
 
-        return sorted(comparables, key=lambda x: x.announcement_date, reverse=True)
+        return np.flatnonzero(mask)
 
     def calculate_implied_valuation(
         self,
@@ -328,20 +511,214 @@ class ComparableDeals:
         Returns:
             ValuationRange with low, median, high estimates
         """
-        # Find comparable deals
-        comparables = self.find_comparables(
-            therapeutic_area=therapeutic_area,
-            development_stage=development_stage
+        if len(self._deals) <= _VALUATION_VECTOR_MIN_DEALS:
+            return self._implied_valuation_small(
+                therapeutic_area, development_stage, peak_sales_estimate
+            )
+
+        snap = self._snap()
+        selected = self._select_comparables(
+            snap, therapeutic_area._code, development_stage._code
         )
+        comparable_count = int(np.count_nonzero(selected))
 
-        # If no exact matches, broaden search
-        if len(comparables) < 3:
-            comparables = self.find_comparables(therapeutic_area=therapeutic_area)
+        if comparable_count == 0:
+            return self._implied_range(0, None, None, 0, peak_sales_estimate)
+
+        # Calculate valuation based on deal values
+        values = snap.value[selected]
+        value_stats = (float(values.min()), _median(values), float(values.max()))
+
+        # If peak sales estimate provided, use EV/Peak Sales multiples
+        multiple_stats = None
+        multiple_count = 0
+        if peak_sales_estimate and peak_sales_estimate > 0:
+            multiples = snap.ev_peak[selected]
+            multiples = multiples[~np.isnan(multiples)]
+            multiple_count = int(multiples.size)
+
+            if multiple_count:
+                multiple_stats = (
+                    float(multiples.min()), _median(multiples), float(multiples.max())
+                )
+
+        return self._implied_range(
+            comparable_count, value_stats, multiple_stats, multiple_count, peak_sales_estimate
+        )
 
+    def _implied_valuation_small(
+        self,
+        therapeutic_area: TherapeuticArea,
+        development_stage: DevelopmentStage,
+        peak_sales_estimate: Optional[float]
+    ) -> ValuationRange:
+        """calculate_implied_valuation over the Deal objects, for small deal sets."""
+        cutoff_date = datetime.fromtimestamp(_lookback_cutoff(date.today(), 3))
+        recent = [d for d in self._deals if d.announcement_date >= cutoff_date]
+
+        # Same broadening as _select_comparables
+        comparables = [
+            d for d in recent
+            if d.therapeutic_area is therapeutic_area
+            and d.development_stage is development_stage
+        ]
         if len(comparables) < 3:
-            comparables = self.find_comparables(development_stage=development_stage)
+            comparables = [d for d in recent if d.therapeutic_area is therapeutic_area]
+        if len(comparables) < 3:
+            comparables = [d for d in recent if d.development_stage is development_stage]
+
+        if not comparables:
+            return self._implied_range(0, None, None, 0, peak_sales_estimate)
+
+        values = [d.total_value_bn for d in comparables]
+        value_stats = (
+            float(min(values)), float(statistics.median(values)), float(max(values))
+        )
 
-        if len(comparables) == 0:
+        multiple_stats = None
+        multiple_count = 0
+        if peak_sales_estimate and peak_sales_estimate > 0:
+            multiples = [d.ev_to_peak_sales for d in comparables if d.ev_to_peak_sales]
+            multiple_count = len(multiples)
+
+            if multiple_count:
+                multiple_stats = (
+                    float(min(multiples)),
+                    float(statistics.median(multiples)),
+                    float(max(multiples)),
+                )
+
+        return self._implied_range(
+            len(comparables), value_stats, multiple_stats, multiple_count,
+            peak_sales_estimate
+        )
+
+    def calculate_implied_valuations_batch(
+        self,
+        queries: List[Tuple[TherapeuticArea, DevelopmentStage, Optional[float]]]
+    ) -> List[ValuationRange]:
+        """
+        Calculate implied valuation ranges for many targets at once.
+
+        Gives the same results as calling calculate_implied_valuation per
+        query, but matches every query against the deal database in one
+        (queries x deals) mask and reduces all rows together.
+
+        Args:
+            queries: (therapeutic_area, development_stage, peak_sales_estimate)
+                tuples; peak_sales_estimate may be None
+
+        Returns:
+            List of ValuationRange, one per query in input order
+        """
+        if not queries:
+            return []
+
+        snap = self._snap()
+        q = len(queries)
+        area_codes = np.fromiter((query[0]._code for query in queries), dtype=np.int8, count=q)
+        stage_codes = np.fromiter((query[1]._code for query in queries), dtype=np.int8, count=q)
+
+        selected = self._select_comparables(snap, area_codes[:, None], stage_codes[:, None])
+        counts = np.count_nonzero(selected, axis=1)
+        rows = counts > 0
+
+        if not rows.any():
+            return [self._implied_range(0, None, None, 0, query[2]) for query in queries]
+
+        # Per-row reductions over NaN-padded matrices; rows without any
+        # comparables are skipped so the nan-reductions never see all-NaN rows
+        values = np.where(selected[rows], snap.value, np.nan)
+        value_low = np.full(q, np.nan)
+        value_median = np.full(q, np.nan)
+        value_high = np.full(q, np.nan)
+        value_low[rows] = np.nanmin(values, axis=1)
+        value_median[rows] = np.nanmedian(values, axis=1)
+        value_high[rows] = np.nanmax(values, axis=1)
+
+        multiples = np.where(selected, snap.ev_peak, np.nan)
+        multiple_counts = np.count_nonzero(~np.isnan(multiples), axis=1)
+        multiple_rows = multiple_counts > 0
+        multiples = multiples[multiple_rows]
+        multiple_low = np.full(q, np.nan)
+        multiple_median = np.full(q, np.nan)
+        multiple_high = np.full(q, np.nan)
+        multiple_low[multiple_rows] = np.nanmin(multiples, axis=1)
+        multiple_median[multiple_rows] = np.nanmedian(multiples, axis=1)
+        multiple_high[multiple_rows] = np.nanmax(multiples, axis=1)
+
+        results = []
+        for i, (_, _, peak_sales_estimate) in enumerate(queries):
+            value_stats = None
+            if rows[i]:
+                value_stats = (
+                    float(value_low[i]), float(value_median[i]), float(value_high[i])
+                )
+
+            multiple_stats = None
+            multiple_count = 0
+            if peak_sales_estimate and peak_sales_estimate > 0:
+                multiple_count = int(multiple_counts[i])
+                if multiple_count:
+                    multiple_stats = (
+                        float(multiple_low[i]),
+                        float(multiple_median[i]),
+                        float(multiple_high[i]),
+                    )
+
+            results.append(self._implied_range(
+                int(counts[i]), value_stats, multiple_stats, multiple_count,
+                peak_sales_estimate
+            ))
+
+        return results
+
+    @staticmethod
+    def _select_comparables(
+        snap: _DealArrays,
+        area_code: Any,
+        stage_code: Any
+    ) -> np.ndarray:
+        """
+        Mask of recent comparable deals, broadening the match when it is thin.
+
+        Prefers deals matching both area and stage, then area only, then
+        stage only, moving on while fewer than three deals match. Scalar
+        codes give one mask over the deals; (Q, 1) code columns broadcast
+        to a (Q, N) mask with one row per query.
+        """
+        # Evaluate each filter once, then pick the tightest combination
+        # with enough hits instead of re-scanning per broadened search
+        recent = snap.date >= _lookback_cutoff(date.today(), 3)
+        area_match = recent & (snap.area == area_code)
+        stage_match = recent & (snap.stage == stage_code)
+
+        # Find comparable deals
+        selected = area_match & stage_match
+
+        # If no exact matches, broaden search
+        thin = np.count_nonzero(selected, axis=-1, keepdims=True) < 3
+        selected = np.where(thin, area_match, selected)
+
+        thin = np.count_nonzero(selected, axis=-1, keepdims=True) < 3
+        return np.where(thin, stage_match, selected)
+
+    @staticmethod
+    def _implied_range(
+        comparable_count: int,
+        value_stats: Optional[Tuple[float, float, float]],
+        multiple_stats: Optional[Tuple[float, float, float]],
+        multiple_count: int,
+        peak_sales_estimate: Optional[float]
+    ) -> ValuationRange:
+        """
+        Assemble a ValuationRange from (low, median, high) statistics.
+
+        Deal-value statistics are used unless EV/peak-sales multiple
+        statistics are available, in which case they are scaled by the
+        peak sales estimate.
+        """
+        if comparable_count == 0:
             return ValuationRange(
                 low=0.5,
                 median=2.0,
@@ -351,35 +728,21 @@ class ComparableDeals:
                 confidence_level="low"
             )
 
-        # Calculate valuation based on deal values
-        values = [d.total_value_bn for d in comparables]
-
-        low = min(values)
-        high = max(values)
-        median = statistics.median(values)
-
-        # If peak sales estimate provided, use EV/Peak Sales multiples
-        if peak_sales_estimate and peak_sales_estimate > 0:
-            multiples = [d.ev_to_peak_sales for d in comparables if d.ev_to_peak_sales]
+        if multiple_stats is not None:
+            low_multiple, median_multiple, high_multiple = multiple_stats
 
-            if multiples:
-                low_multiple = min(multiples)
-                high_multiple = max(multiples)
-                median_multiple = statistics.median(multiples)
-
-                low = peak_sales_estimate * low_multiple
-                median = peak_sales_estimate * median_multiple
-                high = peak_sales_estimate * high_multiple
-                methodology = f"ev_peak_sales_multiple (n={len(multiples)})"
-            else:
-                methodology = f"comparable_deal_values (n={len(comparables)})"
+            low = peak_sales_estimate * low_multiple
+            median = peak_sales_estimate * median_multiple
+            high = peak_sales_estimate * high_multiple
+            methodology = f"ev_peak_sales_multiple (n={multiple_count})"
         else:
-            methodology = f"comparable_deal_values (n={len(comparables)})"
+            low, median, high = value_stats
+            methodology = f"comparable_deal_values (n={comparable_count})"
 
         # Determine confidence level
-        if len(comparables) >= 5 and peak_sales_estimate:
+        if comparable_count >= 5 and peak_sales_estimate:
             confidence = "high"
-        elif len(comparables) >= 3:
+        elif comparable_count >= 3:
             confidence = "medium"
         else:
             confidence = "low"
@@ -389,7 +752,7 @@ class ComparableDeals:
             median=median,
             high=high,
             methodology=methodology,
-            comparable_count=len(comparables),
+            comparable_count=comparable_count,
             confidence_level=confidence
         )
 
@@ -406,17 +769,28 @@ class ComparableDeals:
         Returns:
             PremiumStats with median, range, and percentiles
         """
-        if therapeutic_area:
-            relevant_deals = [
-                d for d in self.deals
-                if d.therapeutic_area == therapeutic_area and d.premium_to_undisturbed
-            ]
+        return self._memoized(
+            ("premium_analysis", therapeutic_area),
+            lambda: self._premium_analysis(therapeutic_area),
+        )
+
+    def _premium_analysis(
+        self,
+        therapeutic_area: Optional[TherapeuticArea] = None
+    ) -> PremiumStats:
+        """Compute premium statistics (uncached)."""
+        snap = self._snap()
+        mask = ~np.isnan(snap.premium)
+
+        if therapeutic_area is not None:
+            mask &= snap.area == therapeutic_area._code
             sector = therapeutic_area.value
         else:
-            relevant_deals = [d for d in self.deals if d.premium_to_undisturbed]
             sector = "all_biotech"
 
-        if not relevant_deals:
+        premiums = snap.premium[mask]
+
+        if premiums.size == 0:
             return PremiumStats(
                 sector=sector,
                 median_premium=50.0,
@@ -427,16 +801,22 @@ class ComparableDeals:
                 percentile_75=70.0
             )
 
-        premiums = [d.premium_to_undisturbed for d in relevant_deals]
+        # One selection pass for all quartiles. "weibull" uses the same
+        # (n + 1) positions as statistics.quantiles, but clamps positions
+        # outside the data where statistics.quantiles extrapolates; that only
+        # happens below three premiums. A single premium is every quartile.
+        p25, p50, p75 = np.percentile(premiums, [25, 50, 75], method="weibull")
+        if premiums.size == 2:
+            p25, _, p75 = statistics.quantiles(premiums.tolist(), n=4)
 
         return PremiumStats(
             sector=sector,
-            median_premium=statistics.median(premiums),
-            min_premium=min(premiums),
-            max_premium=max(premiums),
-            sample_size=len(premiums),
-            percentile_25=statistics.quantiles(premiums, n=4)[0],
-            percentile_75=statistics.quantiles(premiums, n=4)[2]
+            median_premium=float(p50),
+            min_premium=float(premiums.min()),
+            max_premium=float(premiums.max()),
+            sample_size=int(premiums.size),
+            percentile_25=float(p25),
+            percentile_75=float(p75)
         )
 
     def get_deal_structure_trends(self) -> Dict[str, float]:
@@ -446,18 +826,23 @@ class ComparableDeals:
         Returns:
             Dictionary with percentages for each deal structure type
         """
-        total = len(self.deals)
+        return dict(self._memoized(
+            ("deal_structure_trends",), self._deal_structure_trends
+        ))
+
+    def _deal_structure_trends(self) -> Dict[str, float]:
+        """Compute deal structure percentages (uncached)."""
+        snap = self._snap()
+        total = len(snap.deals)
         if total == 0:
             return {}
 
-        structure_counts = {}
-        for deal in self.deals:
-            structure = deal.deal_structure.value
-            structure_counts[structure] = structure_counts.get(structure, 0) + 1
+        counts = np.bincount(snap.structure, minlength=len(_STRUCTURE_NAMES))
+        percentages = counts * (100.0 / total)
 
         return {
-            structure: (count / total) * 100
-            for structure, count in structure_counts.items()
+            _STRUCTURE_NAMES[code]: float(percentages[code])
+            for code in np.flatnonzero(counts)
         }
 
     def get_average_upfront_ratio(
@@ -473,43 +858,62 @@ class ComparableDeals:
         Returns:
             Average upfront ratio as percentage
         """
-        if development_stage:
-            relevant_deals = [
-                d for d in self.deals if d.development_stage == development_stage
-            ]
-        else:
-            relevant_deals = self.deals
+        snap = self._snap()
+        ratios = snap.upfront_ratio
+
+        if development_stage is not None:
+            ratios = ratios[snap.stage == development_stage._code]
 
-        if not relevant_deals:
+        if ratios.size == 0:
             return 80.0  # Default assumption
 
-        ratios = [d.upfront_ratio for d in relevant_deals]
-        return statistics.mean(ratios)
+        return float(ratios.mean())
 
     def get_hot_therapeutic_areas(self, lookback_months: int = 12) -> List[tuple]:
         """
         Identify therapeutic areas with most M&A activity.
 
         Args:
-            lookback_months: Period to analyze
+            lookback_months: Period to analyze, in calendar months back
+                to midnight of the same day
 
         Returns:
             List of (therapeutic_area, deal_count, total_value_bn) tuples
         """
-        cutoff_date = datetime.now().replace(month=max(1, datetime.now().month - lookback_months))
-        recent_deals = [d for d in self.deals if d.announcement_date >= cutoff_date]
-
-        area_stats = {}
-        for deal in recent_deals:
-            area = deal.therapeutic_area.value
-            if area not in area_stats:
-                area_stats[area] = {"count": 0, "total_value": 0.0}
-            area_stats[area]["count"] += 1
-            area_stats[area]["total_value"] += deal.total_value_bn
-
-        result = [
-            (area, stats["count"], stats["total_value"])
-            for area, stats in area_stats.items()
-        ]
+        cutoff_ts = _lookback_months_cutoff(date.today(), lookback_months)
+
+        if len(self._deals) <= _VECTOR_MIN_DEALS:
+            cutoff_date = datetime.fromtimestamp(cutoff_ts)
+            area_stats: Dict[int, List] = {}
+            for deal in self._deals:
+                if deal.announcement_date >= cutoff_date:
+                    code = deal.therapeutic_area._code
+                    stats = area_stats.get(code)
+                    if stats is None:
+                        area_stats[code] = [1, deal.total_value_bn]
+                    else:
+                        stats[0] += 1
+                        stats[1] += deal.total_value_bn
+
+            # Largest total value first; ties in code order, as below
+            return [
+                (_AREA_NAMES[code], count, float(total))
+                for code, (count, total) in sorted(
+                    area_stats.items(), key=lambda item: (-item[1][1], item[0])
+                )
+            ]
 
-        return sorted(result, key=lambda x: x[2], reverse=True)  # Sort by total value
+        snap = self._snap()
+
+        # Group by area code in one pass: deal counts and summed values
+        recent = snap.date >= cutoff_ts
+        codes = snap.area[recent]
+        counts = np.bincount(codes, minlength=len(_AREA_NAMES))
+        totals = np.bincount(codes, weights=snap.value[recent], minlength=len(_AREA_NAMES))
+
+        # Sort by total value, largest first, skipping areas without deals
+        order = np.argsort(-totals, kind="stable").tolist()
+        return [
+            (_AREA_NAMES[code], int(counts[code]), float(totals[code]))
+            for code in compress(order, counts[order].tolist())
+        ]
@@ -5,11 +5,16 @@ This module monitors real-time market signals that may indicate
 potential M&A activity.
 """
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple, Union
 from enum import Enum
-import random
+from itertools import count, islice
+import bisect
+import math
+
+import numpy as np
 
 
 class SignalStrength(Enum):
@@ -30,7 +35,94 @@ class OptionsActivity(Enum):
     UNUSUAL_ACTIVITY = "unusual_activity"
 
 
-@dataclass
+# Signal timestamps are indexed as integer microseconds since the (naive)
+# epoch, so cutoff searches compare plain ints instead of datetimes
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _timestamp_key(timestamp: datetime) -> int:
+    """Integer sort key for a naive signal timestamp."""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+# Enum members are singletons: hot paths test them with ``is`` against
+# these module-level aliases instead of Enum.__eq__ and attribute lookups
+_HEAVY_CALL = OptionsActivity.HEAVY_CALL_BUYING
+_UNUSUAL = OptionsActivity.UNUSUAL_ACTIVITY
+_PROTECTIVE = OptionsActivity.PROTECTIVE_PUTS
+
+# Options activity flagged as unusual by scan_for_anomalies
+_UNUSUAL_OPTIONS = frozenset((_HEAVY_CALL, _UNUSUAL))
+
+# Base options signal strength per activity (anything else is neutral);
+# heavy call buying is upgraded to strong bullish on a high call/put ratio
+_OPTIONS_SIGNAL_STRENGTH = {
+    _HEAVY_CALL: SignalStrength.BULLISH,
+    _UNUSUAL: SignalStrength.BULLISH,
+    _PROTECTIVE: SignalStrength.BEARISH,
+}
+
+
+# Mock signal generator: per-field (low, high) bounds for the M&A-likely
+# and normal profiles
+_MOCK_FLOAT_FIELDS = (
+    "trading_volume_anomaly",
+    "relative_volume",
+    "short_interest_change",
+    "short_interest_ratio",
+    "call_put_ratio",
+    "unusual_options_volume",
+    "price_target_change",
+    "institutional_accumulation",
+    "insider_buying_intensity",
+    "institutional_ownership_pct",
+    "price_momentum_20d",
+    "price_momentum_60d",
+    "distance_from_52w_high",
+    "distance_from_52w_low",
+)
+_MOCK_MA_LOWS = np.array([2.5, 2.0, -25, 2, 2.0, 3.0, 20, 5.0, 7.0, 60, 15, 25, -10, 40])
+_MOCK_MA_HIGHS = np.array([4.0, 3.5, -10, 5, 3.5, 5.0, 40, 10.0, 10.0, 85, 35, 50, 0, 80])
+_MOCK_NORMAL_LOWS = np.array([0.8, 0.9, -5, 3, 0.8, 0.9, -5, -2.0, 2.0, 40, -10, -15, -30, 20])
+_MOCK_NORMAL_HIGHS = np.array([1.3, 1.2, 5, 7, 1.2, 1.1, 10, 2.0, 5.0, 70, 15, 20, -5, 60])
+
+# Inclusive integer bounds
+_MOCK_INT_FIELDS = ("analyst_upgrades", "analyst_downgrades")
+_MOCK_MA_INT_LOWS = np.array([3, 0])
+_MOCK_MA_INT_HIGHS = np.array([6, 1])
+_MOCK_NORMAL_INT_LOWS = np.array([0, 0])
+_MOCK_NORMAL_INT_HIGHS = np.array([2, 2])
+
+# Composite score band floors and their (likelihood_label, confidence)
+_LIKELIHOOD_THRESHOLDS = (40, 50, 60, 70, 80)
+_LIKELIHOOD_LABELS = (
+    ("Low", 0.20),
+    ("Low-Moderate", 0.30),
+    ("Moderate", 0.40),
+    ("Moderate-High", 0.55),
+    ("High", 0.70),
+    ("Very High", 0.85),
+)
+
+# Volume anomaly bands: <= 0.5 bearish, >= 2.0 bullish, >= 3.0 strong.
+# The first bound is the float just above 0.5 so bisect_right keeps 0.5
+# itself in the bearish band
+_VOLUME_THRESHOLDS = (math.nextafter(0.5, math.inf), 2.0, 3.0)
+_VOLUME_STRENGTHS = (
+    SignalStrength.BEARISH,
+    SignalStrength.NEUTRAL,
+    SignalStrength.BULLISH,
+    SignalStrength.STRONG_BULLISH,
+)
+
+
+def _ma_likelihood(composite: float) -> Tuple[str, float]:
+    """Map a composite score to (likelihood_label, confidence_score)."""
+    return _LIKELIHOOD_LABELS[bisect.bisect_right(_LIKELIHOOD_THRESHOLDS, composite)]
+
+
+@dataclass(slots=True, frozen=True)
 class MarketSignals:
     """
     Real-time market signals for M&A prediction.
@@ -70,39 +162,43 @@ class MarketSignals:
     distance_from_52w_high: float  # Percentage from 52-week high
     distance_from_52w_low: float  # Percentage from 52-week low
 
+    # Memoized calculate_composite_score() result; fields are frozen, so
+    # it never goes stale
+    _composite_score: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
-        """Validate signal values."""
-        if self.call_put_ratio < 0:
-            raise ValueError("Call/put ratio must be positive")
-        if not 0 <= self.institutional_ownership_pct <= 100:
-            raise ValueError("Institutional ownership must be 0-100%")
-        if not 0 <= self.insider_buying_intensity <= 10:
-            raise ValueError("Insider buying intensity must be 0-10")
+        """
+        Validate signal values.
+
+        The checks are skipped when Python runs with -O, so optimized
+        production runs construct signals without the per-instance compares.
+        """
+        if __debug__:
+            if self.call_put_ratio < 0:
+                raise ValueError("Call/put ratio must be positive")
+            if not 0 <= self.institutional_ownership_pct <= 100:
+                raise ValueError("Institutional ownership must be 0-100%")
+            if not 0 <= self.insider_buying_intensity <= 10:
+                raise ValueError("Insider buying intensity must be 0-10")
 
     @property
     def volume_signal_strength(self) -> SignalStrength:
         """Classify volume signal strength."""
-        if self.trading_volume_anomaly >= 3.0:
-            return SignalStrength.STRONG_BULLISH
-        elif self.trading_volume_anomaly >= 2.0:
-            return SignalStrength.BULLISH
-        elif self.trading_volume_anomaly <= 0.5:
-            return SignalStrength.BEARISH
-        else:
-            return SignalStrength.NEUTRAL
+        return _VOLUME_STRENGTHS[
+            bisect.bisect_right(_VOLUME_THRESHOLDS, self.trading_volume_anomaly)
+        ]
 
     @property
     def options_signal_strength(self) -> SignalStrength:
         """Classify options activity signal strength."""
-        if self.options_activity == OptionsActivity.HEAVY_CALL_BUYING:
-            if self.call_put_ratio >= 2.0:
-                return SignalStrength.STRONG_BULLISH
-            return SignalStrength.BULLISH
-        elif self.options_activity == OptionsActivity.UNUSUAL_ACTIVITY:
-            return SignalStrength.BULLISH
-        elif self.options_activity == OptionsActivity.PROTECTIVE_PUTS:
-            return SignalStrength.BEARISH
-        return SignalStrength.NEUTRAL
+        if (
+            self.options_activity is _HEAVY_CALL
+            and self.call_put_ratio >= 2.0
+        ):
+            return SignalStrength.STRONG_BULLISH
+        return _OPTIONS_SIGNAL_STRENGTH.get(self.options_activity, SignalStrength.NEUTRAL)
 
     @property
     def institutional_signal_strength(self) -> SignalStrength:
@@ -137,6 +233,12 @@ class MarketSignals:
         Returns:
             Composite score from 0-100
         """
+        if self._composite_score is None:
+            object.__setattr__(self, "_composite_score", self._compute_composite_score())
+        return self._composite_score
+
+    def _compute_composite_score(self) -> float:
+        """Compute the composite score (uncached)."""
         score = 50.0  # Start neutral
 
         # Volume signals (0-20 points)
@@ -148,7 +250,7 @@ class MarketSignals:
             score += 10
 
         # Options signals (0-20 points)
-        if self.options_activity == OptionsActivity.HEAVY_CALL_BUYING:
+        if self.options_activity is _HEAVY_CALL:
             score += 15
         if self.call_put_ratio >= 2.0:
             score += 5
@@ -186,20 +288,7 @@ class MarketSignals:
         Returns:
             Tuple of (likelihood_label, confidence_score)
         """
-        composite = self.calculate_composite_score()
-
-        if composite >= 80:
-            return ("Very High", 0.85)
-        elif composite >= 70:
-            return ("High", 0.70)
-        elif composite >= 60:
-            return ("Moderate-High", 0.55)
-        elif composite >= 50:
-            return ("Moderate", 0.40)
-        elif composite >= 40:
-            return ("Low-Moderate", 0.30)
-        else:
-            return ("Low", 0.20)
+        return _ma_likelihood(self.calculate_composite_score())
 
 
 class MarketObservationEngine:
@@ -207,39 +296,120 @@ class MarketObservationEngine:
     Engine for tracking and analyzing market signals across multiple companies.
     """
 
-    def __init__(self):
-        """Initialize the market observation engine."""
-        self.signals_cache: Dict[str, List[MarketSignals]] = {}
+    def __init__(self, seed: Optional[Union[int, np.random.Generator]] = None):
+        """
+        Initialize the market observation engine.
+
+        Args:
+            seed: Seed or NumPy Generator for mock signal generation
+                (default: fresh OS entropy)
+        """
+        # Random source for the mock signal generators
+        self._rng = np.random.default_rng(seed)
+        # Per-ticker signal history, oldest first
+        self.signals_cache: Dict[str, Deque[MarketSignals]] = {}
         self.watchlist: List[str] = []
+        # Integer timestamp keys parallel to each signals_cache history
+        self._timestamp_keys: Dict[str, Deque[int]] = {}
+        # Clock pinned by tick(); None reads the system clock per call
+        self._now: Optional[datetime] = None
+        # Watchlist insertion order, used to break score ties
+        self._watch_seq: Dict[str, int] = {}
+        self._watch_counter = count()
+        # Watchlisted tickers with signals as (-score, watch_seq, ticker),
+        # kept sorted so the best candidates are always at the front
+        self._score_index: List[Tuple[float, int, str]] = []
+        self._score_entries: Dict[str, Tuple[float, int, str]] = {}
+
+    def tick(self, now: Optional[datetime] = None) -> None:
+        """
+        Pin the clock used for retention and lookback cutoffs.
+
+        Batch ingestion can tick once and then record many signals without
+        reading the system clock per insert. Call resume_clock() to go
+        back to live time.
+
+        Args:
+            now: Time to pin (default: current time)
+        """
+        self._now = now if now is not None else datetime.now()
+
+    def resume_clock(self) -> None:
+        """Return to reading the system clock after tick()."""
+        self._now = None
+
+    def _current_time(self) -> datetime:
+        """Pinned time if set by tick(), else the current time."""
+        return self._now if self._now is not None else datetime.now()
 
     def add_to_watchlist(self, ticker: str) -> None:
         """Add a ticker to the watchlist."""
-        if ticker not in self.watchlist:
+        if ticker not in self._watch_seq:
             self.watchlist.append(ticker)
+            self._watch_seq[ticker] = next(self._watch_counter)
+            self._reindex_score(ticker)
 
     def remove_from_watchlist(self, ticker: str) -> None:
         """Remove a ticker from the watchlist."""
-        if ticker in self.watchlist:
+        if ticker in self._watch_seq:
             self.watchlist.remove(ticker)
+            del self._watch_seq[ticker]
+            self._reindex_score(ticker)
+
+    def _reindex_score(self, ticker: str) -> None:
+        """
+        Refresh a ticker's entry in the sorted score index.
+
+        Only watchlisted tickers with signals are indexed; the entry is
+        rebuilt from the ticker's latest signals.
+        """
+        entry = self._score_entries.pop(ticker, None)
+        if entry is not None:
+            del self._score_index[bisect.bisect_left(self._score_index, entry)]
+
+        seq = self._watch_seq.get(ticker)
+        latest = self.get_latest_signals(ticker)
+        if seq is None or latest is None:
+            return
+
+        entry = (-latest.calculate_composite_score(), seq, ticker)
+        bisect.insort(self._score_index, entry)
+        self._score_entries[ticker] = entry
 
     def record_signals(self, signals: MarketSignals) -> None:
         """
         Record market signals for a ticker.
 
+        Signals must be recorded in chronological order per ticker, which
+        keeps every history sorted by construction.
+
         Args:
             signals: MarketSignals instance to record
+
+        Raises:
+            ValueError: If signals are older than the ticker's latest record
         """
-        if signals.ticker not in self.signals_cache:
-            self.signals_cache[signals.ticker] = []
+        history = self.signals_cache.setdefault(signals.ticker, deque())
+        keys = self._timestamp_keys.setdefault(signals.ticker, deque())
+        key = _timestamp_key(signals.timestamp)
+
+        # Append-only: the latest entry is always last
+        if keys and key < keys[-1]:
+            raise ValueError(
+                f"Signals for {signals.ticker} at {signals.timestamp} are older "
+                f"than the latest recorded at {history[-1].timestamp}"
+            )
+        history.append(signals)
+        keys.append(key)
 
-        self.signals_cache[signals.ticker].append(signals)
+        # Keep only last 90 days of signals; expired entries are the oldest,
+        # so they are popped from the front
+        cutoff = _timestamp_key(self._current_time() - timedelta(days=90))
+        while keys and keys[0] < cutoff:
+            keys.popleft()
+            history.popleft()
 
-        # Keep only last 90 days of signals
-        cutoff = datetime.now() - timedelta(days=90)
-        self.signals_cache[signals.ticker] = [
-            s for s in self.signals_cache[signals.ticker]
-            if s.timestamp >= cutoff
-        ]
+        self._reindex_score(signals.ticker)
 
     def get_latest_signals(self, ticker: str) -> Optional[MarketSignals]:
         """
@@ -251,10 +421,8 @@ class MarketObservationEngine:
         Returns:
             Latest MarketSignals or None if not available
         """
-        if ticker not in self.signals_cache or not self.signals_cache[ticker]:
-            return None
-
-        return sorted(self.signals_cache[ticker], key=lambda x: x.timestamp)[-1]
+        history = self.signals_cache.get(ticker)
+        return history[-1] if history else None
 
     def get_signal_history(
         self,
@@ -271,14 +439,14 @@ class MarketObservationEngine:
         Returns:
             List of MarketSignals sorted by timestamp
         """
-        if ticker not in self.signals_cache:
+        history = self.signals_cache.get(ticker)
+        if not history:
             return []
 
-        cutoff = datetime.now() - timedelta(days=days)
-        return sorted(
-            [s for s in self.signals_cache[ticker] if s.timestamp >= cutoff],
-            key=lambda x: x.timestamp
-        )
+        # History is time-ordered: locate the cutoff and slice from there
+        cutoff = _timestamp_key(self._current_time() - timedelta(days=days))
+        start = bisect.bisect_left(self._timestamp_keys[ticker], cutoff)
+        return list(islice(history, start, None))
 
     def scan_for_anomalies(
         self,
@@ -299,7 +467,7 @@ class MarketObservationEngine:
 
         for ticker in self.watchlist:
             latest = self.get_latest_signals(ticker)
-            if not latest:
+            if latest is None:
                 continue
 
             reasons = []
@@ -317,10 +485,7 @@ class MarketObservationEngine:
                 )
 
             # Check unusual options activity
-            if latest.options_activity in [
-                OptionsActivity.HEAVY_CALL_BUYING,
-                OptionsActivity.UNUSUAL_ACTIVITY
-            ]:
+            if latest.options_activity in _UNUSUAL_OPTIONS:
                 reasons.append(f"Unusual options: {latest.options_activity.value}")
 
             # Check institutional accumulation
@@ -336,7 +501,10 @@ class MarketObservationEngine:
             if reasons:
                 anomalies.append((ticker, latest, "; ".join(reasons)))
 
-        return sorted(anomalies, key=lambda x: x[1].calculate_composite_score(), reverse=True)
+        # Strongest composite signal first (scores are memoized per
+        # MarketSignals); the stable sort keeps watchlist order among ties
+        anomalies.sort(key=lambda a: a[1].calculate_composite_score(), reverse=True)
+        return anomalies
 
     def get_top_ma_candidates(self, top_n: int = 10) -> List[Tuple[str, float, str]]:
         """
@@ -348,19 +516,12 @@ class MarketObservationEngine:
         Returns:
             List of (ticker, score, likelihood) tuples
         """
-        candidates = []
-
-        for ticker in self.watchlist:
-            latest = self.get_latest_signals(ticker)
-            if not latest:
-                continue
-
-            score = latest.calculate_composite_score()
-            likelihood, _ = latest.get_ma_likelihood_indicator()
-
-            candidates.append((ticker, score, likelihood))
-
-        return sorted(candidates, key=lambda x: x[1], reverse=True)[:top_n]
+        # The score index is kept sorted by (-score, watchlist order), so
+        # the best candidates are simply its first top_n entries
+        return [
+            (ticker, -neg_score, _ma_likelihood(-neg_score)[0])
+            for neg_score, _, ticker in self._score_index[:top_n]
+        ]
 
     def generate_mock_signals(
         self,
@@ -377,49 +538,53 @@ class MarketObservationEngine:
         Returns:
             MarketSignals instance with simulated data
         """
-        if ma_likely:
-            # Generate signals suggesting potential M&A
-            return MarketSignals(
+        return self.generate_mock_signals_batch([ticker], [ma_likely])[0]
+
+    def generate_mock_signals_batch(
+        self,
+        tickers: List[str],
+        ma_likely: Optional[List[bool]] = None
+    ) -> List[MarketSignals]:
+        """
+        Generate mock market signals for many tickers with batched draws.
+
+        All random values come from one vectorized draw per field kind
+        instead of separate Python RNG calls per field.
+
+        Args:
+            tickers: Stock ticker symbols
+            ma_likely: Per-ticker flags; True generates signals suggesting
+                M&A activity (default: all False)
+
+        Returns:
+            List of MarketSignals, one per ticker in input order
+        """
+        n = len(tickers)
+        likely = np.zeros(n, dtype=bool) if ma_likely is None else np.asarray(ma_likely, dtype=bool)
+
+        # Per-ticker bounds: pick the M&A or normal profile row by row
+        float_values = self._rng.uniform(
+            np.where(likely[:, None], _MOCK_MA_LOWS, _MOCK_NORMAL_LOWS),
+            np.where(likely[:, None], _MOCK_MA_HIGHS, _MOCK_NORMAL_HIGHS),
+        ).tolist()
+        int_values = self._rng.integers(
+            np.where(likely[:, None], _MOCK_MA_INT_LOWS, _MOCK_NORMAL_INT_LOWS),
+            np.where(likely[:, None], _MOCK_MA_INT_HIGHS, _MOCK_NORMAL_INT_HIGHS),
+            endpoint=True,
+        ).tolist()
+
+        now = datetime.now()
+        return [
+            MarketSignals(
                 ticker=ticker,
-                timestamp=datetime.now(),
-                trading_volume_anomaly=random.uniform(2.5, 4.0),
-                relative_volume=random.uniform(2.0, 3.5),
-                short_interest_change=random.uniform(-25, -10),
-                short_interest_ratio=random.uniform(2, 5),
-                options_activity=OptionsActivity.HEAVY_CALL_BUYING,
-                call_put_ratio=random.uniform(2.0, 3.5),
-                unusual_options_volume=random.uniform(3.0, 5.0),
-                analyst_upgrades=random.randint(3, 6),
-                analyst_downgrades=random.randint(0, 1),
-                price_target_change=random.uniform(20, 40),
-                institutional_accumulation=random.uniform(5.0, 10.0),
-                insider_buying_intensity=random.uniform(7.0, 10.0),
-                institutional_ownership_pct=random.uniform(60, 85),
-                price_momentum_20d=random.uniform(15, 35),
-                price_momentum_60d=random.uniform(25, 50),
-                distance_from_52w_high=random.uniform(-10, 0),
-                distance_from_52w_low=random.uniform(40, 80)
+                timestamp=now,
+                options_activity=(
+                    _HEAVY_CALL if is_likely else OptionsActivity.NORMAL
+                ),
+                **dict(zip(_MOCK_FLOAT_FIELDS, floats)),
+                **dict(zip(_MOCK_INT_FIELDS, ints)),
             )
-        else:
-            # Generate normal market signals
-            return MarketSignals(
-                ticker=ticker,
-                timestamp=datetime.now(),
-                trading_volume_anomaly=random.uniform(0.8, 1.3),
-                relative_volume=random.uniform(0.9, 1.2),
-                short_interest_change=random.uniform(-5, 5),
-                short_interest_ratio=random.uniform(3, 7),
-                options_activity=OptionsActivity.NORMAL,
-                call_put_ratio=random.uniform(0.8, 1.2),
-                unusual_options_volume=random.uniform(0.9, 1.1),
-                analyst_upgrades=random.randint(0, 2),
-                analyst_downgrades=random.randint(0, 2),
-                price_target_change=random.uniform(-5, 10),
-                institutional_accumulation=random.uniform(-2.0, 2.0),
-                insider_buying_intensity=random.uniform(2.0, 5.0),
-                institutional_ownership_pct=random.uniform(40, 70),
-                price_momentum_20d=random.uniform(-10, 15),
-                price_momentum_60d=random.uniform(-15, 20),
-                distance_from_52w_high=random.uniform(-30, -5),
-                distance_from_52w_low=random.uniform(20, 60)
+            for ticker, is_likely, floats, ints in zip(
+                tickers, likely.tolist(), float_values, int_values
             )
+        ]
@@ -5,12 +5,22 @@ This module analyzes sentiment from multiple sources including news,
 conferences, and social media to gauge market sentiment around biotech companies.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Any, List, Dict, NamedTuple, Optional, Tuple, Union
 from enum import Enum
+from itertools import product
+from operator import mul
+import bisect
+import math
 import random
-import re
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; reductions run as NumPy expressions
+    njit = None
 
 
 class SentimentPolarity(Enum):
@@ -32,7 +42,7 @@ class ConferenceType(Enum):
     BIO = "bio"  # BIO International Convention
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     """Represents a news article about a biotech company."""
     title: str
@@ -49,7 +59,7 @@ class NewsArticle:
         return self.sentiment_score * self.relevance_score
 
 
-@dataclass
+@dataclass(slots=True)
 class ConferenceMention:
     """Represents a company mention at a major conference."""
     conference: ConferenceType
@@ -60,7 +70,7 @@ class ConferenceMention:
     data_quality: str  # "breakthrough", "positive", "neutral", "disappointing"
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialMediaMetrics:
     """Social media sentiment and engagement metrics."""
     platform: str  # "twitter", "stocktwits", "reddit", etc.
@@ -72,7 +82,216 @@ class SocialMediaMetrics:
     key_topics: List[str]
 
 
-@dataclass
+# Conference weighting tables indexed by small integer codes, for the
+# compiled kernel; the extra last entry (1.0) is used for unrecognized
+# presentation types/qualities
+_PRESENTATION_TYPES = ("keynote", "oral", "panel", "poster")
+_PRESENTATION_CODES = {name: i for i, name in enumerate(_PRESENTATION_TYPES)}
+_PRESENTATION_WEIGHTS = np.array([2.0, 1.5, 1.2, 0.8, 1.0])
+
+_DATA_QUALITIES = ("breakthrough", "positive", "neutral", "disappointing")
+_DATA_QUALITY_CODES = {name: i for i, name in enumerate(_DATA_QUALITIES)}
+_DATA_QUALITY_MULTIPLIERS = np.array([2.0, 1.5, 1.0, 0.5, 1.0])
+
+# The same weights keyed by name, for the pure-Python path
+_PRESENTATION_WEIGHT_BY_TYPE = dict(zip(_PRESENTATION_TYPES, _PRESENTATION_WEIGHTS.tolist()))
+_DATA_QUALITY_MULTIPLIER_BY_NAME = dict(zip(_DATA_QUALITIES, _DATA_QUALITY_MULTIPLIERS.tolist()))
+
+# Sentiment lexicon for basic NLP
+_POSITIVE_KEYWORDS = (
+    "breakthrough", "positive", "success", "approval", "advance",
+    "promising", "effective", "milestone", "partnership", "acquisition",
+    "beat", "exceed", "strong", "growth", "innovative", "FDA approval",
+    "clinical success", "expansion", "outperform", "bullish"
+)
+
+_NEGATIVE_KEYWORDS = (
+    "failure", "disappointing", "decline", "risk", "concern",
+    "miss", "delay", "setback", "warning", "investigation",
+    "lawsuit", "rejected", "terminated", "bearish", "downgrade",
+    "loss", "weak", "struggle", "challenge", "adverse"
+)
+
+_MA_KEYWORDS = (
+    "acquisition", "merger", "buyout", "takeover", "deal",
+    "offer", "bid", "acquire", "purchase", "M&A"
+)
+
+# Lowercased union of the three lexicons ("acquisition" is both positive
+# and M&A), searched once per text; the frozensets classify the hits
+_KEYWORDS = tuple(dict.fromkeys(
+    kw.lower() for kw in _POSITIVE_KEYWORDS + _NEGATIVE_KEYWORDS + _MA_KEYWORDS
+))
+_POSITIVE_SET = frozenset(kw.lower() for kw in _POSITIVE_KEYWORDS)
+_NEGATIVE_SET = frozenset(kw.lower() for kw in _NEGATIVE_KEYWORDS)
+_MA_SET = frozenset(kw.lower() for kw in _MA_KEYWORDS)
+
+_CONFERENCE_TYPES = tuple(ConferenceType)
+
+# Base weights of the news, conference, social and analyst components in
+# SentimentScore.aggregate_sentiment (35/25/20/20%)
+_AGGREGATE_WEIGHTS = (0.35, 0.25, 0.20, 0.20)
+_AGGREGATE_WEIGHT_ARRAY = np.array(_AGGREGATE_WEIGHTS)
+
+# Aggregate sentiment band floors and the polarity at or above each
+_POLARITY_THRESHOLDS = (-0.6, -0.2, 0.2, 0.6)
+_POLARITIES = (
+    SentimentPolarity.VERY_NEGATIVE,
+    SentimentPolarity.NEGATIVE,
+    SentimentPolarity.NEUTRAL,
+    SentimentPolarity.POSITIVE,
+    SentimentPolarity.VERY_POSITIVE,
+)
+_POLARITY_VALUES = np.array([polarity.value for polarity in _POLARITIES])
+
+# SentimentScore component fields, in _AGGREGATE_WEIGHTS order
+_SENTIMENT_FIELDS = (
+    "news_sentiment", "conference_sentiment", "social_sentiment", "analyst_sentiment"
+)
+_CONFIDENCE_FIELDS = (
+    "news_confidence", "conference_confidence", "social_confidence", "analyst_confidence"
+)
+
+# Record layout of one SentimentModel.bulk_aggregate row
+SENTIMENT_DTYPE = np.dtype(
+    [("ticker", "U16")]
+    + [(name, "<f8") for name in _SENTIMENT_FIELDS + _CONFIDENCE_FIELDS]
+    + [
+        ("news_volume", "<i8"),
+        ("social_mentions", "<i8"),
+        ("conference_presentations", "<i8"),
+        ("aggregate_sentiment", "<f8"),
+        ("sentiment_polarity", "U13"),
+    ]
+)
+
+# Record count above which the analyzers use the compiled kernels
+_KERNEL_MIN_ITEMS = 256
+
+
+def _recency_weighted_mean(
+    sentiment: np.ndarray,
+    base_weight: np.ndarray,
+    age: np.ndarray,
+    horizon: float,
+    boosted: np.ndarray,
+) -> float:
+    """
+    Sentiment mean weighted by base weight, linear recency and boost.
+
+    Each record weighs base_weight * max(0.1, 1 - age/horizon), times 1.5
+    when boosted (trending). Shared by the news and social analyzers;
+    compiled with numba when it is installed.
+    """
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for i in range(sentiment.shape[0]):
+        weight = base_weight[i] * max(0.1, 1.0 - age[i] / horizon)
+        weight *= 1.0 + 0.5 * boosted[i]
+        weighted_sum += sentiment[i] * weight
+        total_weight += weight
+    if total_weight == 0:
+        return 0.0
+    return weighted_sum / total_weight
+
+
+def _mean_buzz(
+    buzz: np.ndarray,
+    presentation_type: np.ndarray,
+    data_quality: np.ndarray,
+) -> float:
+    """
+    Conference buzz weighted by presentation type and data quality, capped
+    at 10. Compiled with numba when it is installed.
+    """
+    total_score = 0.0
+    n = buzz.shape[0]
+    for i in range(n):
+        total_score += (
+            buzz[i]
+            * _PRESENTATION_WEIGHTS[presentation_type[i]]
+            * _DATA_QUALITY_MULTIPLIERS[data_quality[i]]
+        )
+    return min(10.0, total_score / n)
+
+
+if njit is not None:
+    _recency_weighted_mean = njit(cache=True)(_recency_weighted_mean)
+    _mean_buzz = njit(cache=True)(_mean_buzz)
+
+
+class _NewsArrays(NamedTuple):
+    """Columnar view of a list of NewsArticle records."""
+    sentiment: np.ndarray  # float64
+    relevance: np.ndarray  # float64
+    age_days: np.ndarray  # float64, whole days before the reference time
+
+    @classmethod
+    def from_articles(cls, articles: List[NewsArticle], now: datetime) -> "_NewsArrays":
+        n = len(articles)
+        return cls(
+            sentiment=np.fromiter((a.sentiment_score for a in articles), np.float64, n),
+            relevance=np.fromiter((a.relevance_score for a in articles), np.float64, n),
+            age_days=np.fromiter(
+                ((now - a.published_date).days for a in articles), np.float64, n
+            ),
+        )
+
+
+class _ConferenceArrays(NamedTuple):
+    """Columnar view of a list of ConferenceMention records."""
+    buzz: np.ndarray  # float64
+    presentation_type: np.ndarray  # int8 code into _PRESENTATION_WEIGHTS
+    data_quality: np.ndarray  # int8 code into _DATA_QUALITY_MULTIPLIERS
+
+    @classmethod
+    def from_mentions(cls, mentions: List[ConferenceMention]) -> "_ConferenceArrays":
+        n = len(mentions)
+        unknown_type = len(_PRESENTATION_TYPES)
+        unknown_quality = len(_DATA_QUALITIES)
+        return cls(
+            buzz=np.fromiter((c.buzz_score for c in mentions), np.float64, n),
+            presentation_type=np.fromiter(
+                (_PRESENTATION_CODES.get(c.presentation_type, unknown_type) for c in mentions),
+                np.int8,
+                n,
+            ),
+            data_quality=np.fromiter(
+                (_DATA_QUALITY_CODES.get(c.data_quality, unknown_quality) for c in mentions),
+                np.int8,
+                n,
+            ),
+        )
+
+
+class _SocialArrays(NamedTuple):
+    """Columnar view of a list of SocialMediaMetrics records."""
+    sentiment: np.ndarray  # float64
+    engagement: np.ndarray  # float64
+    trending: np.ndarray  # bool
+    age_hours: np.ndarray  # float64, hours before the reference time
+
+    @classmethod
+    def from_metrics(cls, metrics: List[SocialMediaMetrics], now: datetime) -> "_SocialArrays":
+        n = len(metrics)
+        return cls(
+            sentiment=np.fromiter((m.sentiment_score for m in metrics), np.float64, n),
+            engagement=np.fromiter((m.engagement_score for m in metrics), np.float64, n),
+            trending=np.fromiter((m.trending for m in metrics), np.bool_, n),
+            age_hours=np.fromiter(
+                ((now - m.timestamp).total_seconds() / 3600 for m in metrics), np.float64, n
+            ),
+        )
+
+
+def _check_sentiment_range(*scores: float) -> None:
+    """Raise ValueError unless every component score is within -1 to 1."""
+    for score in scores:
+        if not -1 <= score <= 1:
+            raise ValueError(f"Sentiment score must be between -1 and 1, got {score}")
+
+
+@dataclass(slots=True, frozen=True)
 class SentimentScore:
     """
     Comprehensive sentiment score for a biotech company.
@@ -100,18 +319,40 @@ class SentimentScore:
     social_mentions: int
     conference_presentations: int
 
+    # Memoized aggregate_sentiment / overall_confidence; fields are frozen,
+    # so they never go stale
+    _aggregate_sentiment: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _overall_confidence: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Validate sentiment scores."""
-        for score in [self.news_sentiment, self.conference_sentiment,
-                      self.social_sentiment, self.analyst_sentiment]:
-            if not -1 <= score <= 1:
-                raise ValueError(f"Sentiment score must be between -1 and 1, got {score}")
+        _check_sentiment_range(self.news_sentiment, self.conference_sentiment,
+                               self.social_sentiment, self.analyst_sentiment)
 
-        for conf in [self.news_confidence, self.conference_confidence,
-                     self.social_confidence, self.analyst_confidence]:
+        for conf in (self.news_confidence, self.conference_confidence,
+                     self.social_confidence, self.analyst_confidence):
             if not 0 <= conf <= 1:
                 raise ValueError(f"Confidence must be between 0 and 1, got {conf}")
 
+    @classmethod
+    def _unchecked(cls, **fields: Any) -> "SentimentScore":
+        """
+        Build a score without running the __post_init__ range checks.
+
+        Only for internal callers whose values are already known to be in
+        range; every field must be given.
+        """
+        score = object.__new__(cls)
+        for name, value in fields.items():
+            object.__setattr__(score, name, value)
+        object.__setattr__(score, "_aggregate_sentiment", None)
+        object.__setattr__(score, "_overall_confidence", None)
+        return score
+
     @property
     def aggregate_sentiment(self) -> float:
         """
@@ -120,53 +361,51 @@ class SentimentScore:
         Returns:
             Aggregate sentiment from -1 to 1
         """
-        total_weight = 0.0
-        weighted_sum = 0.0
+        if self._aggregate_sentiment is None:
+            object.__setattr__(self, "_aggregate_sentiment", self._compute_aggregate_sentiment())
+        return self._aggregate_sentiment
+
+    def _compute_aggregate_sentiment(self) -> float:
+        """Compute the aggregate sentiment (uncached)."""
+        sentiments = (
+            self.news_sentiment,
+            self.conference_sentiment,
+            self.social_sentiment,
+            self.analyst_sentiment,
+        )
+        confidences = (
+            self.news_confidence,
+            self.conference_confidence,
+            self.social_confidence,
+            self.analyst_confidence,
+        )
 
         # Weight each component by its confidence
-        components = [
-            (self.news_sentiment, self.news_confidence, 0.35),  # 35% weight
-            (self.conference_sentiment, self.conference_confidence, 0.25),  # 25% weight
-            (self.social_sentiment, self.social_confidence, 0.20),  # 20% weight
-            (self.analyst_sentiment, self.analyst_confidence, 0.20),  # 20% weight
-        ]
-
-        for sentiment, confidence, base_weight in components:
-            effective_weight = base_weight * confidence
-            weighted_sum += sentiment * effective_weight
-            total_weight += effective_weight
+        effective_weights = tuple(map(mul, _AGGREGATE_WEIGHTS, confidences))
+        total_weight = math.fsum(effective_weights)
 
         if total_weight == 0:
             return 0.0
 
-        return weighted_sum / total_weight
+        return math.fsum(map(mul, sentiments, effective_weights)) / total_weight
 
     @property
     def sentiment_polarity(self) -> SentimentPolarity:
         """Classify overall sentiment polarity."""
-        agg = self.aggregate_sentiment
-
-        if agg >= 0.6:
-            return SentimentPolarity.VERY_POSITIVE
-        elif agg >= 0.2:
-            return SentimentPolarity.POSITIVE
-        elif agg >= -0.2:
-            return SentimentPolarity.NEUTRAL
-        elif agg >= -0.6:
-            return SentimentPolarity.NEGATIVE
-        else:
-            return SentimentPolarity.VERY_NEGATIVE
+        return _POLARITIES[bisect.bisect_right(_POLARITY_THRESHOLDS, self.aggregate_sentiment)]
 
     @property
     def overall_confidence(self) -> float:
         """Calculate overall confidence in sentiment assessment."""
-        confidences = [
-            self.news_confidence,
-            self.conference_confidence,
-            self.social_confidence,
-            self.analyst_confidence
-        ]
-        return sum(confidences) / len(confidences)
+        if self._overall_confidence is None:
+            confidences = [
+                self.news_confidence,
+                self.conference_confidence,
+                self.social_confidence,
+                self.analyst_confidence
+            ]
+            object.__setattr__(self, "_overall_confidence", sum(confidences) / len(confidences))
+        return self._overall_confidence
 
     def get_sentiment_summary(self) -> str:
         """Get human-readable sentiment summary."""
@@ -188,37 +427,37 @@ class SentimentModel:
     Model for analyzing and tracking sentiment from multiple sources.
     """
 
-    def __init__(self):
-        """Initialize the sentiment model."""
+    def __init__(self, seed: Optional[Union[int, np.random.Generator]] = None):
+        """
+        Initialize the sentiment model.
+
+        Args:
+            seed: Seed or NumPy Generator for mock data generation
+                (default: fresh OS entropy)
+        """
+        # Random source for the mock news, conference and social generators
+        self._rng = np.random.default_rng(seed)
         self.news_cache: Dict[str, List[NewsArticle]] = {}
         self.conference_cache: Dict[str, List[ConferenceMention]] = {}
         self.social_cache: Dict[str, List[SocialMediaMetrics]] = {}
 
         # Sentiment lexicon for basic NLP
-        self.positive_keywords = [
-            "breakthrough", "positive", "success", "approval", "advance",
-            "promising", "effective", "milestone", "partnership", "acquisition",
-            "beat", "exceed", "strong", "growth", "innovative", "FDA approval",
-            "clinical success", "expansion", "outperform", "bullish"
-        ]
+        self.positive_keywords = list(_POSITIVE_KEYWORDS)
+        self.negative_keywords = list(_NEGATIVE_KEYWORDS)
+        self.ma_keywords = list(_MA_KEYWORDS)
 
-        self.negative_keywords = [
-            "failure", "disappointing", "decline", "risk", "concern",
-            "miss", "delay", "setback", "warning", "investigation",
-            "lawsuit", "rejected", "terminated", "bearish", "downgrade",
-            "loss", "weak", "struggle", "challenge", "adverse"
-        ]
-
-        self.ma_keywords = [
-            "acquisition", "merger", "buyout", "takeover", "deal",
-            "offer", "bid", "acquire", "purchase", "M&A"
-        ]
+        # Search tables derived from the lexicon once at import
+        self._keywords = _KEYWORDS
+        self._positive_set = _POSITIVE_SET
+        self._negative_set = _NEGATIVE_SET
+        self._ma_set = _MA_SET
 
     def analyze_news_sentiment(
         self,
         company: str,
         articles: Optional[List[NewsArticle]] = None,
-        days: int = 30
+        days: int = 30,
+        now: Optional[datetime] = None
     ) -> float:
         """
         Analyze news sentiment for a company.
@@ -227,23 +466,47 @@ class SentimentModel:
             company: Company name or ticker
             articles: Optional list of articles (if None, uses cache)
             days: Number of days to look back
+            now: Reference time for recency weights (default: datetime.now())
 
         Returns:
             Sentiment score from -1 to 1
         """
+        if now is None:
+            now = datetime.now()
+
         if articles is None:
-            articles = self._get_recent_news(company, days)
+            articles = self._get_recent_news(company, days, now)
 
         if not articles:
             return 0.0
 
-        # Calculate weighted average sentiment
+        if len(articles) > _KERNEL_MIN_ITEMS:
+            news = _NewsArrays.from_articles(articles, now)
+
+            if njit is not None:
+                return _recency_weighted_mean(
+                    news.sentiment,
+                    news.relevance,
+                    news.age_days,
+                    float(days),
+                    np.zeros(len(articles), dtype=np.bool_),
+                )
+
+            # More recent articles get higher weight
+            recency_weight = np.maximum(0.1, 1.0 - (news.age_days / days))
+            weight = news.relevance * recency_weight
+            total_weight = weight.sum()
+            if total_weight == 0:
+                return 0.0
+            return float(np.dot(news.sentiment, weight) / total_weight)
+
+        # A few dozen articles is typical, so a plain loop beats building arrays
         total_weight = 0.0
         weighted_sum = 0.0
 
         for article in articles:
             # More recent articles get higher weight
-            age_days = (datetime.now() - article.published_date).days
+            age_days = (now - article.published_date).days
             recency_weight = max(0.1, 1.0 - (age_days / days))
 
             weight = article.relevance_score * recency_weight
@@ -259,7 +522,8 @@ class SentimentModel:
         self,
         company: str,
         conferences: Optional[List[ConferenceMention]] = None,
-        days: int = 180  # Conferences are less frequent
+        days: int = 180,  # Conferences are less frequent
+        now: Optional[datetime] = None
     ) -> float:
         """
         Calculate conference buzz score for a company.
@@ -268,51 +532,38 @@ class SentimentModel:
             company: Company name or ticker
             conferences: Optional list of conference mentions
             days: Number of days to look back
+            now: Reference time for the lookback (default: datetime.now())
 
         Returns:
             Buzz score from 0 to 10
         """
         if conferences is None:
-            conferences = self._get_recent_conferences(company, days)
+            conferences = self._get_recent_conferences(company, days, now)
 
         if not conferences:
             return 0.0
 
-        # Weight by presentation type
-        type_weights = {
-            "keynote": 2.0,
-            "oral": 1.5,
-            "panel": 1.2,
-            "poster": 0.8
-        }
-
-        # Weight by data quality
-        quality_multipliers = {
-            "breakthrough": 2.0,
-            "positive": 1.5,
-            "neutral": 1.0,
-            "disappointing": 0.5
-        }
-
-        total_score = 0.0
-        for conf in conferences:
-            base_score = conf.buzz_score
-            type_weight = type_weights.get(conf.presentation_type, 1.0)
-            quality_mult = quality_multipliers.get(conf.data_quality, 1.0)
-
-            total_score += base_score * type_weight * quality_mult
+        if njit is not None and len(conferences) > _KERNEL_MIN_ITEMS:
+            mentions = _ConferenceArrays.from_mentions(conferences)
+            return _mean_buzz(mentions.buzz, mentions.presentation_type, mentions.data_quality)
 
-        # Normalize to 0-10 scale
-        if not conferences:
-            return 0.0
+        # Weight by presentation type and data quality
+        total_score = sum(
+            conf.buzz_score
+            * _PRESENTATION_WEIGHT_BY_TYPE.get(conf.presentation_type, 1.0)
+            * _DATA_QUALITY_MULTIPLIER_BY_NAME.get(conf.data_quality, 1.0)
+            for conf in conferences
+        )
 
+        # Normalize to 0-10 scale
         return min(10.0, total_score / len(conferences))
 
     def social_media_momentum(
         self,
         company: str,
         social_data: Optional[List[SocialMediaMetrics]] = None,
-        days: int = 7
+        days: int = 7,
+        now: Optional[datetime] = None
     ) -> float:
         """
         Calculate social media momentum score.
@@ -321,28 +572,54 @@ class SentimentModel:
             company: Company name or ticker
             social_data: Optional list of social media metrics
             days: Number of days to look back
+            now: Reference time for recency weights (default: datetime.now())
 
         Returns:
             Momentum score from -1 to 1
         """
+        if now is None:
+            now = datetime.now()
+
         if social_data is None:
-            social_data = self._get_recent_social(company, days)
+            social_data = self._get_recent_social(company, days, now)
 
         if not social_data:
             return 0.0
 
-        # Weight by engagement and recency
+        horizon_hours = days * 24
+
+        if len(social_data) > _KERNEL_MIN_ITEMS:
+            social = _SocialArrays.from_metrics(social_data, now)
+
+            if njit is not None:
+                return _recency_weighted_mean(
+                    social.sentiment,
+                    social.engagement,
+                    social.age_hours,
+                    float(horizon_hours),
+                    social.trending,
+                )
+
+            # Weight by engagement and recency; boost trending topics by
+            # 1.5x as a 0/1 factor, without a select
+            recency_weight = np.maximum(0.1, 1.0 - (social.age_hours / horizon_hours))
+            weight = social.engagement * recency_weight * (1.0 + 0.5 * social.trending)
+            total_weight = weight.sum()
+            if total_weight == 0:
+                return 0.0
+            return float(np.dot(social.sentiment, weight) / total_weight)
+
+        # A few platforms over a week is typical, so a plain loop beats
+        # building arrays
         total_weight = 0.0
         weighted_sentiment = 0.0
 
         for data in social_data:
-            age_hours = (datetime.now() - data.timestamp).total_seconds() / 3600
-            recency_weight = max(0.1, 1.0 - (age_hours / (days * 24)))
-
-            weight = data.engagement_score * recency_weight
-            if data.trending:
-                weight *= 1.5  # Boost trending topics
+            age_hours = (now - data.timestamp).total_seconds() / 3600
+            recency_weight = max(0.1, 1.0 - (age_hours / horizon_hours))
 
+            # Boost trending topics by 1.5x
+            weight = data.engagement_score * recency_weight * (1.0 + 0.5 * data.trending)
             weighted_sentiment += data.sentiment_score * weight
             total_weight += weight
 
@@ -355,17 +632,24 @@ class SentimentModel:
         """
         Perform basic sentiment analysis on text.
 
+        Each lexicon keyword found anywhere in the text (case-insensitive
+        substring match) counts once. The text is lowercased once and each
+        distinct keyword is searched once; hits are classified with O(1)
+        frozenset lookups.
+
         Args:
             text: Text to analyze
 
         Returns:
             Tuple of (sentiment_score, mentions_ma)
         """
+        # Distinct keywords present in the text
         text_lower = text.lower()
+        found = {kw for kw in self._keywords if kw in text_lower}
 
         # Count positive and negative keywords
-        positive_count = sum(1 for kw in self.positive_keywords if kw in text_lower)
-        negative_count = sum(1 for kw in self.negative_keywords if kw in text_lower)
+        positive_count = len(found & self._positive_set)
+        negative_count = len(found & self._negative_set)
 
         # Calculate sentiment score
         total_keywords = positive_count + negative_count
@@ -375,7 +659,7 @@ class SentimentModel:
             sentiment = (positive_count - negative_count) / total_keywords
 
         # Check for M&A mentions
-        mentions_ma = any(kw in text_lower for kw in self.ma_keywords)
+        mentions_ma = not self._ma_set.isdisjoint(found)
 
         return sentiment, mentions_ma
 
@@ -394,15 +678,103 @@ class SentimentModel:
         Returns:
             SentimentScore with comprehensive sentiment analysis
         """
+        # One reference time for every lookback and recency weight
+        now = datetime.now()
+        components = self._sentiment_components(ticker, lookback_days, now)
+
+        # Confidences are clamped to 0-1 and the analyst placeholder is drawn
+        # in range, so only the scores derived from source data are checked
+        _check_sentiment_range(
+            components["news_sentiment"],
+            components["conference_sentiment"],
+            components["social_sentiment"],
+        )
+
+        return SentimentScore._unchecked(ticker=ticker, timestamp=now, **components)
+
+    def bulk_aggregate(
+        self,
+        tickers: List[str],
+        lookback_days: int = 30
+    ) -> np.ndarray:
+        """
+        Aggregate sentiment for many tickers at once.
+
+        Component scores are gathered per ticker as in aggregate_sentiment();
+        the weighted aggregate and polarity are then computed for all
+        tickers in one vectorized pass. The result converts directly with
+        ``pandas.DataFrame(result)``.
+
+        Args:
+            tickers: Stock ticker symbols
+            lookback_days: Number of days to analyze
+
+        Returns:
+            SENTIMENT_DTYPE structured array, one row per ticker
+
+        Raises:
+            ValueError: If any component score or confidence is out of range
+        """
+        now = datetime.now()
+
+        result = np.zeros(len(tickers), dtype=SENTIMENT_DTYPE)
+        if not tickers:
+            return result
+
+        rows = [self._sentiment_components(ticker, lookback_days, now) for ticker in tickers]
+        result["ticker"] = tickers
+        for name in SENTIMENT_DTYPE.names[1:-2]:
+            result[name] = [row[name] for row in rows]
+
+        sentiments = np.column_stack([result[name] for name in _SENTIMENT_FIELDS])
+        confidences = np.column_stack([result[name] for name in _CONFIDENCE_FIELDS])
+
+        # Same range checks as SentimentScore.__post_init__, once per batch
+        if not np.all((sentiments >= -1) & (sentiments <= 1)):
+            raise ValueError("Sentiment scores must be between -1 and 1")
+        if not np.all((confidences >= 0) & (confidences <= 1)):
+            raise ValueError("Confidences must be between 0 and 1")
+
+        # Confidence-weighted mean of the four components per row
+        effective_weights = confidences * _AGGREGATE_WEIGHT_ARRAY
+        total_weight = effective_weights.sum(axis=1)
+        weighted_sum = np.einsum("ij,ij->i", sentiments, effective_weights)
+        aggregate = np.divide(
+            weighted_sum, total_weight, out=np.zeros(len(tickers)), where=total_weight != 0
+        )
+
+        result["aggregate_sentiment"] = aggregate
+        result["sentiment_polarity"] = _POLARITY_VALUES[
+            np.searchsorted(_POLARITY_THRESHOLDS, aggregate, side="right")
+        ]
+        return result
+
+    def _sentiment_components(
+        self,
+        ticker: str,
+        lookback_days: int,
+        now: datetime
+    ) -> Dict[str, float]:
+        """
+        Component scores, confidences and data volumes for one ticker.
+
+        Args:
+            ticker: Stock ticker symbol
+            lookback_days: Number of days to analyze
+            now: Reference time for every lookback and recency weight
+
+        Returns:
+            SentimentScore field values, keyed by field name
+        """
         # Get data from all sources
-        news_articles = self._get_recent_news(ticker, lookback_days)
-        conferences = self._get_recent_conferences(ticker, 180)
-        social_data = self._get_recent_social(ticker, 7)
+        news_articles = self._get_recent_news(ticker, lookback_days, now)
+        conferences = self._get_recent_conferences(ticker, 180, now)
+        social_data = self._get_recent_social(ticker, 7, now)
 
         # Calculate component sentiments
-        news_sentiment = self.analyze_news_sentiment(ticker, news_articles, lookback_days)
-        conf_sentiment = (self.conference_buzz_score(ticker, conferences, 180) - 5.0) / 5.0  # Normalize to -1 to 1
-        social_sentiment = self.social_media_momentum(ticker, social_data, 7)
+        news_sentiment = self.analyze_news_sentiment(ticker, news_articles, lookback_days, now)
+        conf_sentiment = (self.conference_buzz_score(ticker, conferences, 180, now) - 5.0) / 5.0  # Normalize to -1 to 1
+        social_sentiment = self.social_media_momentum(ticker, social_data, 7, now)
 
         # Analyst sentiment (simplified - would integrate with analyst data in production)
         analyst_sentiment = random.uniform(-0.3, 0.5)  # Placeholder
@@ -410,12 +782,11 @@ class SentimentModel:
         # Calculate confidence based on data volume
         news_confidence = min(1.0, len(news_articles) / 20)
         conference_confidence = min(1.0, len(conferences) / 3)
-        social_confidence = min(1.0, sum(d.mention_count for d in social_data) / 100)
+        social_mentions = sum(d.mention_count for d in social_data)
+        social_confidence = min(1.0, social_mentions / 100)
         analyst_confidence = 0.5  # Placeholder
 
-        return SentimentScore(
-            ticker=ticker,
-            timestamp=datetime.now(),
+        return dict(
             news_sentiment=news_sentiment,
             conference_sentiment=conf_sentiment,
             social_sentiment=social_sentiment,
@@ -425,7 +796,7 @@ class SentimentModel:
             social_confidence=social_confidence,
             analyst_confidence=analyst_confidence,
             news_volume=len(news_articles),
-            social_mentions=sum(d.mention_count for d in social_data),
+            social_mentions=social_mentions,
             conference_presentations=len(conferences)
         )
 
@@ -460,35 +831,66 @@ class SentimentModel:
         else:
             return change, "Sentiment is relatively stable"
 
-    def _get_recent_news(self, company: str, days: int) -> List[NewsArticle]:
+    def _get_recent_news(
+        self,
+        company: str,
+        days: int,
+        now: Optional[datetime] = None
+    ) -> List[NewsArticle]:
         """Get recent news articles from cache or generate mock data."""
+        if now is None:
+            now = datetime.now()
+
         if company in self.news_cache:
-            cutoff = datetime.now() - timedelta(days=days)
+            cutoff = now - timedelta(days=days)
             return [a for a in self.news_cache[company] if a.published_date >= cutoff]
 
         # Generate mock data for demonstration
-        return self._generate_mock_news(company, days)
+        return self._generate_mock_news(company, days, now)
 
-    def _get_recent_conferences(self, company: str, days: int) -> List[ConferenceMention]:
+    def _get_recent_conferences(
+        self,
+        company: str,
+        days: int,
+        now: Optional[datetime] = None
+    ) -> List[ConferenceMention]:
         """Get recent conference mentions from cache or generate mock data."""
+        if now is None:
+            now = datetime.now()
+
         if company in self.conference_cache:
-            cutoff = datetime.now() - timedelta(days=days)
+            cutoff = now - timedelta(days=days)
             return [c for c in self.conference_cache[company] if c.date >= cutoff]
 
-        return self._generate_mock_conferences(company)
+        return self._generate_mock_conferences(company, now)
 
-    def _get_recent_social(self, company: str, days: int) -> List[SocialMediaMetrics]:
+    def _get_recent_social(
+        self,
+        company: str,
+        days: int,
+        now: Optional[datetime] = None
+    ) -> List[SocialMediaMetrics]:
         """Get recent social media data from cache or generate mock data."""
+        if now is None:
+            now = datetime.now()
+
         if company in self.social_cache:
-            cutoff = datetime.now() - timedelta(days=days)
+            cutoff = now - timedelta(days=days)
             return [s for s in self.social_cache[company] if s.timestamp >= cutoff]
 
-        return self._generate_mock_social(company, days)
+        return self._generate_mock_social(company, days, now)
 
-    def _generate_mock_news(self, company: str, days: int) -> List[NewsArticle]:
+    def _generate_mock_news(
+        self,
+        company: str,
+        days: int,
+        now: Optional[datetime] = None
+    ) -> List[NewsArticle]:
         """Generate realistic mock news articles for testing."""
-        articles = []
-        num_articles = random.randint(5, 20)
+        if now is None:
+            now = datetime.now()
+
+        num_articles = int(self._rng.integers(5, 21))
 
         titles = [
             f"{company} announces positive Phase 3 results",
@@ -502,59 +904,94 @@ class SentimentModel:
             f"{company} receives analyst downgrade on valuation concerns",
             f"Breaking: {company} exploring strategic alternatives"
         ]
+        title_sentiments = [self.analyze_text_sentiment(title) for title in titles]
 
         sources = ["Bloomberg", "Reuters", "BioPharma Dive", "FierceBiotech",
                    "STAT News", "Wall Street Journal", "Seeking Alpha"]
 
-        for _ in range(num_articles):
-            title = random.choice(titles)
-            sentiment, mentions_ma = self.analyze_text_sentiment(title)
+        # Draw every random field for all articles up front
+        title_idx = self._rng.integers(0, len(titles), num_articles).tolist()
+        source_idx = self._rng.integers(0, len(sources), num_articles).tolist()
+        age_days = self._rng.integers(0, days + 1, num_articles).tolist()
+        noise = self._rng.uniform(-0.2, 0.2, num_articles).tolist()
+        relevance = self._rng.uniform(0.6, 1.0, num_articles).tolist()
+
+        articles = []
+        for i in range(num_articles):
+            sentiment, mentions_ma = title_sentiments[title_idx[i]]
 
             articles.append(NewsArticle(
-                title=title,
-                source=random.choice(sources),
-                published_date=datetime.now() - timedelta(days=random.randint(0, days)),
-                sentiment_score=sentiment + random.uniform(-0.2, 0.2),
-                relevance_score=random.uniform(0.6, 1.0),
+                title=titles[title_idx[i]],
+                source=sources[source_idx[i]],
+                published_date=now - timedelta(days=age_days[i]),
+                sentiment_score=sentiment + noise[i],
+                relevance_score=relevance[i],
                 keywords=["biotech", "clinical", "pipeline"],
                 mentions_ma=mentions_ma
             ))
 
         return articles
 
-    def _generate_mock_conferences(self, company: str) -> List[ConferenceMention]:
+    def _generate_mock_conferences(
+        self,
+        company: str,
+        now: Optional[datetime] = None
+    ) -> List[ConferenceMention]:
         """Generate realistic mock conference mentions."""
-        conferences = []
-        num_mentions = random.randint(1, 4)
+        if now is None:
+            now = datetime.now()
 
-        for _ in range(num_mentions):
+        num_mentions = int(self._rng.integers(1, 5))
+
+        conference_idx = self._rng.integers(0, len(_CONFERENCE_TYPES), num_mentions).tolist()
+        age_days = self._rng.integers(0, 181, num_mentions).tolist()
+        type_idx = self._rng.integers(0, len(_PRESENTATION_TYPES), num_mentions).tolist()
+        buzz = self._rng.uniform(3.0, 9.0, num_mentions).tolist()
+        quality_idx = self._rng.integers(0, len(_DATA_QUALITIES), num_mentions).tolist()
+
+        conferences = []
+        for i in range(num_mentions):
             conferences.append(ConferenceMention(
-                conference=random.choice(list(ConferenceType)),
-                date=datetime.now() - timedelta(days=random.randint(0, 180)),
-                presentation_type=random.choice(["oral", "poster", "keynote", "panel"]),
+                conference=_CONFERENCE_TYPES[conference_idx[i]],
+                date=now - timedelta(days=age_days[i]),
+                presentation_type=_PRESENTATION_TYPES[type_idx[i]],
                 topic="Clinical trial results and pipeline update",
-                buzz_score=random.uniform(3.0, 9.0),
-                data_quality=random.choice(["breakthrough", "positive", "neutral", "disappointing"])
+                buzz_score=buzz[i],
+                data_quality=_DATA_QUALITIES[quality_idx[i]]
             ))
 
         return conferences
 
-    def _generate_mock_social(self, company: str, days: int) -> List[SocialMediaMetrics]:
+    def _generate_mock_social(
+        self,
+        company: str,
+        days: int,
+        now: Optional[datetime] = None
+    ) -> List[SocialMediaMetrics]:
         """Generate realistic mock social media metrics."""
-        social_data = []
+        if now is None:
+            now = datetime.now()
 
         platforms = ["twitter", "stocktwits", "reddit"]
-
-        for platform in platforms:
-            for day in range(min(days, 7)):
-                social_data.append(SocialMediaMetrics(
-                    platform=platform,
-                    timestamp=datetime.now() - timedelta(days=day),
-                    mention_count=random.randint(10, 500),
-                    sentiment_score=random.uniform(-0.5, 0.7),
-                    engagement_score=random.uniform(3.0, 9.0),
-                    trending=random.random() < 0.2,
-                    key_topics=["biotech", "clinical trials", "M&A"]
-                ))
-
-        return social_data
+        num_days = max(0, min(days, 7))
+        n = len(platforms) * num_days
+
+        mention_count = self._rng.integers(10, 501, n).tolist()
+        sentiment = self._rng.uniform(-0.5, 0.7, n).tolist()
+        engagement = self._rng.uniform(3.0, 9.0, n).tolist()
+        trending = (self._rng.random(n) < 0.2).tolist()
+
+        timestamps = [now - timedelta(days=day) for day in range(num_days)]
+
+        return [
+            SocialMediaMetrics(
+                platform=platform,
+                timestamp=timestamps[day],
+                mention_count=mention_count[i],
+                sentiment_score=sentiment[i],
+                engagement_score=engagement[i],
+                trending=trending[i],
+                key_topics=["biotech", "clinical trials", "M&A"]
+            )
+            for i, (platform, day) in enumerate(product(platforms, range(num_days)))
+        ]
@@ -7,10 +7,13 @@ and development pipelines.
 
 from datetime import date, datetime
 from enum import Enum
-from typing import Optional, List, Dict, Any
+import re
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, field_validator, computed_field, ConfigDict
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, computed_field, ConfigDict
+
+from .types import NonNegDecimal, Score0to10, Ticker
 
 
 class TherapeuticArea(str, Enum):
@@ -44,6 +47,66 @@ class DevelopmentPhase(str, Enum):
     DISCONTINUED = "discontinued"
 
 
+# Plain string values, looked up by dict instead of Enum.value descriptor calls
+_AREA_VALUES: Dict[TherapeuticArea, str] = {area: area.value for area in TherapeuticArea}
+_PHASE_VALUES: Dict[DevelopmentPhase, str] = {phase: phase.value for phase in DevelopmentPhase}
+
+# Development phase score (0-10); higher phase = higher score
+_PHASE_SCORES: Dict[DevelopmentPhase, float] = {
+    DevelopmentPhase.DISCOVERY: 1.0,
+    DevelopmentPhase.PRECLINICAL: 2.0,
+    DevelopmentPhase.PHASE_1: 3.5,
+    DevelopmentPhase.PHASE_1_2: 4.5,
+    DevelopmentPhase.PHASE_2: 6.0,
+    DevelopmentPhase.PHASE_2_3: 7.5,
+    DevelopmentPhase.PHASE_3: 8.5,
+    DevelopmentPhase.NDA_BLA: 9.5,
+    DevelopmentPhase.APPROVED: 10.0,
+    DevelopmentPhase.DISCONTINUED: 0.0,
+}
+
+# Clinical stages (Phase 1-3)
+_CLINICAL_PHASES = frozenset({
+    DevelopmentPhase.PHASE_1,
+    DevelopmentPhase.PHASE_1_2,
+    DevelopmentPhase.PHASE_2,
+    DevelopmentPhase.PHASE_2_3,
+    DevelopmentPhase.PHASE_3,
+})
+
+# Late-stage development (Phase 2 and beyond)
+_LATE_PHASES = frozenset({
+    DevelopmentPhase.PHASE_2,
+    DevelopmentPhase.PHASE_2_3,
+    DevelopmentPhase.PHASE_3,
+    DevelopmentPhase.NDA_BLA,
+})
+
+# One bit per phase, so a phase is categorized with a single int AND
+_PHASE_BITS: Dict[DevelopmentPhase, int] = {
+    phase: 1 << i for i, phase in enumerate(DevelopmentPhase)
+}
+_CLINICAL_MASK = sum(_PHASE_BITS[phase] for phase in _CLINICAL_PHASES)
+_LATE_MASK = sum(_PHASE_BITS[phase] for phase in _LATE_PHASES)
+_APPROVED_MASK = _PHASE_BITS[DevelopmentPhase.APPROVED]
+_ACTIVE_MASK = sum(_PHASE_BITS.values()) & ~_PHASE_BITS[DevelopmentPhase.DISCONTINUED]
+
+
+# Canonical milestone quarter (YYYY-QN, any case); other spellings take
+# the general parsing path in DrugCandidate.validate_milestone_date
+_MILESTONE_QUARTER_RE = re.compile(r"(\d{4})-Q([1-4])", re.ASCII | re.IGNORECASE)
+
+
+def _years_until(expiry: Optional[date], today_ordinal: int) -> Optional[float]:
+    """Years from a day ordinal until ``expiry``, floored at 0.0."""
+    if expiry is None:
+        return None
+    days = expiry.toordinal() - today_ordinal
+    if days <= 0:
+        return 0.0
+    return round(days / 365.25, 2)
+
+
 class DrugCandidate(BaseModel):
     """
     Represents a single drug candidate in development.
@@ -86,10 +149,8 @@ class DrugCandidate(BaseModel):
     next_milestone: Optional[str] = Field(None, description="Description of next major milestone")
     next_milestone_date: Optional[str] = Field(None, description="Expected date of next milestone (YYYY-MM-DD or YYYY-QN)")
 
-    competitive_landscape_score: float = Field(
+    competitive_landscape_score: Score0to10 = Field(
         5.0,
-        ge=0.0,
-        le=10.0,
         description="Competitive advantage score (0-10)"
     )
     market_potential_usd: Optional[Decimal] = Field(
@@ -119,6 +180,13 @@ class DrugCandidate(BaseModel):
 
         v = v.strip()
 
+        # Fast path: canonical quarter format, matched in one regex call
+        match = _MILESTONE_QUARTER_RE.fullmatch(v)
+        if match:
+            if not 2000 <= int(match[1]) <= 2100:
+                raise ValueError("Invalid quarter format: Year must be between 2000 and 2100")
+            return v.upper()
+
         # Check for quarter format (YYYY-QN)
         if "Q" in v.upper():
             parts = v.upper().split("-Q")
@@ -142,6 +210,24 @@ class DrugCandidate(BaseModel):
         except ValueError:
             raise ValueError("Date must be in YYYY-MM-DD or YYYY-QN format")
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "DrugCandidate":
+        """
+        Build a drug candidate from already-validated data without validation.
+
+        Only for data that previously passed validation, e.g. a
+        ``model_dump()`` read back from a cache or DB hydration. Values must
+        already be the field types (enums, dates, Decimal); API and user
+        input must go through the normal constructor.
+
+        Args:
+            data: Field values keyed by field name
+
+        Returns:
+            Unvalidated DrugCandidate
+        """
+        return cls.model_construct(**data)
+
     @computed_field
     @property
     def has_regulatory_designation(self) -> bool:
@@ -155,49 +241,72 @@ class DrugCandidate(BaseModel):
         Numeric score based on development phase (0-10).
         Higher phase = higher score.
         """
-        phase_scores = {
-            DevelopmentPhase.DISCOVERY: 1.0,
-            DevelopmentPhase.PRECLINICAL: 2.0,
-            DevelopmentPhase.PHASE_1: 3.5,
-            DevelopmentPhase.PHASE_1_2: 4.5,
-            DevelopmentPhase.PHASE_2: 6.0,
-            DevelopmentPhase.PHASE_2_3: 7.5,
-            DevelopmentPhase.PHASE_3: 8.5,
-            DevelopmentPhase.NDA_BLA: 9.5,
-            DevelopmentPhase.APPROVED: 10.0,
-            DevelopmentPhase.DISCONTINUED: 0.0,
-        }
-        return phase_scores.get(self.phase, 0.0)
+        return _PHASE_SCORES.get(self.phase, 0.0)
 
     @computed_field
     @property
     def patent_years_remaining(self) -> Optional[float]:
         """Calculate years remaining until patent expiry."""
-        if self.patent_expiry is None:
-            return None
-
-        today = date.today()
-        if self.patent_expiry < today:
-            return 0.0
-
-        delta = self.patent_expiry - today
-        return round(delta.days / 365.25, 2)
+        return _years_until(self.patent_expiry, date.today().toordinal())
 
     def to_summary(self) -> str:
         """Generate a brief text summary of the drug candidate."""
-        summary = f"{self.name} ({self.phase.value}): {self.indication}"
-        if self.has_regulatory_designation:
+        summary = f"{self.name} ({_PHASE_VALUES[self.phase]}): {self.indication}"
+        # Read each flag once instead of again via has_regulatory_designation
+        orphan, fast_track, breakthrough = (
+            self.orphan_designation, self.fast_track, self.breakthrough_therapy
+        )
+        if orphan or fast_track or breakthrough:
             designations = []
-            if self.orphan_designation:
+            if orphan:
                 designations.append("Orphan")
-            if self.fast_track:
+            if fast_track:
                 designations.append("Fast Track")
-            if self.breakthrough_therapy:
+            if breakthrough:
                 designations.append("Breakthrough")
             summary += f" [{', '.join(designations)}]"
         return summary
 
 
+def _is_short_runway(runway_quarters: Optional[float]) -> bool:
+    """Whether a cash runway is under 4 quarters (1 year); unknown is not short."""
+    return runway_quarters is not None and runway_quarters < 4.0
+
+
+class _PipelineStats(NamedTuple):
+    """Pipeline-level counters gathered in one pass over the drugs."""
+    total: int
+    active: int
+    clinical: int
+    late: int
+    approved: int
+    therapeutic_diversity: int
+    active_phase_score_sum: float
+    market_potential_usd: Optional[Decimal]
+    by_phase: Dict[DevelopmentPhase, List["DrugCandidate"]]
+    by_area: Dict[TherapeuticArea, List["DrugCandidate"]]
+
+
+class _StatsMemo:
+    """
+    Memo slot for Pipeline._compute_stats.
+
+    All memos compare equal, so whether a pipeline has computed its stats
+    yet never affects model equality.
+    """
+
+    __slots__ = ("key", "stats")
+
+    def __init__(self) -> None:
+        self.key: Optional[Tuple[Tuple[Any, ...], ...]] = None
+        self.stats: Optional[_PipelineStats] = None
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _StatsMemo)
+
+    __hash__ = None
+
+
 class Pipeline(BaseModel):
     """
     Represents a company's drug development pipeline.
@@ -215,20 +324,99 @@ class Pipeline(BaseModel):
         }
     )
 
-    company_ticker: str = Field(..., description="Company ticker symbol")
+    company_ticker: Ticker = Field(..., description="Company ticker symbol")
     drugs: List[DrugCandidate] = Field(default_factory=list, description="List of drug candidates")
     last_updated: datetime = Field(
         default_factory=datetime.utcnow,
         description="Last pipeline update timestamp"
     )
 
-    @field_validator("company_ticker")
+    # Memoized _compute_stats() result and the drug fields it was built from
+    _stats_memo: _StatsMemo = PrivateAttr(default_factory=_StatsMemo)
+
     @classmethod
-    def validate_ticker(cls, v: str) -> str:
-        """Validate and normalize ticker symbol."""
-        if not v or not v.strip():
-            raise ValueError("Ticker cannot be empty")
-        return v.strip().upper()
+    def from_trusted(cls, data: Dict[str, Any]) -> "Pipeline":
+        """
+        Build a pipeline from already-validated data without validation.
+
+        Nested drug dicts are built with DrugCandidate.from_trusted. See
+        DrugCandidate.from_trusted for when this is safe to use.
+
+        Args:
+            data: Field values keyed by field name
+
+        Returns:
+            Unvalidated Pipeline
+        """
+        data = dict(data)
+        if "drugs" in data:
+            data["drugs"] = [
+                DrugCandidate.from_trusted(drug) if isinstance(drug, dict) else drug
+                for drug in data["drugs"]
+            ]
+        return cls.model_construct(**data)
+
+    def _compute_stats(self) -> _PipelineStats:
+        """
+        Gather every pipeline counter in a single pass over the drugs.
+
+        The result is memoized against the identity, phase, therapeutic
+        area and market potential of every drug, so changing the list or
+        editing one of those fields on a drug in place recomputes it.
+        """
+        memo = self._stats_memo
+        key = tuple(
+            (id(drug), drug.phase, drug.therapeutic_area, drug.market_potential_usd)
+            for drug in self.drugs
+        )
+        if memo.stats is not None and key == memo.key:
+            return memo.stats
+
+        active = clinical = late = approved = 0
+        active_phase_score_sum = 0.0
+        market_potential = 0
+        has_market_potential = False
+        by_phase: Dict[DevelopmentPhase, List[DrugCandidate]] = {}
+        by_area: Dict[TherapeuticArea, List[DrugCandidate]] = {}
+
+        for drug in self.drugs:
+            phase = drug.phase
+            by_phase.setdefault(phase, []).append(drug)
+            by_area.setdefault(drug.therapeutic_area, []).append(drug)
+            # Discontinued drugs score 0.0, so adding every drug's score in
+            # order gives exactly the active-candidate sum
+            active_phase_score_sum += _PHASE_SCORES.get(phase, 0.0)
+            if drug.market_potential_usd is not None:
+                market_potential += drug.market_potential_usd
+                has_market_potential = True
+
+        # Stage counts per phase bucket rather than per drug
+        for phase, phase_drugs in by_phase.items():
+            bit = _PHASE_BITS.get(phase, 0)
+            count = len(phase_drugs)
+            if bit & _ACTIVE_MASK:
+                active += count
+            if bit & _CLINICAL_MASK:
+                clinical += count
+            if bit & _LATE_MASK:
+                late += count
+            if bit & _APPROVED_MASK:
+                approved += count
+
+        memo.stats = _PipelineStats(
+            total=len(self.drugs),
+            active=active,
+            clinical=clinical,
+            late=late,
+            approved=approved,
+            therapeutic_diversity=len(by_area),
+            active_phase_score_sum=active_phase_score_sum,
+            market_potential_usd=market_potential if has_market_potential else None,
+            by_phase=by_phase,
+            by_area=by_area,
+        )
+        memo.key = key
+        return memo.stats
 
     @computed_field
     @property
@@ -240,66 +428,51 @@ class Pipeline(BaseModel):
     @property
     def active_candidates(self) -> int:
         """Number of active (non-discontinued) candidates."""
-        return sum(1 for drug in self.drugs if drug.phase != DevelopmentPhase.DISCONTINUED)
+        return self._compute_stats().active
 
     @computed_field
     @property
     def clinical_stage_count(self) -> int:
         """Number of candidates in clinical stages (Phase 1-3)."""
-        clinical_phases = {
-            DevelopmentPhase.PHASE_1,
-            DevelopmentPhase.PHASE_1_2,
-            DevelopmentPhase.PHASE_2,
-            DevelopmentPhase.PHASE_2_3,
-            DevelopmentPhase.PHASE_3,
-        }
-        return sum(1 for drug in self.drugs if drug.phase in clinical_phases)
+        return self._compute_stats().clinical
 
     @computed_field
     @property
     def late_stage_count(self) -> int:
         """Number of candidates in late-stage development (Phase 2 and beyond)."""
-        late_phases = {
-            DevelopmentPhase.PHASE_2,
-            DevelopmentPhase.PHASE_2_3,
-            DevelopmentPhase.PHASE_3,
-            DevelopmentPhase.NDA_BLA,
-        }
-        return sum(1 for drug in self.drugs if drug.phase in late_phases)
+        return self._compute_stats().late
 
     @computed_field
     @property
     def approved_count(self) -> int:
         """Number of approved drugs."""
-        return sum(1 for drug in self.drugs if drug.phase == DevelopmentPhase.APPROVED)
+        return self._compute_stats().approved
 
     @computed_field
     @property
     def therapeutic_diversity(self) -> int:
-        """Number of unique therapeutic areas in pipeline."""
-        return len(set(drug.therapeutic_area for drug in self.drugs))
+        """
+        Number of unique therapeutic areas in pipeline.
+
+        This is the number of area buckets built by the stats pass, so no
+        separate set of areas is materialized.
+        """
+        return self._compute_stats().therapeutic_diversity
 
     @computed_field
     @property
     def average_phase_score(self) -> float:
         """Average development phase score across all active candidates."""
-        active = [drug for drug in self.drugs if drug.phase != DevelopmentPhase.DISCONTINUED]
-        if not active:
+        stats = self._compute_stats()
+        if not stats.active:
             return 0.0
-        return round(sum(drug.phase_score for drug in active) / len(active), 2)
+        return round(stats.active_phase_score_sum / stats.active, 2)
 
     @computed_field
     @property
     def total_market_potential_usd(self) -> Optional[Decimal]:
         """Total estimated market potential across all candidates."""
-        potentials = [
-            drug.market_potential_usd
-            for drug in self.drugs
-            if drug.market_potential_usd is not None
-        ]
-        if not potentials:
-            return None
-        return sum(potentials)
+        return self._compute_stats().market_potential_usd
 
     @computed_field
     @property
@@ -316,22 +489,44 @@ class Pipeline(BaseModel):
         if not self.drugs:
             return 0.0
 
+        stats = self._compute_stats()
+
         # Component scores
-        clinical_score = min(self.clinical_stage_count / 5.0, 1.0) * 3.0
-        late_stage_score = min(self.late_stage_count / 3.0, 1.0) * 3.0
+        clinical_score = min(stats.clinical / 5.0, 1.0) * 3.0
+        late_stage_score = min(stats.late / 3.0, 1.0) * 3.0
         phase_score = (self.average_phase_score / 10.0) * 2.5
-        diversity_score = min(self.therapeutic_diversity / 3.0, 1.0) * 1.5
+        diversity_score = min(stats.therapeutic_diversity / 3.0, 1.0) * 1.5
 
         total = clinical_score + late_stage_score + phase_score + diversity_score
         return round(min(total, 10.0), 2)
 
     def get_drugs_by_phase(self, phase: DevelopmentPhase) -> List[DrugCandidate]:
         """Get all drugs in a specific development phase."""
-        return [drug for drug in self.drugs if drug.phase == phase]
+        try:
+            phase = DevelopmentPhase(phase)
+        except ValueError:
+            return []
+        return list(self._compute_stats().by_phase.get(phase, ()))
 
     def get_drugs_by_therapeutic_area(self, area: TherapeuticArea) -> List[DrugCandidate]:
         """Get all drugs in a specific therapeutic area."""
-        return [drug for drug in self.drugs if drug.therapeutic_area == area]
+        try:
+            area = TherapeuticArea(area)
+        except ValueError:
+            return []
+        return list(self._compute_stats().by_area.get(area, ()))
+
+    def get_patent_years_remaining(self) -> Dict[str, Optional[float]]:
+        """Years of patent protection left for each drug, keyed by name.
+
+        Reads today's date once for the whole pipeline rather than once
+        per drug.
+        """
+        today_ordinal = date.today().toordinal()
+        return {
+            drug.name: _years_until(drug.patent_expiry, today_ordinal)
+            for drug in self.drugs
+        }
 
 
 class Company(BaseModel):
@@ -358,17 +553,16 @@ class Company(BaseModel):
         }
     )
 
-    ticker: str = Field(..., description="Stock ticker symbol")
+    ticker: Ticker = Field(..., description="Stock ticker symbol")
     name: str = Field(..., description="Company name")
 
-    market_cap_usd: Decimal = Field(..., ge=0, description="Market capitalization in USD")
-    cash_position_usd: Decimal = Field(..., ge=0, description="Cash and equivalents in USD")
-    quarterly_burn_rate_usd: Optional[Decimal] = Field(
+    market_cap_usd: NonNegDecimal = Field(..., description="Market capitalization in USD")
+    cash_position_usd: NonNegDecimal = Field(..., description="Cash and equivalents in USD")
+    quarterly_burn_rate_usd: Optional[NonNegDecimal] = Field(
         None,
-        ge=0,
         description="Average quarterly cash burn rate in USD"
     )
-    total_debt_usd: Decimal = Field(default=Decimal(0), ge=0, description="Total debt in USD")
+    total_debt_usd: NonNegDecimal = Field(default=Decimal(0), description="Total debt in USD")
 
     therapeutic_areas: List[TherapeuticArea] = Field(
         default_factory=list,
@@ -395,13 +589,10 @@ class Company(BaseModel):
     @field_validator("ticker")
     @classmethod
     def validate_ticker(cls, v: str) -> str:
-        """Validate and normalize ticker symbol."""
-        if not v or not v.strip():
-            raise ValueError("Ticker cannot be empty")
-        ticker = v.strip().upper()
-        if len(ticker) > 10:
+        """Limit ticker length; Ticker has already stripped and upper-cased it."""
+        if len(v) > 10:
             raise ValueError("Ticker symbol too long")
-        return ticker
+        return v
 
     @field_validator("name")
     @classmethod
@@ -414,8 +605,27 @@ class Company(BaseModel):
     @field_validator("therapeutic_areas")
     @classmethod
     def validate_therapeutic_areas(cls, v: List[TherapeuticArea]) -> List[TherapeuticArea]:
-        """Remove duplicates from therapeutic areas."""
-        return list(set(v))
+        """Remove duplicates from therapeutic areas, keeping first-seen order."""
+        return list(dict.fromkeys(v))
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Company":
+        """
+        Build a company from already-validated data without validation.
+
+        A nested pipeline dict is built with Pipeline.from_trusted. See
+        DrugCandidate.from_trusted for when this is safe to use.
+
+        Args:
+            data: Field values keyed by field name
+
+        Returns:
+            Unvalidated Company
+        """
+        data = dict(data)
+        if isinstance(data.get("pipeline"), dict):
+            data["pipeline"] = Pipeline.from_trusted(data["pipeline"])
+        return cls.model_construct(**data)
 
     @computed_field
     @property
@@ -425,10 +635,12 @@ class Company(BaseModel):
 
         Returns None if burn rate is not available or is zero.
         """
-        if not self.quarterly_burn_rate_usd or self.quarterly_burn_rate_usd == 0:
+        burn_rate = self.quarterly_burn_rate_usd
+        if not burn_rate:
+            # Decimal zero is falsy, so this also covers a zero burn rate
             return None
 
-        return round(float(self.cash_position_usd / self.quarterly_burn_rate_usd), 2)
+        return round(float(self.cash_position_usd / burn_rate), 2)
 
     @computed_field
     @property
@@ -444,9 +656,7 @@ class Company(BaseModel):
 
         Returns True if runway is less than 4 quarters (1 year).
         """
-        if self.runway_quarters is None:
-            return False
-        return self.runway_quarters < 4.0
+        return _is_short_runway(self.runway_quarters)
 
     @computed_field
     @property
@@ -454,7 +664,7 @@ class Company(BaseModel):
         """Calculate company age in years."""
         if self.founded_year is None:
             return None
-        return datetime.now().year - self.founded_year
+        return date.today().year - self.founded_year
 
     @computed_field
     @property
@@ -464,41 +674,78 @@ class Company(BaseModel):
 
         Higher ratio indicates pipeline may be undervalued.
         """
-        if (
-            self.pipeline is None
-            or self.pipeline.total_market_potential_usd is None
-            or self.market_cap_usd == 0
-        ):
+        pipeline = self.pipeline
+        if pipeline is None:
+            return None
+        market_potential = pipeline.total_market_potential_usd
+        market_cap = self.market_cap_usd
+        if market_potential is None or not market_cap:
             return None
 
-        ratio = float(self.pipeline.total_market_potential_usd / self.market_cap_usd)
+        ratio = float(market_potential / market_cap)
         return round(ratio, 2)
 
     def to_summary(self) -> Dict[str, Any]:
         """Generate a summary dictionary of key company metrics."""
+        runway_quarters = self.runway_quarters
+        pipeline = self.pipeline
+        if pipeline:
+            pipeline_drugs = pipeline.total_candidates
+            pipeline_strength = pipeline.pipeline_strength_score
+        else:
+            pipeline_drugs = 0
+            pipeline_strength = 0.0
         return {
             "ticker": self.ticker,
             "name": self.name,
             "market_cap_usd": float(self.market_cap_usd),
             "cash_position_usd": float(self.cash_position_usd),
-            "runway_quarters": self.runway_quarters,
-            "is_cash_constrained": self.is_cash_constrained,
-            "therapeutic_areas": [area.value for area in self.therapeutic_areas],
-            "pipeline_drugs": self.pipeline.total_candidates if self.pipeline else 0,
-            "pipeline_strength": self.pipeline.pipeline_strength_score if self.pipeline else 0.0,
+            "runway_quarters": runway_quarters,
+            "is_cash_constrained": _is_short_runway(runway_quarters),
+            "therapeutic_areas": [_AREA_VALUES[area] for area in self.therapeutic_areas],
+            "pipeline_drugs": pipeline_drugs,
+            "pipeline_strength": pipeline_strength,
             "last_updated": self.last_updated.isoformat(),
         }
 
-    def serialize_for_api(self) -> Dict[str, Any]:
-        """Serialize company data for API responses."""
-        data = self.model_dump(mode="json")
+    def serialize_for_api(self, include_computed: bool = True) -> Dict[str, Any]:
+        """
+        Serialize company data for API responses.
+
+        JSON mode renders Decimal as a string, so the monetary fields are
+        overwritten with floats in place, keeping the key order of the dump.
+
+        Args:
+            include_computed: Whether to evaluate and include computed fields
+                of the company, its pipeline and each drug. Pass False when
+                only the stored fields are needed to skip that work.
+
+        Returns:
+            JSON-compatible dictionary
+        """
+        data = self.model_dump(
+            mode="json",
+            exclude=None if include_computed else _COMPUTED_FIELDS_EXCLUDE,
+        )
 
         # Convert Decimal to float for JSON serialization
         data["market_cap_usd"] = float(self.market_cap_usd)
         data["cash_position_usd"] = float(self.cash_position_usd)
         data["total_debt_usd"] = float(self.total_debt_usd)
 
-        if self.quarterly_burn_rate_usd:
-            data["quarterly_burn_rate_usd"] = float(self.quarterly_burn_rate_usd)
+        burn_rate = self.quarterly_burn_rate_usd
+        if burn_rate:
+            data["quarterly_burn_rate_usd"] = float(burn_rate)
 
         return data
+
+
+# model_dump exclude spec dropping every computed field, nested through the
+# pipeline and its drugs; used by Company.serialize_for_api
+_COMPUTED_FIELDS_EXCLUDE: Dict[str, Any] = {
+    **dict.fromkeys(Company.model_computed_fields, True),
+    "pipeline": {
+        **dict.fromkeys(Pipeline.model_computed_fields, True),
+        "drugs": {"__all__": dict.fromkeys(DrugCandidate.model_computed_fields, True)},
+    },
+}
@@ -0,0 +1,257 @@
+"""
+Batch aggregation of pipeline metrics over columnar drug arrays.
+
+Pipeline computes its metrics one model at a time by walking its
+DrugCandidate objects. When thousands of pipelines are scored together,
+the drugs are instead lowered into flat structure-of-arrays columns (one
+small integer or float per drug, pipelines delimited by offsets) and all
+pipeline counters are gathered in one pass, compiled with numba when it
+is installed. Contiguous per-field columns keep the inner loop free of
+Python objects, which is what lets numba vectorize it.
+"""
+
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; pipelines are aggregated with NumPy
+    njit = None
+    prange = range
+
+from .company import (
+    DevelopmentPhase,
+    Pipeline,
+    TherapeuticArea,
+    _ACTIVE_MASK,
+    _APPROVED_MASK,
+    _CLINICAL_MASK,
+    _LATE_MASK,
+    _PHASE_BITS,
+    _PHASE_SCORES,
+)
+
+
+# Small-integer codes for the enum columns, in declaration order
+_PHASE_ORD = {phase: i for i, phase in enumerate(DevelopmentPhase)}
+_AREA_ORD = {area: i for i, area in enumerate(TherapeuticArea)}
+_NUM_AREAS = len(_AREA_ORD)
+
+# Per-phase tables indexed by phase code
+_PHASE_BIT_TABLE = np.array([_PHASE_BITS[phase] for phase in DevelopmentPhase], dtype=np.int64)
+_PHASE_SCORE_TABLE = np.array(
+    [_PHASE_SCORES[phase] for phase in DevelopmentPhase], dtype=np.float64
+)
+
+# One row per pipeline; mirrors the Pipeline computed fields
+PIPELINE_STATS_DTYPE = np.dtype([
+    ("total_candidates", "i8"),
+    ("active_candidates", "i8"),
+    ("clinical_stage_count", "i8"),
+    ("late_stage_count", "i8"),
+    ("approved_count", "i8"),
+    ("therapeutic_diversity", "i8"),
+    ("average_phase_score", "f8"),
+    ("pipeline_strength_score", "f8"),
+    ("total_market_potential_usd", "f8"),  # NaN when no drug has an estimate
+])
+
+
+def _aggregate_kernel(
+    offsets: np.ndarray,
+    phase_ord: np.ndarray,
+    area_ord: np.ndarray,
+    market_potential: np.ndarray,
+    has_market_potential: np.ndarray,
+    phase_bits: np.ndarray,
+    phase_scores: np.ndarray,
+    clinical_mask: int,
+    late_mask: int,
+    approved_mask: int,
+    active_mask: int,
+    counts: np.ndarray,
+    sums: np.ndarray,
+    has_any: np.ndarray,
+) -> None:
+    """
+    Fill per-pipeline counters in one pass over the drug columns.
+
+    counts rows are (active, clinical, late, approved, diversity); sums
+    rows are (phase score sum, market potential). Therapeutic diversity is
+    the popcount of an OR-ed area bitmask. Compiled with numba (parallel
+    over pipelines) when it is installed.
+    """
+    for p in prange(offsets.shape[0] - 1):
+        active = clinical = late = approved = 0
+        area_mask = 0
+        score_sum = 0.0
+        market = 0.0
+        has = False
+        for i in range(offsets[p], offsets[p + 1]):
+            bit = phase_bits[phase_ord[i]]
+            active += (bit & active_mask) != 0
+            clinical += (bit & clinical_mask) != 0
+            late += (bit & late_mask) != 0
+            approved += (bit & approved_mask) != 0
+            area_mask |= np.int64(1) << area_ord[i]
+            # Discontinued drugs score 0.0, so this is the active sum
+            score_sum += phase_scores[phase_ord[i]]
+            if has_market_potential[i]:
+                market += market_potential[i]
+                has = True
+        diversity = 0
+        while area_mask:
+            area_mask &= area_mask - 1
+            diversity += 1
+        counts[p, 0] = active
+        counts[p, 1] = clinical
+        counts[p, 2] = late
+        counts[p, 3] = approved
+        counts[p, 4] = diversity
+        sums[p, 0] = score_sum
+        sums[p, 1] = market
+        has_any[p] = has
+
+
+if njit is not None:
+    _aggregate_kernel = njit(cache=True, parallel=True)(_aggregate_kernel)
+
+
+def _round2(values: np.ndarray) -> np.ndarray:
+    """Python's round(x, 2) elementwise; np.round can differ on near-halfway values."""
+    return np.fromiter((round(x, 2) for x in values.tolist()), np.float64, values.shape[0])
+
+
+class PipelineArrays(NamedTuple):
+    """
+    Drugs of many pipelines as flat columns.
+
+    The drugs of pipeline ``p`` occupy ``offsets[p]:offsets[p + 1]`` of
+    every column. Unknown market potentials are stored as 0.0 with
+    ``has_market_potential`` False.
+    """
+    offsets: np.ndarray
+    phase_ord: np.ndarray
+    area_ord: np.ndarray
+    market_potential: np.ndarray
+    has_market_potential: np.ndarray
+
+    @classmethod
+    def from_pipelines(cls, pipelines: Sequence[Pipeline]) -> "PipelineArrays":
+        """
+        Lower pipelines into columnar arrays.
+
+        Args:
+            pipelines: Pipelines to flatten, in output order
+
+        Returns:
+            PipelineArrays covering every drug of every pipeline
+        """
+        offsets = np.zeros(len(pipelines) + 1, dtype=np.int64)
+        np.cumsum([len(pipeline.drugs) for pipeline in pipelines], out=offsets[1:])
+        drugs = [drug for pipeline in pipelines for drug in pipeline.drugs]
+        n = len(drugs)
+        potentials = [drug.market_potential_usd for drug in drugs]
+        return cls(
+            offsets=offsets,
+            phase_ord=np.fromiter((_PHASE_ORD[drug.phase] for drug in drugs), np.int8, n),
+            area_ord=np.fromiter(
+                (_AREA_ORD[drug.therapeutic_area] for drug in drugs), np.int8, n
+            ),
+            market_potential=np.fromiter(
+                (0.0 if value is None else float(value) for value in potentials),
+                np.float64,
+                n,
+            ),
+            has_market_potential=np.fromiter(
+                (value is not None for value in potentials), np.bool_, n
+            ),
+        )
+
+    def _aggregate_numpy(self, counts: np.ndarray, sums: np.ndarray, has_any: np.ndarray) -> None:
+        """NumPy equivalent of _aggregate_kernel, used without numba."""
+        n_pipelines = counts.shape[0]
+        pipeline_idx = np.repeat(np.arange(n_pipelines), np.diff(self.offsets))
+        bits = _PHASE_BIT_TABLE[self.phase_ord]
+        for column, mask in enumerate((_ACTIVE_MASK, _CLINICAL_MASK, _LATE_MASK, _APPROVED_MASK)):
+            counts[:, column] = np.bincount(
+                pipeline_idx[(bits & mask) != 0], minlength=n_pipelines
+            )
+        # Distinct (pipeline, area) pairs, counted per pipeline
+        pairs = np.unique(pipeline_idx * _NUM_AREAS + self.area_ord)
+        counts[:, 4] = np.bincount(pairs // _NUM_AREAS, minlength=n_pipelines)
+        sums[:, 0] = np.bincount(
+            pipeline_idx, weights=_PHASE_SCORE_TABLE[self.phase_ord], minlength=n_pipelines
+        )
+        sums[:, 1] = np.bincount(
+            pipeline_idx, weights=self.market_potential, minlength=n_pipelines
+        )
+        has_any[:] = np.bincount(
+            pipeline_idx[self.has_market_potential], minlength=n_pipelines
+        ) > 0
+
+    def aggregate(self) -> np.ndarray:
+        """
+        Compute pipeline metrics for every pipeline at once.
+
+        Returns:
+            Structured array of PIPELINE_STATS_DTYPE, one row per pipeline.
+            Values match the Pipeline computed fields, except that market
+            potential is summed in float64 rather than Decimal.
+        """
+        n_pipelines = self.offsets.shape[0] - 1
+        counts = np.zeros((n_pipelines, 5), dtype=np.int64)
+        sums = np.zeros((n_pipelines, 2), dtype=np.float64)
+        has_any = np.zeros(n_pipelines, dtype=np.bool_)
+        if njit is not None:
+            _aggregate_kernel(
+                self.offsets, self.phase_ord, self.area_ord,
+                self.market_potential, self.has_market_potential,
+                _PHASE_BIT_TABLE, _PHASE_SCORE_TABLE,
+                _CLINICAL_MASK, _LATE_MASK, _APPROVED_MASK, _ACTIVE_MASK,
+                counts, sums, has_any,
+            )
+        else:
+            self._aggregate_numpy(counts, sums, has_any)
+
+        out = np.zeros(n_pipelines, dtype=PIPELINE_STATS_DTYPE)
+        total = np.diff(self.offsets)
+        active, clinical, late, approved, diversity = counts.T
+        out["total_candidates"] = total
+        out["active_candidates"] = active
+        out["clinical_stage_count"] = clinical
+        out["late_stage_count"] = late
+        out["approved_count"] = approved
+        out["therapeutic_diversity"] = diversity
+
+        average = np.zeros(n_pipelines, dtype=np.float64)
+        np.divide(sums[:, 0], active, out=average, where=active > 0)
+        average = _round2(average)
+        out["average_phase_score"] = average
+
+        strength = (
+            np.minimum(clinical / 5.0, 1.0) * 3.0
+            + np.minimum(late / 3.0, 1.0) * 3.0
+            + (average / 10.0) * 2.5
+            + np.minimum(diversity / 3.0, 1.0) * 1.5
+        )
+        out["pipeline_strength_score"] = np.where(
+            total > 0, _round2(np.minimum(strength, 10.0)), 0.0
+        )
+        out["total_market_potential_usd"] = np.where(has_any, sums[:, 1], np.nan)
+        return out
+
+
+def aggregate_pipelines(pipelines: Sequence[Pipeline]) -> np.ndarray:
+    """
+    Compute Pipeline metrics for many pipelines in one batch.
+
+    Args:
+        pipelines: Pipelines to score
+
+    Returns:
+        Structured array of PIPELINE_STATS_DTYPE, one row per pipeline
+        in input order
+    """
+    return PipelineArrays.from_pipelines(pipelines).aggregate()
@@ -0,0 +1,29 @@
+"""
+Reusable constrained field types for the Pydantic models.
+
+Constraints declared once here are compiled into each model's core schema,
+so models share one validator function instead of each defining its own
+field_validator for the same rule.
+"""
+
+from decimal import Decimal
+from typing import Annotated
+
+from pydantic import AfterValidator, Field
+
+
+def _normalize_ticker(v: str) -> str:
+    """Validate and normalize ticker symbol."""
+    if not v or not v.strip():
+        raise ValueError("Ticker cannot be empty")
+    return v.strip().upper()
+
+
+# Non-empty ticker symbol, stripped and upper-cased
+Ticker = Annotated[str, AfterValidator(_normalize_ticker)]
+
+# Monetary amount in USD that cannot be negative
+NonNegDecimal = Annotated[Decimal, Field(ge=0)]
+
+# Score on the 0-10 scale
+Score0to10 = Annotated[float, Field(ge=0.0, le=10.0)]
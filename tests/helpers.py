@@ -0,0 +1,27 @@
+"""
+Shared helpers for the unit tests.
+"""
+
+from contextlib import ExitStack
+from unittest import mock
+
+
+def run_on_each_path(test_case, module, paths, check):
+    """
+    Run ``check`` once per implementation path, each as a subtest.
+
+    Modules that switch between a plain-Python and a vectorized or
+    compiled path on a size threshold or an optional import are forced
+    down each path by patching those module attributes.
+
+    Args:
+        test_case: Running unittest.TestCase
+        module: Module whose attributes select the path
+        paths: Mapping of path name to {attribute: value} overrides
+        check: Callable taking no arguments that makes the assertions
+    """
+    for name, overrides in paths.items():
+        with test_case.subTest(path=name), ExitStack() as stack:
+            for attribute, value in overrides.items():
+                stack.enter_context(mock.patch.object(module, attribute, value))
+            check()
@@ -0,0 +1,193 @@
+"""
+Unit Tests for Company Models
+
+Tests the company, pipeline and drug candidate models, including:
+- Memoized pipeline metrics
+- Batch pipeline aggregation
+- Construction from already-validated data
+"""
+
+import math
+import random
+import unittest
+import sys
+import os
+from datetime import date
+from decimal import Decimal
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.models.pipeline_fast as pipeline_fast
+from src.models.company import (
+    Company,
+    DevelopmentPhase,
+    DrugCandidate,
+    Pipeline,
+    TherapeuticArea,
+)
+from src.models.pipeline_fast import PIPELINE_STATS_DTYPE, aggregate_pipelines
+from tests.helpers import run_on_each_path
+
+
+class PipelineTestCase(unittest.TestCase):
+    """Base class for tests that build pipelines of placeholder drugs."""
+
+    def make_drug(self, name, phase, area=TherapeuticArea.ONCOLOGY, market_potential_usd=None):
+        """Build a drug candidate with placeholder indication and mechanism."""
+        return DrugCandidate(
+            name=name,
+            phase=phase,
+            indication="Test indication",
+            mechanism="Test mechanism",
+            therapeutic_area=area,
+            market_potential_usd=market_potential_usd,
+        )
+
+
+class TestPipelineStats(PipelineTestCase):
+    """Test the memoized pipeline metrics."""
+
+    def test_in_place_drug_edit_recomputes(self):
+        """Test that editing a drug already in the pipeline updates the metrics."""
+        drug = self.make_drug("ABC-1", DevelopmentPhase.PHASE_1)
+        pipeline = Pipeline(
+            company_ticker="ABCD",
+            drugs=[drug, self.make_drug("ABC-2", DevelopmentPhase.PRECLINICAL)],
+        )
+        self.assertEqual(pipeline.late_stage_count, 0)
+        self.assertEqual(pipeline.therapeutic_diversity, 1)
+        self.assertIsNone(pipeline.total_market_potential_usd)
+
+        drug.phase = DevelopmentPhase.PHASE_3
+        drug.therapeutic_area = TherapeuticArea.RARE_DISEASE
+        drug.market_potential_usd = Decimal("1000000")
+
+        self.assertEqual(pipeline.late_stage_count, 1)
+        self.assertEqual(pipeline.therapeutic_diversity, 2)
+        self.assertEqual(pipeline.total_market_potential_usd, Decimal("1000000"))
+        self.assertEqual(pipeline.get_drugs_by_phase(DevelopmentPhase.PHASE_3), [drug])
+
+    def test_list_changes_recompute(self):
+        """Test that adding and removing drugs updates the metrics."""
+        pipeline = Pipeline(company_ticker="ABCD")
+        self.assertEqual(pipeline.active_candidates, 0)
+
+        pipeline.drugs.append(self.make_drug("ABC-1", DevelopmentPhase.APPROVED))
+        self.assertEqual(pipeline.approved_count, 1)
+
+        pipeline.drugs.pop()
+        self.assertEqual(pipeline.approved_count, 0)
+
+
+class TestAggregatePipelines(PipelineTestCase):
+    """Test batch pipeline aggregation against the Pipeline properties."""
+
+    # The NumPy expressions, and the kernel; without numba installed the
+    # kernel runs as plain Python, which still checks its logic
+    PATHS = {"numpy": {"njit": None}, "kernel": {"njit": True}}
+
+    def random_pipeline(self, rng, ticker):
+        """Pipeline of up to 12 random drugs."""
+        return Pipeline(
+            company_ticker=ticker,
+            drugs=[
+                self.make_drug(
+                    f"{ticker}-{i}",
+                    rng.choice(list(DevelopmentPhase)),
+                    rng.choice(list(TherapeuticArea)),
+                    rng.choice([None, Decimal(rng.randint(1, 5000)) * 1000000]),
+                )
+                for i in range(rng.randint(0, 12))
+            ],
+        )
+
+    def test_matches_pipeline_properties(self):
+        """Test every column against the per-pipeline computed fields."""
+        rng = random.Random(0)
+        pipelines = [self.random_pipeline(rng, f"T{i}") for i in range(200)]
+
+        def check():
+            stats = aggregate_pipelines(pipelines)
+
+            self.assertEqual(stats.dtype, PIPELINE_STATS_DTYPE)
+            self.assertEqual(len(stats), len(pipelines))
+            for row, pipeline in zip(stats, pipelines):
+                self.assertEqual(row["total_candidates"], pipeline.total_candidates)
+                self.assertEqual(row["active_candidates"], pipeline.active_candidates)
+                self.assertEqual(row["clinical_stage_count"], pipeline.clinical_stage_count)
+                self.assertEqual(row["late_stage_count"], pipeline.late_stage_count)
+                self.assertEqual(row["approved_count"], pipeline.approved_count)
+                self.assertEqual(row["therapeutic_diversity"], pipeline.therapeutic_diversity)
+                self.assertEqual(row["average_phase_score"], pipeline.average_phase_score)
+                self.assertEqual(row["pipeline_strength_score"], pipeline.pipeline_strength_score)
+                market = pipeline.total_market_potential_usd
+                if market is None:
+                    self.assertTrue(math.isnan(row["total_market_potential_usd"]))
+                else:
+                    self.assertAlmostEqual(
+                        row["total_market_potential_usd"], float(market), delta=1e-6 * float(market)
+                    )
+
+        run_on_each_path(self, pipeline_fast, self.PATHS, check)
+
+    def test_empty_input(self):
+        """Test that no pipelines give an empty table."""
+        def check():
+            self.assertEqual(len(aggregate_pipelines([])), 0)
+
+        run_on_each_path(self, pipeline_fast, self.PATHS, check)
+
+
+class TestFromTrusted(unittest.TestCase):
+    """Test building models from already-validated data."""
+
+    def setUp(self):
+        """Set up a validated company with a one-drug pipeline."""
+        self.company = Company(
+            ticker=" abcd ",
+            name="ABC Therapeutics",
+            market_cap_usd=Decimal("1500000000"),
+            cash_position_usd=Decimal("250000000"),
+            quarterly_burn_rate_usd=Decimal("30000000"),
+            therapeutic_areas=[TherapeuticArea.ONCOLOGY, TherapeuticArea.IMMUNOLOGY],
+            founded_year=2015,
+            pipeline=Pipeline(
+                company_ticker="ABCD",
+                drugs=[
+                    DrugCandidate(
+                        name="ABC-123",
+                        phase=DevelopmentPhase.PHASE_2,
+                        indication="Non-small cell lung cancer",
+                        mechanism="PD-L1 inhibitor",
+                        therapeutic_area=TherapeuticArea.ONCOLOGY,
+                        patent_expiry=date(2038, 6, 15),
+                        market_potential_usd=Decimal("2500000000"),
+                    ),
+                ],
+            ),
+        )
+
+    def test_round_trip_matches_validated_model(self):
+        """Test that a model_dump() read back equals the validated company."""
+        trusted = Company.from_trusted(self.company.model_dump())
+
+        self.assertEqual(trusted, self.company)
+        self.assertIsInstance(trusted.pipeline, Pipeline)
+        self.assertIsInstance(trusted.pipeline.drugs[0], DrugCandidate)
+        self.assertEqual(trusted.to_summary(), self.company.to_summary())
+
+    def test_skips_validation(self):
+        """Test that trusted construction does not normalize values."""
+        trusted = Company.from_trusted({**self.company.model_dump(), "ticker": " abcd "})
+
+        self.assertEqual(trusted.ticker, " abcd ")
+
+
+def run_tests():
+    """Run all tests."""
+    unittest.main(argv=[''], exit=False, verbosity=2)
+
+
+if __name__ == '__main__':
+    run_tests()
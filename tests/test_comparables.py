@@ -0,0 +1,357 @@
+"""
+Unit Tests for Comparable Transaction Analysis
+
+Tests the comparable deal database, including:
+- Implied valuations from comparable deals, singly and in batches
+- Therapeutic area activity
+- Acquisition premium statistics
+- Memoization of analysis results
+- Day-granularity lookback windows
+- Therapeutic area, stage and deal structure enums
+
+Results are checked against the original list-based implementation, on
+both the small-set loops and the NumPy snapshot path.
+"""
+
+import dataclasses
+import random
+import statistics
+import unittest
+import sys
+import os
+from datetime import date, datetime, time, timedelta
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.market.comparables as comparables
+from src.market.comparables import (
+    ComparableDeals,
+    Deal,
+    DealStructure,
+    DevelopmentStage,
+    TherapeuticArea,
+)
+from tests.helpers import run_on_each_path
+
+
+# Both paths of the size-dependent methods: small deal sets use plain
+# loops, larger ones the NumPy snapshot
+PATHS = {
+    "small": {},
+    "vectorized": {"_VALUATION_VECTOR_MIN_DEALS": -1, "_VECTOR_MIN_DEALS": -1},
+}
+
+QUERIES = [
+    (area, stage, peak_sales)
+    for area in TherapeuticArea
+    for stage in DevelopmentStage
+    for peak_sales in (None, 0, 1.5)
+]
+
+
+class ComparablesTestCase(unittest.TestCase):
+    """Base class for tests over randomly generated deal databases."""
+
+    def make_deals(self, n, seed=0):
+        """ComparableDeals holding ``n`` random deals from the last four years."""
+        rng = random.Random(seed)
+        now = datetime.now()
+        return ComparableDeals([
+            Deal(
+                acquirer=f"Acquirer {i}",
+                target=f"Target {i}",
+                announcement_date=now - timedelta(days=rng.randint(0, 1460)),
+                total_value_bn=rng.choice([rng.uniform(0.5, 20.0), 3, 7.5]),
+                upfront_value_bn=rng.uniform(0.1, 0.5),
+                milestone_value_bn=rng.choice([0.0, 1.0]),
+                therapeutic_area=rng.choice(list(TherapeuticArea)[:4]),
+                development_stage=rng.choice(list(DevelopmentStage)[:4]),
+                deal_structure=rng.choice(list(DealStructure)),
+                key_assets=[],
+                premium_to_undisturbed=rng.choice([None, rng.uniform(20.0, 120.0)]),
+                ev_to_peak_sales=rng.choice([None, 0, rng.uniform(1.0, 8.0), 4]),
+            )
+            for i in range(n)
+        ])
+
+    @staticmethod
+    def as_tuple(valuation):
+        return (
+            valuation.low,
+            valuation.median,
+            valuation.high,
+            valuation.methodology,
+            valuation.comparable_count,
+            valuation.confidence_level,
+        )
+
+    def assertValuationsEqual(self, actual, expected):
+        """Compare valuation tuples, allowing float rounding differences."""
+        self.assertEqual(len(actual), len(expected))
+        for got, want in zip(actual, expected):
+            for got_field, want_field in zip(got, want):
+                if isinstance(want_field, float):
+                    self.assertAlmostEqual(got_field, want_field)
+                else:
+                    self.assertEqual(got_field, want_field)
+
+
+class TestImpliedValuation(ComparablesTestCase):
+    """Test calculate_implied_valuation."""
+
+    def list_based_valuation(self, deals, therapeutic_area, development_stage, peak_sales_estimate):
+        """
+        Original calculate_implied_valuation, as (low, median, high,
+        methodology, comparable_count, confidence_level).
+        """
+        comparables_found = deals.find_comparables(
+            therapeutic_area=therapeutic_area, development_stage=development_stage
+        )
+        if len(comparables_found) < 3:
+            comparables_found = deals.find_comparables(therapeutic_area=therapeutic_area)
+        if len(comparables_found) < 3:
+            comparables_found = deals.find_comparables(development_stage=development_stage)
+        if not comparables_found:
+            return (0.5, 2.0, 5.0, "insufficient_comparables", 0, "low")
+
+        values = [d.total_value_bn for d in comparables_found]
+        low, median, high = min(values), statistics.median(values), max(values)
+        methodology = f"comparable_deal_values (n={len(comparables_found)})"
+
+        if peak_sales_estimate and peak_sales_estimate > 0:
+            multiples = [d.ev_to_peak_sales for d in comparables_found if d.ev_to_peak_sales]
+            if multiples:
+                low = peak_sales_estimate * min(multiples)
+                median = peak_sales_estimate * statistics.median(multiples)
+                high = peak_sales_estimate * max(multiples)
+                methodology = f"ev_peak_sales_multiple (n={len(multiples)})"
+
+        if len(comparables_found) >= 5 and peak_sales_estimate:
+            confidence = "high"
+        elif len(comparables_found) >= 3:
+            confidence = "medium"
+        else:
+            confidence = "low"
+
+        return (low, median, high, methodology, len(comparables_found), confidence)
+
+    def test_matches_list_based_implementation(self):
+        """Test parity with the original implementation on both paths."""
+        for n in (0, 2, 10, 60):
+            deals = self.make_deals(n, seed=n)
+            expected = [self.list_based_valuation(deals, *query) for query in QUERIES]
+
+            def check():
+                self.assertValuationsEqual(
+                    [self.as_tuple(deals.calculate_implied_valuation(*query)) for query in QUERIES],
+                    expected,
+                )
+
+            with self.subTest(n=n):
+                run_on_each_path(self, comparables, PATHS, check)
+
+
+class TestImpliedValuationsBatch(ComparablesTestCase):
+    """Test calculate_implied_valuations_batch."""
+
+    def test_matches_single_queries(self):
+        """Test that the batch gives calculate_implied_valuation's results."""
+        for n in (0, 2, 10, 60):
+            deals = self.make_deals(n, seed=n)
+
+            def check():
+                self.assertValuationsEqual(
+                    [self.as_tuple(v) for v in deals.calculate_implied_valuations_batch(QUERIES)],
+                    [self.as_tuple(deals.calculate_implied_valuation(*query)) for query in QUERIES],
+                )
+
+            with self.subTest(n=n):
+                run_on_each_path(self, comparables, PATHS, check)
+
+    def test_empty_batch(self):
+        """Test that an empty batch gives no results."""
+        self.assertEqual(self.make_deals(5).calculate_implied_valuations_batch([]), [])
+
+
+class TestHotTherapeuticAreas(ComparablesTestCase):
+    """Test get_hot_therapeutic_areas."""
+
+    def test_paths_agree(self):
+        """Test that both paths give the same areas, counts and totals."""
+        deals = self.make_deals(60)
+        for months in (1, 6, 12, 36):
+            expected = deals.get_hot_therapeutic_areas(months)
+
+            def check():
+                self.assertEqual(deals.get_hot_therapeutic_areas(months), expected)
+
+            with self.subTest(months=months):
+                run_on_each_path(self, comparables, PATHS, check)
+
+
+class TestPremiumAnalysis(ComparablesTestCase):
+    """Test premium_analysis."""
+
+    def test_matches_statistics_module(self):
+        """Test the median and quartiles against statistics, down to two premiums."""
+        for n in range(2, 40):
+            premiums = [
+                deal.premium_to_undisturbed
+                for deal in self.make_deals(n, seed=n).deals
+                if deal.premium_to_undisturbed
+            ]
+            if len(premiums) < 2:
+                continue
+
+            with self.subTest(premiums=len(premiums)):
+                stats = self.make_deals(n, seed=n).premium_analysis()
+
+                p25, _, p75 = statistics.quantiles(premiums, n=4)
+                self.assertEqual(stats.sample_size, len(premiums))
+                self.assertAlmostEqual(stats.median_premium, statistics.median(premiums))
+                self.assertAlmostEqual(stats.percentile_25, p25)
+                self.assertAlmostEqual(stats.percentile_75, p75)
+
+    def test_two_premiums_extrapolate(self):
+        """Test that two premiums give quartiles outside their range."""
+        deals = self.make_deals(2)
+        deals = ComparableDeals([
+            dataclasses.replace(deal, premium_to_undisturbed=premium)
+            for deal, premium in zip(deals.deals, (96.5, 97.0))
+        ])
+
+        stats = deals.premium_analysis()
+
+        self.assertAlmostEqual(stats.percentile_25, 96.375)
+        self.assertAlmostEqual(stats.percentile_75, 97.125)
+
+    def test_single_premium(self):
+        """Test that one premium is its own median and quartiles."""
+        deal = dataclasses.replace(self.make_deals(1).deals[0], premium_to_undisturbed=42.0)
+
+        stats = ComparableDeals([deal]).premium_analysis()
+
+        self.assertEqual(
+            (stats.percentile_25, stats.median_premium, stats.percentile_75),
+            (42.0, 42.0, 42.0),
+        )
+
+
+class TestMemoization(ComparablesTestCase):
+    """Test the memoized analysis results."""
+
+    def test_premium_analysis_is_immutable(self):
+        """Test that memoized premium statistics cannot be edited."""
+        stats = ComparableDeals().premium_analysis()
+        with self.assertRaises(AttributeError):
+            stats.median_premium = 0.0
+
+    def test_memo_evicts_least_recently_used(self):
+        """Test that a recently read memo entry survives eviction."""
+        deals = ComparableDeals()
+        computed = []
+
+        with mock.patch.object(comparables, "_MEMO_MAX_ENTRIES", 2):
+            for key in ("a", "b", "a", "c", "a"):
+                deals._memoized((key,), lambda key=key: computed.append(key) or key)
+
+        self.assertEqual(computed, ["a", "b", "c"])
+
+    def test_deals_are_read_only(self):
+        """Test that deals can only change through add_deal."""
+        deals = self.make_deals(5)
+
+        self.assertIsInstance(deals.deals, tuple)
+        with self.assertRaises(AttributeError):
+            deals.deals = []
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            deals.deals[0].total_value_bn = 0.0
+
+    def test_add_deal_refreshes_results(self):
+        """Test that every analysis sees a deal added after it was memoized."""
+        deals = self.make_deals(10)
+        before = (
+            deals.find_comparables(),
+            deals.premium_analysis(),
+            deals.get_deal_structure_trends(),
+        )
+        added = dataclasses.replace(
+            deals.deals[0], target="Added", premium_to_undisturbed=500.0,
+            deal_structure=DealStructure.WITH_CVR,
+        )
+
+        deals.add_deal(added)
+
+        self.assertEqual(len(deals.find_comparables()), len(before[0]) + 1)
+        self.assertEqual(deals.premium_analysis().max_premium, 500.0)
+        self.assertEqual(deals.premium_analysis().sample_size, before[1].sample_size + 1)
+        self.assertAlmostEqual(sum(deals.get_deal_structure_trends().values()), 100.0)
+        self.assertNotEqual(deals.get_deal_structure_trends(), before[2])
+
+
+class TestEnums(unittest.TestCase):
+    """Test the string-valued comparables enums."""
+
+    def test_string_values(self):
+        """Test that members round-trip through their string values."""
+        self.assertIs(TherapeuticArea("oncology"), TherapeuticArea.ONCOLOGY)
+        self.assertEqual(DevelopmentStage.PHASE_2.value, "phase_2")
+        self.assertIs(DealStructure("with_cvr"), DealStructure.WITH_CVR)
+
+
+class TestLookbackBoundary(ComparablesTestCase):
+    """Test that lookback windows open at midnight of the boundary day."""
+
+    def setUp(self):
+        """Set up deals either side of midnight three years ago."""
+        today = date.today()
+        try:
+            boundary = today.replace(year=today.year - 3)
+        except ValueError:
+            boundary = today.replace(year=today.year - 3, day=28)
+        midnight = datetime.combine(boundary, time.min)
+
+        template = self.make_deals(1).deals[0]
+        self.inside = dataclasses.replace(template, target="Inside", announcement_date=midnight)
+        self.outside = dataclasses.replace(
+            template, target="Outside", announcement_date=midnight - timedelta(seconds=1)
+        )
+        self.deals = ComparableDeals([self.inside, self.outside])
+
+    def test_find_comparables(self):
+        """Test that a deal earlier on the boundary day is still in the window."""
+        def check():
+            self.assertEqual(self.deals.find_comparables(lookback_years=3), [self.inside])
+
+        run_on_each_path(self, comparables, PATHS, check)
+
+    def test_hot_therapeutic_areas(self):
+        """Test that a 36-month window has the same boundary."""
+        def check():
+            self.assertEqual(
+                self.deals.get_hot_therapeutic_areas(36),
+                [(self.inside.therapeutic_area.value, 1, self.inside.total_value_bn)],
+            )
+
+        run_on_each_path(self, comparables, PATHS, check)
+
+    def test_implied_valuation(self):
+        """Test that valuations count only the deal inside the window."""
+        def check():
+            valuation = self.deals.calculate_implied_valuation(
+                self.inside.therapeutic_area, self.inside.development_stage
+            )
+            self.assertEqual(valuation.comparable_count, 1)
+
+        run_on_each_path(self, comparables, PATHS, check)
+
+
+def run_tests():
+    """Run all tests."""
+    unittest.main(argv=[''], exit=False, verbosity=2)
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,145 @@
+"""
+Unit Tests for Market Signal Observation
+
+Tests the market observation engine, including:
+- Chronological signal recording
+- Signal history retention
+- Watchlist anomaly scans
+- Reproducible mock signals
+
+The engine clock is pinned with tick() so cutoffs are deterministic.
+"""
+
+import dataclasses
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.market.observation import MarketObservationEngine
+
+
+class ObservationTestCase(unittest.TestCase):
+    """Base class for tests against an engine with a pinned clock."""
+
+    NOW = datetime(2025, 6, 2, 16, 0)
+
+    def setUp(self):
+        """Set up an engine with a three-ticker watchlist."""
+        self.engine = MarketObservationEngine()
+        self.engine.tick(self.NOW)
+        for ticker in ("ABCD", "EFGH", "IJKL"):
+            self.engine.add_to_watchlist(ticker)
+
+    def signals_at(self, ticker, days_ago, ma_likely=False):
+        """Mock signals for ``ticker`` stamped ``days_ago`` days before NOW."""
+        return dataclasses.replace(
+            self.engine.generate_mock_signals(ticker, ma_likely=ma_likely),
+            timestamp=self.NOW - timedelta(days=days_ago),
+        )
+
+
+class TestRecordSignals(ObservationTestCase):
+    """Test chronological recording of signals."""
+
+    def test_out_of_order_signals_rejected(self):
+        """Test that signals older than the latest record raise ValueError."""
+        self.engine.record_signals(self.signals_at("ABCD", 1))
+
+        with self.assertRaisesRegex(ValueError, "older than the latest"):
+            self.engine.record_signals(self.signals_at("ABCD", 2))
+
+        self.assertEqual(len(self.engine.get_signal_history("ABCD")), 1)
+
+    def test_equal_timestamps_accepted(self):
+        """Test that a record at the latest timestamp is appended."""
+        first = self.signals_at("ABCD", 1)
+        second = self.signals_at("ABCD", 1)
+        self.engine.record_signals(first)
+        self.engine.record_signals(second)
+
+        self.assertEqual(self.engine.get_signal_history("ABCD"), [first, second])
+        self.assertIs(self.engine.get_latest_signals("ABCD"), second)
+
+    def test_other_tickers_are_independent(self):
+        """Test that ordering is enforced per ticker."""
+        self.engine.record_signals(self.signals_at("ABCD", 1))
+        self.engine.record_signals(self.signals_at("EFGH", 5))
+
+        self.assertIsNotNone(self.engine.get_latest_signals("EFGH"))
+
+
+class TestSignalRetention(ObservationTestCase):
+    """Test pruning of expired signals."""
+
+    def test_expired_signals_pruned(self):
+        """Test that signals older than 90 days are dropped."""
+        self.engine.record_signals(self.signals_at("ABCD", 120))
+        self.engine.record_signals(self.signals_at("ABCD", 30))
+
+        self.assertEqual(len(self.engine.signals_cache["ABCD"]), 1)
+        self.assertEqual(
+            self.engine.get_signal_history("ABCD", days=31),
+            [self.engine.get_latest_signals("ABCD")],
+        )
+
+
+class TestScanForAnomalies(ObservationTestCase):
+    """Test watchlist anomaly screening."""
+
+    def test_sorted_by_composite_score(self):
+        """Test that anomalies come strongest first and skip unknown tickers."""
+        for ticker in ("ABCD", "EFGH", "IJKL"):
+            self.engine.record_signals(self.signals_at(ticker, 1, ma_likely=True))
+        self.engine.add_to_watchlist("NONE")
+
+        anomalies = self.engine.scan_for_anomalies()
+
+        scores = [signals.calculate_composite_score() for _, signals, _ in anomalies]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertTrue(all(reason for _, _, reason in anomalies))
+        self.assertNotIn("NONE", [ticker for ticker, _, _ in anomalies])
+
+
+class TestMockSignals(unittest.TestCase):
+    """Test mock signal generation."""
+
+    def draw(self, engine):
+        """Mock signal values for a small watchlist, without timestamps."""
+        signals = engine.generate_mock_signals_batch(["ABCD", "EFGH"], [True, False])
+        return [
+            {**dataclasses.asdict(record), "timestamp": None} for record in signals
+        ]
+
+    def test_seed_reproduces_signals(self):
+        """Test that engines with the same seed generate the same signals."""
+        self.assertEqual(
+            self.draw(MarketObservationEngine(seed=7)),
+            self.draw(MarketObservationEngine(seed=7)),
+        )
+        self.assertNotEqual(
+            self.draw(MarketObservationEngine(seed=7)),
+            self.draw(MarketObservationEngine(seed=8)),
+        )
+
+    def test_generator_is_used(self):
+        """Test that a passed Generator is drawn from directly."""
+        rng = np.random.default_rng(7)
+        engine = MarketObservationEngine(seed=rng)
+
+        self.assertEqual(self.draw(engine), self.draw(MarketObservationEngine(seed=7)))
+        self.assertNotEqual(self.draw(engine), self.draw(MarketObservationEngine(seed=7)))
+
+
+def run_tests():
+    """Run all tests."""
+    unittest.main(argv=[''], exit=False, verbosity=2)
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,560 @@
+"""
+Unit Tests for the SEC EDGAR Ingester
+
+Tests filing parsing and request handling of the SEC EDGAR ingester:
+- Company search (Atom) feeds and the company cache
+- Form 4 insider transactions
+- 13F institutional holdings
+- 10-K financial metrics
+- Request retries and the client lifecycle
+
+Parsers are checked against the regex implementations they replaced.
+Requests are answered by an in-process httpx.MockTransport.
+"""
+
+import asyncio
+import random
+import re
+import unittest
+import xml.etree.ElementTree as StdET
+import sys
+import os
+
+import httpx
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ingestion.base import IngestionError, RetryConfig
+from src.ingestion.sec_edgar import (
+    SECEdgarIngester,
+    _10K_METRIC_PATTERNS,
+    _iter_elements,
+    _scan_10k_metrics,
+)
+
+
+class SECEdgarTestCase(unittest.TestCase):
+    """Base class for tests that send requests through a mocked transport."""
+
+    def make_ingester(self, handler):
+        """
+        Build an ingester whose requests are answered by ``handler``.
+
+        Retries back off for 0s and the rate limit is lifted so tests run fast.
+        """
+        class MockedIngester(SECEdgarIngester):
+            def _create_client(self):
+                return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        ingester = MockedIngester()
+        ingester.retry_config = RetryConfig(max_retries=3, initial_delay=0.0, jitter=False)
+        ingester._request_limiter.configure(
+            ingester.source_name, requests_per_second=1e6, burst_size=1000
+        )
+        return ingester
+
+    def serve(self, body):
+        """Ingester that answers every request with ``body``."""
+        return self.make_ingester(lambda request: httpx.Response(200, text=body))
+
+
+class TestParseForm4(SECEdgarTestCase):
+    """Test Form 4 parsing."""
+
+    URL = "https://www.sec.gov/Archives/edgar/data/1001/000000000124000001.txt"
+
+    TRANSACTION = """<nonDerivativeTransaction>
+<securityTitle>{title}</securityTitle>
+<transactionDate>{date}</transactionDate>
+<transactionCoding>
+<transactionFormType>4</transactionFormType>
+<transactionCode>{code}</transactionCode>
+</transactionCoding>
+<transactionAmounts>
+<transactionShares>{shares}</transactionShares>
+{price}<transactionAcquiredDisposedCode>{ad}</transactionAcquiredDisposedCode>
+</transactionAmounts>
+</nonDerivativeTransaction>
+"""
+
+    TRANSACTIONS = [
+        dict(title="Common Stock", date="2024-03-01", code="P", shares="1000", price="12.5", ad="A"),
+        dict(title="Common Stock", date="2024-03-04", code="S", shares="250.75", price=None, ad="D"),
+    ]
+
+    def submission(self, wrap_values):
+        """EDGAR full-submission text for a two-transaction Form 4."""
+        def field(value):
+            return f"<value>{value}</value>" if wrap_values else value
+
+        transactions = "".join(
+            self.TRANSACTION.format(
+                title=field(tx["title"]),
+                date=field(tx["date"]),
+                code=tx["code"],
+                shares=field(tx["shares"]),
+                price=(
+                    f"<transactionPricePerShare>{field(tx['price'])}</transactionPricePerShare>\n"
+                    if tx["price"] else ""
+                ),
+                ad=field(tx["ad"]),
+            )
+            for tx in self.TRANSACTIONS
+        )
+        return (
+            "<SEC-DOCUMENT>0001-24-000001.txt : 20240305\n"
+            "<TYPE>4\n<TEXT>\n<XML>\n"
+            '<?xml version="1.0"?>\n'
+            "<ownershipDocument>\n"
+            "<reportingOwner>\n<reportingOwnerId>\n"
+            "<rptOwnerName>Doe Jane</rptOwnerName>\n"
+            "</reportingOwnerId>\n</reportingOwner>\n"
+            "<reportingOwner>\n<reportingOwnerId>\n"
+            "<rptOwnerName>Second Owner</rptOwnerName>\n"
+            "</reportingOwnerId>\n</reportingOwner>\n"
+            f"<nonDerivativeTable>\n{transactions}</nonDerivativeTable>\n"
+            "</ownershipDocument>\n"
+            "</XML>\n</TEXT>\n</SEC-DOCUMENT>\n"
+        )
+
+    def regex_parse(self, content):
+        """Parse a Form 4 the way the ingester originally did."""
+        transactions = {"filing_url": self.URL, "transactions": []}
+
+        reporter_match = re.search(r"<reportingOwner>(.*?)</reportingOwner>", content, re.DOTALL)
+        if reporter_match:
+            name_match = re.search(r"<rptOwnerName>(.*?)</rptOwnerName>", reporter_match.group(1))
+            transactions["reporter_name"] = name_match.group(1) if name_match else None
+
+        for tx_match in re.finditer(
+            r"<nonDerivativeTransaction>(.*?)</nonDerivativeTransaction>", content, re.DOTALL
+        ):
+            tx_section = tx_match.group(1)
+
+            def find(tag):
+                return re.search(rf"<{tag}>(.*?)</{tag}>", tx_section)
+
+            shares = find("transactionShares")
+            price = find("transactionPricePerShare")
+            transactions["transactions"].append({
+                "security_title": find("securityTitle").group(1) if find("securityTitle") else None,
+                "transaction_date": find("transactionDate").group(1) if find("transactionDate") else None,
+                "transaction_code": find("transactionCode").group(1) if find("transactionCode") else None,
+                "shares": float(shares.group(1)) if shares else None,
+                "price_per_share": float(price.group(1)) if price else None,
+                "acquired_disposed": (
+                    find("transactionAcquiredDisposedCode").group(1)
+                    if find("transactionAcquiredDisposedCode") else None
+                ),
+            })
+
+        return transactions
+
+    def parse(self, submission):
+        return asyncio.run(self.serve(submission).parse_form4(self.URL))
+
+    def test_matches_regex_parser(self):
+        """Test parity with the regex parser on flat fields."""
+        submission = self.submission(wrap_values=False)
+        self.assertEqual(self.parse(submission), self.regex_parse(submission))
+
+    def test_value_wrapped_fields(self):
+        """Test that <value>-wrapped fields parse like flat ones."""
+        self.assertEqual(
+            self.parse(self.submission(wrap_values=True)),
+            self.parse(self.submission(wrap_values=False)),
+        )
+
+    def test_first_reporting_owner(self):
+        """Test that the first reporting owner is recorded."""
+        result = self.parse(self.submission(wrap_values=False))
+        self.assertEqual(result["reporter_name"], "Doe Jane")
+
+
+class TestIterElements(unittest.TestCase):
+    """Test streaming element iteration."""
+
+    def test_yields_matches_and_clears_processed_records(self):
+        """Test that every match is yielded once and earlier ones are freed."""
+        content = (
+            "<root>"
+            + "".join(f"<row><id>{i}</id></row><skip/>" for i in range(100))
+            + "</root>"
+        ).encode()
+
+        ids = []
+        for elem in _iter_elements(content, "row"):
+            ids.append(elem.findtext("id"))
+            # Records before the previous one have been detached
+            self.assertLessEqual(len(list(elem.itersiblings(preceding=True))), 2)
+
+        self.assertEqual(ids, [str(i) for i in range(100)])
+
+
+class TestFetchBiotechCompanies(SECEdgarTestCase):
+    """Test company search feed parsing."""
+
+    FEED = """<?xml version="1.0" encoding="ISO-8859-1" ?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>EDGAR Company Search</title>
+  <entry>
+    <content type="text/xml">
+      <cik>0000001001</cik>
+    </content>
+    <title>ALPHA BIO INC</title>
+  </entry>
+  <entry>
+    <content type="text/xml">
+      <cik>0000001002</cik>
+    </content>
+    <title>BETA THERAPEUTICS</title>
+  </entry>
+  <entry>
+    <title>NO CIK LISTED</title>
+  </entry>
+</feed>
+""".encode("latin-1")
+
+    def dom_parse(self, sic_code):
+        """Parse the feed the way the ingester originally did."""
+        root = StdET.fromstring(self.FEED)
+        ns = {"atom": "http://www.w3.org/2005/Atom"}
+        companies = []
+        for entry in root.findall("atom:entry", ns):
+            cik = entry.find("atom:content/atom:cik", ns)
+            title = entry.find("atom:title", ns)
+            companies.append({
+                "cik": cik.text if cik is not None else None,
+                "name": title.text if title is not None else None,
+                "sic": sic_code,
+            })
+        return companies
+
+    def test_matches_dom_parser(self):
+        """Test that iterparse gives the same companies as the DOM parser."""
+        ingester = self.make_ingester(lambda request: httpx.Response(200, content=self.FEED))
+
+        companies = asyncio.run(ingester.fetch_biotech_companies())
+
+        expected = [
+            company
+            for sic_code in ingester.BIOTECH_SIC_CODES
+            for company in self.dom_parse(sic_code)
+        ]
+        self.assertEqual(companies, expected)
+
+
+class TestParse13F(SECEdgarTestCase):
+    """Test 13F parsing."""
+
+    URL = "https://www.sec.gov/Archives/edgar/data/2002/infotable.xml"
+    NAMESPACE = "http://www.sec.gov/edgar/document/thirteenf/informationtable"
+
+    INFO_TABLE = """<infoTable>
+<nameOfIssuer>{name}</nameOfIssuer>
+<titleOfClass>COM</titleOfClass>
+<cusip>000000000</cusip>
+<value>{value}</value>
+<shrsOrPrnAmt>
+<sshPrnamt>{shares}</sshPrnamt>
+<sshPrnamtType>SH</sshPrnamtType>
+</shrsOrPrnAmt>
+</infoTable>
+"""
+
+    def document(self, namespace):
+        """13F information table with three positions."""
+        tables = "".join(
+            self.INFO_TABLE.format(name=name, value=value, shares=shares)
+            for name, value, shares in (
+                (" ALPHA BIO INC ", "1250", "5000"),
+                ("BETA THERAPEUTICS", "80", "1200"),
+                ("GAMMA PHARMA", "3", "10"),
+            )
+        )
+        xmlns = f' xmlns="{namespace}"' if namespace else ""
+        return f'<?xml version="1.0"?>\n<informationTable{xmlns}>\n{tables}</informationTable>\n'
+
+    def regex_parse(self, content):
+        """Parse a 13F the way the ingester originally did."""
+        holdings = {"filing_url": self.URL, "positions": []}
+        for pos_match in re.finditer(r"<infoTable>(.*?)</infoTable>", content, re.DOTALL):
+            section = pos_match.group(1)
+            name_match = re.search(r"<nameOfIssuer>(.*?)</nameOfIssuer>", section)
+            shares_match = re.search(r"<shrsOrPrnAmt>(.*?)</shrsOrPrnAmt>", section, re.DOTALL)
+            value_match = re.search(r"<value>(.*?)</value>", section)
+
+            shares = None
+            if shares_match:
+                shares_number = re.search(r"<sshPrnamt>(.*?)</sshPrnamt>", shares_match.group(1))
+                if shares_number:
+                    shares = float(shares_number.group(1))
+
+            holdings["positions"].append({
+                "issuer_name": name_match.group(1).strip() if name_match else None,
+                "shares": shares,
+                "value": float(value_match.group(1)) if value_match else None,
+            })
+        return holdings
+
+    def test_matches_regex_parser(self):
+        """Test parity with the regex parser, with and without a namespace."""
+        for namespace in (None, self.NAMESPACE):
+            with self.subTest(namespace=namespace):
+                document = self.document(namespace)
+
+                holdings = asyncio.run(self.serve(document).parse_13f(self.URL))
+
+                self.assertEqual(holdings, self.regex_parse(document))
+
+
+class TestCompanyCache(SECEdgarTestCase):
+    """Test caching of the biotech company universe."""
+
+    def setUp(self):
+        """Count requests to a feed server whose failing SIC codes can be set."""
+        self.requests = []
+        self.failing_sic = None
+
+        def handler(request):
+            self.requests.append(request)
+            if request.url.params["SIC"] == self.failing_sic:
+                return httpx.Response(404)
+            return httpx.Response(200, content=TestFetchBiotechCompanies.FEED)
+
+        self.ingester = self.make_ingester(handler)
+
+    def fetch_twice(self):
+        async def fetch():
+            first = await self.ingester.fetch_biotech_companies()
+            second = await self.ingester.fetch_biotech_companies()
+            return first, second
+
+        return asyncio.run(fetch())
+
+    def test_complete_fetch_is_cached(self):
+        """Test that a complete fetch is served from cache afterwards."""
+        first, second = self.fetch_twice()
+
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.requests), len(SECEdgarIngester.BIOTECH_SIC_CODES))
+
+    def test_partial_fetch_is_not_cached(self):
+        """Test that a failed SIC code leaves the cache empty."""
+        self.failing_sic = SECEdgarIngester.BIOTECH_SIC_CODES[0]
+
+        _, second = self.fetch_twice()
+
+        self.assertTrue(second)
+        self.assertEqual(len(self.requests), 2 * len(SECEdgarIngester.BIOTECH_SIC_CODES))
+
+
+class TestExtract10KMetrics(SECEdgarTestCase):
+    """Test chunked 10-K metric scanning."""
+
+    # Original extraction: one re.search per metric over the whole text
+    REGEX_PATTERNS = {
+        "cash": r"Cash[,\s]+[Cc]ash [Ee]quivalents.*?[\$\s]+([\d,]+)",
+        "total_assets": r"Total [Aa]ssets.*?[\$\s]+([\d,]+)",
+        "revenue": r"(?:Revenue|Net [Ss]ales).*?[\$\s]+([\d,]+)",
+        "rd_expenses": r"Research and [Dd]evelopment.*?[\$\s]+([\d,]+)",
+    }
+
+    FILING_TEXTS = [
+        # Label more than 8K characters before its number on the same line
+        "Total Assets" + " ." * 6000 + " $ 1,234,567\nRevenue 89\n",
+        # Earliest match overall is not the first match of every metric
+        "Revenue and Total Assets $ 12\nTotal Assets 34\nResearch and development 56\n",
+        # Number on a later line, after blank lines
+        "Cash, cash equivalents\n\n   $\n  9,876\nNet sales were\n  $ 5\n",
+        # Cash label split across lines
+        "Cash,\n Cash Equivalents at end of year 42\n",
+        # Non-breaking spaces only count as whitespace in decoded text
+        "Net Sales\xa0$\xa0321\nResearch and Development 7\n",
+        # Case-sensitive labels
+        "TOTAL ASSETS 1\ntotal assets 2\nTotal assets 3\n",
+        # Nothing to find
+        "No financial statements here.\n",
+        "",
+    ]
+
+    def regex_metrics(self, text):
+        """Extract 10-K metrics the way the ingester originally did."""
+        metrics = {}
+        for key, pattern in self.REGEX_PATTERNS.items():
+            match = re.search(pattern, text)
+            if match:
+                metrics[key] = float(match.group(1).replace(",", ""))
+        return metrics
+
+    def streamed_metrics(self, text, chunk_size):
+        """Drive _scan_10k_metrics the way extract_10k_metrics does."""
+        found = {}
+        window = ""
+        for start in range(0, len(text), chunk_size):
+            window += text[start:start + chunk_size]
+            carry = _scan_10k_metrics(window, found, final=False)
+            if len(found) == len(_10K_METRIC_PATTERNS):
+                break
+            window = window[carry:]
+        else:
+            _scan_10k_metrics(window, found, final=True)
+        return {key: found[key] for key, _ in _10K_METRIC_PATTERNS if key in found}
+
+    def test_matches_regex_search(self):
+        """Test that any chunking gives the per-metric re.search results."""
+        for text in self.FILING_TEXTS:
+            for chunk_size in (1, 7, 64, 4096, 65536):
+                with self.subTest(text=text[:40], chunk_size=chunk_size):
+                    self.assertEqual(
+                        self.streamed_metrics(text, chunk_size), self.regex_metrics(text)
+                    )
+
+    def test_matches_regex_search_on_generated_filings(self):
+        """Test parity on randomly assembled filing fragments."""
+        rng = random.Random(0)
+        tokens = [
+            "Cash", ", ", "Cash Equivalents", "cash equivalents", "Total Assets",
+            "Revenue", "Net Sales", "Research and Development", "\n", "\n\n",
+            " ", "$", " $ ", "1,234", "56", ",", "x", "note ", "\t", "C", "7",
+        ]
+        for _ in range(2000):
+            text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 40)))
+            chunk_size = rng.randint(1, 16)
+            try:
+                expected = self.regex_metrics(text)
+            except ValueError:
+                # A comma-only "number"; both versions fail the extraction
+                with self.assertRaises(ValueError):
+                    self.streamed_metrics(text, chunk_size)
+                continue
+            self.assertEqual(self.streamed_metrics(text, chunk_size), expected, text)
+
+    def test_streamed_response(self):
+        """Test that metrics are read across many response chunks."""
+        text = (
+            "Revenue" + " ." * 40000 + " $ 1,500\n"
+            "Total Assets\n  $ 9,000\n"
+            "Research and Development 250\n"
+            "Cash, cash equivalents 75\n"
+        )
+        ingester = self.serve(text)
+        ingester.STREAM_CHUNK_SIZE = 4096
+
+        result = asyncio.run(ingester.extract_10k_metrics("https://www.sec.gov/10k.htm"))
+
+        self.assertEqual(result["metrics"], self.regex_metrics(text))
+        self.assertEqual(
+            list(result["metrics"]), ["cash", "total_assets", "revenue", "rd_expenses"]
+        )
+
+
+class TestRetries(SECEdgarTestCase):
+    """Test retry handling in _rate_limited_request."""
+
+    def setUp(self):
+        """Record each request and the backoff delays taken between attempts."""
+        self.requests = []
+        self.delays = []
+
+    def make_ingester(self, handler):
+        def recording_handler(request):
+            self.requests.append(request)
+            return handler(request)
+
+        ingester = super().make_ingester(recording_handler)
+        get_delay = ingester.retry_config.get_delay
+        ingester.retry_config.get_delay = (
+            lambda attempt: self.delays.append(attempt) or get_delay(attempt)
+        )
+        return ingester
+
+    def run_request(self, ingester):
+        return asyncio.run(
+            ingester._rate_limited_request("GET", "https://www.sec.gov/file")
+        )
+
+    def test_retryable_status_then_success(self):
+        """Test that 503 responses are retried until one succeeds."""
+        statuses = iter([503, 503, 200])
+        ingester = self.make_ingester(lambda request: httpx.Response(next(statuses)))
+
+        response = self.run_request(ingester)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.delays, [0, 1])
+
+    def test_no_backoff_after_last_attempt(self):
+        """Test that exhausting retries does not sleep after the final attempt."""
+        ingester = self.make_ingester(lambda request: httpx.Response(503))
+
+        with self.assertRaisesRegex(IngestionError, "Max retries exceeded"):
+            self.run_request(ingester)
+
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(self.delays, [0, 1])
+
+    def test_permanent_status_is_not_retried(self):
+        """Test that a 404 raises at once."""
+        ingester = self.make_ingester(lambda request: httpx.Response(404))
+
+        with self.assertRaisesRegex(IngestionError, "HTTP error"):
+            self.run_request(ingester)
+
+        self.assertEqual(len(self.requests), 1)
+
+    def test_transient_errors_are_retried(self):
+        """Test that timeouts, network and protocol errors are retried."""
+        for error in (
+            httpx.ConnectError,
+            httpx.ReadTimeout,
+            httpx.ReadError,
+            httpx.RemoteProtocolError,
+        ):
+            with self.subTest(error=error.__name__):
+                self.setUp()
+
+                def handler(request):
+                    if len(self.requests) < 3:
+                        raise error("transient", request=request)
+                    return httpx.Response(200)
+
+                response = self.run_request(self.make_ingester(handler))
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(self.requests), 3)
+                self.assertEqual(self.delays, [0, 1])
+
+    def test_other_request_errors_are_not_retried(self):
+        """Test that non-transient request errors raise at once."""
+        def handler(request):
+            raise httpx.UnsupportedProtocol("bad scheme", request=request)
+
+        with self.assertRaisesRegex(IngestionError, "Request failed"):
+            self.run_request(self.make_ingester(handler))
+
+        self.assertEqual(len(self.requests), 1)
+
+
+class TestClientLifecycle(SECEdgarTestCase):
+    """Test the HTTP client lifecycle."""
+
+    def test_client_recreated_after_close(self):
+        """Test that the ingester keeps working after close()."""
+        ingester = self.make_ingester(lambda request: httpx.Response(200))
+
+        async def close_and_request():
+            await ingester.close()
+            return await ingester._rate_limited_request("GET", "https://www.sec.gov/file")
+
+        self.assertEqual(asyncio.run(close_and_request()).status_code, 200)
+
+
+def run_tests():
+    """Run all tests."""
+    unittest.main(argv=[''], exit=False, verbosity=2)
+
+
+if __name__ == '__main__':
+    run_tests()
@@ -0,0 +1,104 @@
+"""
+Unit Tests for Market Sentiment Analysis
+
+Tests the sentiment model, including:
+- SentimentScore validation and trusted construction
+- Reproducible mock data
+"""
+
+import dataclasses
+import unittest
+import sys
+import os
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.market.sentiment import NewsArticle, SentimentModel, SentimentScore
+
+
+class TestSentimentScore(unittest.TestCase):
+    """Test SentimentScore construction."""
+
+    def setUp(self):
+        """Set up in-range field values."""
+        self.fields = dict(
+            ticker="ABCD",
+            timestamp=datetime(2025, 6, 2),
+            news_sentiment=0.4,
+            conference_sentiment=-0.2,
+            social_sentiment=0.1,
+            analyst_sentiment=0.3,
+            news_confidence=0.9,
+            conference_confidence=0.5,
+            social_confidence=1.0,
+            analyst_confidence=0.5,
+            news_volume=18,
+            social_mentions=2400,
+            conference_presentations=2,
+        )
+
+    def test_constructor_validates(self):
+        """Test that out-of-range scores and confidences raise ValueError."""
+        for name, value in (("social_sentiment", 1.5), ("analyst_confidence", -0.1)):
+            with self.subTest(field=name):
+                with self.assertRaises(ValueError):
+                    SentimentScore(**{**self.fields, name: value})
+
+    def test_unchecked_matches_constructor(self):
+        """Test that trusted construction builds an equal, working score."""
+        checked = SentimentScore(**self.fields)
+        unchecked = SentimentScore._unchecked(**self.fields)
+
+        self.assertEqual(unchecked, checked)
+        self.assertEqual(unchecked.aggregate_sentiment, checked.aggregate_sentiment)
+        self.assertEqual(unchecked.overall_confidence, checked.overall_confidence)
+        self.assertEqual(unchecked.get_sentiment_summary(), checked.get_sentiment_summary())
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            unchecked.news_sentiment = 0.0
+
+    def test_aggregate_rejects_out_of_range_news(self):
+        """Test that aggregate_sentiment still checks scores from source data."""
+        model = SentimentModel()
+        model.news_cache["ABCD"] = [
+            NewsArticle(
+                title="ABCD beats estimates",
+                source="Reuters",
+                published_date=datetime.now(),
+                sentiment_score=1.5,
+                relevance_score=1.0,
+                keywords=[],
+            )
+        ]
+
+        with self.assertRaisesRegex(ValueError, "between -1 and 1"):
+            model.aggregate_sentiment("ABCD")
+
+
+class TestMockData(unittest.TestCase):
+    """Test mock news, conference and social data generation."""
+
+    NOW = datetime(2025, 6, 2, 16, 0)
+
+    def draw(self, model):
+        """Mock data from every generator, at a fixed reference time."""
+        return (
+            model._generate_mock_news("ABCD", 30, self.NOW),
+            model._generate_mock_conferences("ABCD", self.NOW),
+            model._generate_mock_social("ABCD", 7, self.NOW),
+        )
+
+    def test_seed_reproduces_mock_data(self):
+        """Test that models with the same seed generate the same data."""
+        self.assertEqual(self.draw(SentimentModel(seed=7)), self.draw(SentimentModel(seed=7)))
+        self.assertNotEqual(self.draw(SentimentModel(seed=7)), self.draw(SentimentModel(seed=8)))
+
+
+def run_tests():
+    """Run all tests."""
+    unittest.main(argv=[''], exit=False, verbosity=2)
+
+
+if __name__ == '__main__':
+    run_tests()